@@ -0,0 +1,77 @@
+# Сравнение поэлементного AddSub.add_additional с пакетным AddSub.add_many
+# и цепочки add_additional с потоковым AddSub.accumulate.
+# Запуск из каталога LAB_1: python -m benchmarks.bench_add_sub
+import time
+
+import numpy as np
+
+from binary_calculator.add_sub import AddSub
+
+PAIRS = 1_000_000
+LOOP_SAMPLE = 20_000
+WIDTHS = [8, 16, 32, 64]
+TERMS = 10_000_000
+
+
+def loop_cost(numbers_1, numbers_2, bits):
+    start = time.perf_counter()
+    for number_1, number_2 in zip(numbers_1.tolist(), numbers_2.tolist()):
+        try:
+            AddSub(number_1, number_2, bits).add_additional()
+        except OverflowError:
+            pass
+    return (time.perf_counter() - start) / len(numbers_1)
+
+
+def batch_cost(numbers_1, numbers_2, bits):
+    start = time.perf_counter()
+    AddSub.add_many(numbers_1, numbers_2, bits)
+    return (time.perf_counter() - start) / len(numbers_1)
+
+
+def chain_cost(numbers, bits):
+    start = time.perf_counter()
+    limit = 1 << (bits - 1)
+    running = 0
+    for number in numbers.tolist():
+        try:
+            running = AddSub(running, number, bits).add_additional()[0]
+        except OverflowError:
+            running = ((running + number + limit) & (2 * limit - 1)) - limit
+    return (time.perf_counter() - start) / len(numbers)
+
+
+def accumulate_cost(numbers, bits):
+    start = time.perf_counter()
+    AddSub.accumulate(numbers, bits)
+    return (time.perf_counter() - start) / len(numbers)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    header = f"{'bits':>6} | {'цикл, нс/пара':>14} | {'пакет, нс/пара':>15} | {'ускорение':>10}"
+    print(f"{PAIRS} пар (цикл оценивается по выборке из {LOOP_SAMPLE})")
+    print(header)
+    print("-" * len(header))
+    for bits in WIDTHS:
+        limit = 1 << (bits - 1)
+        numbers_1 = rng.integers(-limit, limit - 1, size=PAIRS, dtype=np.int64, endpoint=True)
+        numbers_2 = rng.integers(-limit, limit - 1, size=PAIRS, dtype=np.int64, endpoint=True)
+        per_call = loop_cost(numbers_1[:LOOP_SAMPLE], numbers_2[:LOOP_SAMPLE], bits)
+        per_pair = batch_cost(numbers_1, numbers_2, bits)
+        print(f"{bits:>6} | {per_call * 1e9:>14.1f} | {per_pair * 1e9:>15.2f} | {per_call / per_pair:>9.0f}x")
+
+    header = f"{'bits':>6} | {'цепочка, нс/слаг.':>18} | {'accumulate, нс/слаг.':>21} | {'ускорение':>10}"
+    print(f"\nСумма {TERMS} слагаемых (цепочка оценивается по выборке из {LOOP_SAMPLE})")
+    print(header)
+    print("-" * len(header))
+    for bits in WIDTHS:
+        limit = 1 << (bits - 1)
+        numbers = rng.integers(-limit, limit - 1, size=TERMS, dtype=np.int64, endpoint=True)
+        per_step = chain_cost(numbers[:LOOP_SAMPLE], bits)
+        per_term = accumulate_cost(numbers, bits)
+        print(f"{bits:>6} | {per_step * 1e9:>18.1f} | {per_term * 1e9:>21.2f} | {per_step / per_term:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
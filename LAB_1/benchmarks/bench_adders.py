@@ -0,0 +1,42 @@
+# Сравнение моделей сумматоров AdderEngine на случайных 64-разрядных словах:
+# время моделирования, задержка и число вентилей по модели.
+# Запуск из каталога LAB_1: python -m benchmarks.bench_adders
+import time
+
+import numpy as np
+
+from binary_calculator.adder_engine import AdderEngine
+
+PAIRS = 1_000_000
+BITS = 64
+OPERANDS = 16
+
+
+def main():
+    rng = np.random.default_rng(0)
+    numbers_1 = rng.integers(0, np.iinfo(np.uint64).max, size=PAIRS, dtype=np.uint64, endpoint=True)
+    numbers_2 = rng.integers(0, np.iinfo(np.uint64).max, size=PAIRS, dtype=np.uint64, endpoint=True)
+
+    header = (f"{'сумматор':>16} | {'нс/пара':>8} | {'задержка':>9} | {'вентили':>8} | "
+              f"{'операции':>9} | {'цепочка':>8}")
+    print(f"{PAIRS} пар {BITS}-разрядных слов")
+    print(header)
+    print("-" * len(header))
+    for adder in AdderEngine.ADDERS:
+        start = time.perf_counter()
+        _, _, stats = AdderEngine.add(numbers_1, numbers_2, BITS, adder)
+        per_pair = (time.perf_counter() - start) / PAIRS
+        print(f"{adder:>16} | {per_pair * 1e9:>8.2f} | {stats['gate_delay']:>9} | {stats['gates']:>8} | "
+              f"{stats['word_operations']:>9} | {stats.get('carry_chain', '-'):>8}")
+
+    operands = [rng.integers(0, np.iinfo(np.uint64).max, size=PAIRS, dtype=np.uint64, endpoint=True)
+                for _ in range(OPERANDS)]
+    start = time.perf_counter()
+    _, stats = AdderEngine.carry_save(operands, BITS)
+    per_sum = (time.perf_counter() - start) / PAIRS
+    print(f"\nсумма {OPERANDS} слов через сжатия 3:2: {per_sum * 1e9:.2f} нс, "
+          f"уровней {stats['csa_levels']}, задержка {stats['gate_delay']}, вентили {stats['gates']}")
+
+
+if __name__ == "__main__":
+    main()
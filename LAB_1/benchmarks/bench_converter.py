@@ -0,0 +1,57 @@
+# Стоимость перевода одного числа в прямой/обратный/дополнительный код,
+# в том числе через кеш Converter.cached_code (таблицы до 16 бит и LRU).
+# Запуск из каталога LAB_1: python -m benchmarks.bench_converter
+import random
+import timeit
+
+from binary_calculator.converter import Converter
+
+WIDTHS = [8, 16, 24, 32, 48, 64]
+SAMPLE_SIZE = 10_000
+REPEATS = 5
+CODES = ["direct_code", "reverse_code", "additional_code"]
+# Повторяющийся трафик: небольшой набор значений, запрашиваемый многократно
+HOT_VALUES = 256
+
+
+def make_values(bits, count=SAMPLE_SIZE):
+    limit = (1 << (bits - 1)) - 1
+    return [random.randint(-limit, limit) for _ in range(count)]
+
+
+def measure(code, values, bits):
+    def run():
+        for value in values:
+            getattr(Converter(value, bits), code)()
+
+    best = min(timeit.repeat(run, number=1, repeat=REPEATS))
+    return best / len(values) * 1e9
+
+
+def measure_cached(values, bits):
+    def run():
+        for value in values:
+            Converter.cached_code(value, bits, "additional")
+
+    run()
+    best = min(timeit.repeat(run, number=1, repeat=REPEATS))
+    return best / len(values) * 1e9
+
+
+def main():
+    random.seed(0)
+    header = f"{'bits':>6} | " + " | ".join(f"{code:>16}" for code in CODES) + f" | {'cached':>10}"
+    print("нс на одно значение")
+    print(header)
+    print("-" * len(header))
+    for bits in WIDTHS:
+        values = make_values(bits)
+        row = [measure(code, values, bits) for code in CODES]
+        hot_values = [values[i % HOT_VALUES] for i in range(len(values))]
+        cached = measure_cached(hot_values, bits)
+        print(f"{bits:>6} | " + " | ".join(f"{cost:>16.1f}" for cost in row) + f" | {cached:>10.1f}")
+    print(f"Кеш: {Converter.CACHE.stats()}")
+
+
+if __name__ == "__main__":
+    main()
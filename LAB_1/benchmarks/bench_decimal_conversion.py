@@ -0,0 +1,43 @@
+# Перевод столбца десятичных строк в binary32/binary64 и обратно:
+# поэлементный parse_word/format_word против пакетных parse_many/format_many.
+# Запуск из каталога LAB_1: python -m benchmarks.bench_decimal_conversion
+import time
+
+import numpy as np
+
+from binary_calculator.decimal_conversion import DecimalConversion
+
+VALUES = 500_000
+LOOP_SAMPLE = 20_000
+
+
+def per_item(function, items):
+    start = time.perf_counter()
+    result = function(items)
+    return (time.perf_counter() - start) / len(items), result
+
+
+def main():
+    rng = np.random.default_rng(0)
+    mantissas = rng.integers(1, 10 ** 9, size=VALUES)
+    exponents = rng.integers(-40, 30, size=VALUES)
+    texts = [f"{mantissa}e{exponent}" for mantissa, exponent in zip(mantissas.tolist(), exponents.tolist())]
+
+    header = (f"{'формат':>8} | {'parse_word, нс':>15} | {'parse_many, нс':>15} | "
+              f"{'format_word, нс':>16} | {'format_many, нс':>16}")
+    print(f"{VALUES} строк (поэлементно - выборка из {LOOP_SAMPLE})")
+    print(header)
+    print("-" * len(header))
+    for bits in DecimalConversion.FORMATS:
+        conversion = DecimalConversion(bits)
+        parse_one, _ = per_item(lambda items: [conversion.parse_word(text) for text in items], texts[:LOOP_SAMPLE])
+        parse_bulk, words = per_item(conversion.parse_many, texts)
+        format_one, _ = per_item(lambda items: [conversion.format_word(word) for word in items],
+                                 words[:LOOP_SAMPLE].tolist())
+        format_bulk, _ = per_item(conversion.format_many, words)
+        print(f"{'binary' + str(bits):>8} | {parse_one * 1e9:>15.0f} | {parse_bulk * 1e9:>15.0f} | "
+              f"{format_one * 1e9:>16.0f} | {format_bulk * 1e9:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
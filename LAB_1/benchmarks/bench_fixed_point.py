@@ -0,0 +1,51 @@
+# Пакетная арифметика FixedPointArray (Q7.16 на int64) против float64 в numpy:
+# стоимость операции на элемент и максимальная ошибка относительно float64.
+# Запуск из каталога LAB_1: python -m benchmarks.bench_fixed_point
+import timeit
+
+import numpy as np
+
+from binary_calculator.fixed_point import FixedPointArray
+
+SIZE = 1_000_000
+SCALAR_SAMPLE = 10_000
+REPEATS = 5
+INTEGER_BITS = 7
+FRACTION_BITS = 16
+OPERATIONS = {
+    "add": np.add,
+    "sub": np.subtract,
+    "mul": np.multiply,
+    "div": np.divide,
+}
+
+
+def best_per_item(function, count):
+    return min(timeit.repeat(function, number=1, repeat=REPEATS)) / count * 1e9
+
+
+def main():
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-8, 8, SIZE)
+    y = rng.uniform(0.5, 8, SIZE)
+    a = FixedPointArray.from_float(x, INTEGER_BITS, FRACTION_BITS)
+    b = FixedPointArray.from_float(y, INTEGER_BITS, FRACTION_BITS)
+    scalars_a = [a[i] for i in range(SCALAR_SAMPLE)]
+    scalars_b = [b[i] for i in range(SCALAR_SAMPLE)]
+
+    print(f"Q{INTEGER_BITS}.{FRACTION_BITS}, {SIZE} элементов; скалярный FixedPoint на выборке {SCALAR_SAMPLE}")
+    header = (f"{'операция':>8} | {'float64, нс':>11} | {'массив, нс':>10} | {'скаляр, нс':>10} | "
+              f"{'макс. ошибка':>12}")
+    print(header)
+    print("-" * len(header))
+    for name, float_operation in OPERATIONS.items():
+        float_cost = best_per_item(lambda: float_operation(x, y), SIZE)
+        array_cost = best_per_item(lambda: getattr(a, name)(b), SIZE)
+        scalar_cost = best_per_item(
+            lambda: [getattr(p, name)(q) for p, q in zip(scalars_a, scalars_b)], SCALAR_SAMPLE)
+        error = np.max(np.abs(getattr(a, name)(b).to_float() - float_operation(a.to_float(), b.to_float())))
+        print(f"{name:>8} | {float_cost:>11.2f} | {array_cost:>10.2f} | {scalar_cost:>10.1f} | {error:>12.2e}")
+
+
+if __name__ == "__main__":
+    main()
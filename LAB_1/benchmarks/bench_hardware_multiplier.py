@@ -0,0 +1,37 @@
+# Модели аппаратного умножителя на случайных 32-разрядных операндах:
+# время моделирования пакета, число частичных произведений и этапов сжатия.
+# Запуск из каталога LAB_1: python -m benchmarks.bench_hardware_multiplier
+import time
+
+import numpy as np
+
+from binary_calculator.hardware_multiplier import HardwareMultiplier
+
+PAIRS = 200_000
+BITS = 32
+
+
+def main():
+    rng = np.random.default_rng(0)
+    limit = 1 << (BITS - 1)
+    numbers_1 = rng.integers(-limit, limit, size=PAIRS)
+    numbers_2 = rng.integers(-limit, limit, size=PAIRS)
+
+    header = (f"{'кодировка':>9} | {'дерево':>7} | {'нс/пара':>8} | {'строк':>5} | {'нулевых':>8} | "
+              f"{'этапов':>6} | {'задержка':>8} | {'вентили':>8}")
+    print(f"{PAIRS} пар {BITS}-разрядных чисел")
+    print(header)
+    print("-" * len(header))
+    for encoding in HardwareMultiplier.ENCODINGS:
+        for tree in HardwareMultiplier.TREES:
+            start = time.perf_counter()
+            _, stats = HardwareMultiplier.multiply(numbers_1, numbers_2, BITS, encoding, tree)
+            per_pair = (time.perf_counter() - start) / PAIRS
+            zero_share = stats["zero_partial_products"] / (PAIRS * stats["partial_products"])
+            print(f"{encoding:>9} | {tree:>7} | {per_pair * 1e9:>8.1f} | {stats['partial_products']:>5} | "
+                  f"{zero_share:>7.1%} | {len(stats['stages']):>6} | {stats['gate_delay']:>8} | "
+                  f"{stats['gates']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# Таблица точек перехода между моделями MultiplicationEngine (по ней
+# выбран TOOM3_THRESHOLD); встроенное умножение int в таблицу не входит.
+# Запуск из каталога LAB_1: python -m benchmarks.bench_multiplication
+import random
+import timeit
+
+from binary_calculator.multiplication_engine import MultiplicationEngine
+
+WIDTHS = [256, 512, 768, 1024, 2048, 4096, 8192, 16384, 32768]
+ALGORITHMS = ["schoolbook", "karatsuba", "toom3"]
+BUDGET_SECONDS = 0.5
+
+
+def measure(algorithm, limbs_a, limbs_b):
+    def run():
+        MultiplicationEngine.multiply_limbs(limbs_a, limbs_b, algorithm)
+
+    single = timeit.timeit(run, number=1)
+    number = max(1, int(BUDGET_SECONDS / max(single, 1e-9) / 3))
+    return min(timeit.repeat(run, number=number, repeat=3)) / number
+
+
+def main():
+    random.seed(0)
+    header = f"{'bits':>7} | {'limbs':>6} | " + " | ".join(f"{name + ', мс':>14}" for name in ALGORITHMS)
+    header += f" | {'лучший':>10} | {'auto':>10}"
+    print(header)
+    print("-" * len(header))
+    for bits in WIDTHS:
+        a = random.getrandbits(bits) | (1 << (bits - 1))
+        b = random.getrandbits(bits) | (1 << (bits - 1))
+        limbs_a = MultiplicationEngine.to_limbs(a)
+        limbs_b = MultiplicationEngine.to_limbs(b)
+        timings = {algorithm: measure(algorithm, limbs_a, limbs_b) for algorithm in ALGORITHMS}
+        best = min(timings, key=timings.get)
+        selected = MultiplicationEngine.select_algorithm(len(limbs_a))
+        row = " | ".join(f"{timings[algorithm] * 1e3:>14.3f}" for algorithm in ALGORITHMS)
+        print(f"{bits:>7} | {len(limbs_a):>6} | {row} | {best:>10} | {selected:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Масштабирование ParallelExecutor от 1 до N процессов на пакетном сложении
+# в дополнительном коде и умножении binary32 программной моделью SoftFloat.
+# Запуск из каталога LAB_1: python -m benchmarks.bench_parallel [--max-workers N]
+import argparse
+import os
+import time
+
+import numpy as np
+
+from binary_calculator.parallel import ParallelExecutor
+
+WORKLOADS = [
+    ("add", 8_000_000, 32),
+    ("ieee-mul", 400_000, 32),
+]
+
+
+def operands(operation, size, rng):
+    if operation.startswith("ieee-"):
+        values = rng.uniform(-1e6, 1e6, size=(2, size)).astype(np.float32)
+        return values[0].view(np.uint32), values[1].view(np.uint32)
+    return rng.integers(-2 ** 31, 2 ** 31, size=(2, size))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Масштабирование ParallelExecutor")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=ParallelExecutor.CHUNK_SIZE)
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    header = f"{'операция':>9} | {'процессов':>9} | {'время, с':>9} | {'ускорение':>9}"
+    print(header)
+    print("-" * len(header))
+    for operation, size, bits in WORKLOADS:
+        a, b = operands(operation, size, rng)
+        baseline = None
+        for workers in range(1, arguments.max_workers + 1):
+            with ParallelExecutor(workers, arguments.chunk_size) as executor:
+                # Первый запуск поднимает пул процессов
+                executor.run(operation, a[:arguments.chunk_size * workers], b[:arguments.chunk_size * workers], bits)
+                start = time.perf_counter()
+                executor.run(operation, a, b, bits)
+                elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{operation:>9} | {workers:>9} | {elapsed:>9.2f} | {baseline / elapsed:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
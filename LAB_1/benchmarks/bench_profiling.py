@@ -0,0 +1,53 @@
+# Цена профилировщика на скалярных операциях: при выключенном Profiler в
+# классе стоит исходная функция без обёртки, при включённом - обёртка;
+# затем профиль смешанной нагрузки в JSON.
+# Запуск из каталога LAB_1: python -m benchmarks.bench_profiling
+import time
+
+from binary_calculator.add_sub import AddSub
+from binary_calculator.operations import Operations
+from binary_calculator.profiling import Profiler
+from binary_calculator.standart_ieee754 import StandartIEEE754
+
+CALLS = 20_000
+WORKLOADS = [
+    ("add_additional", AddSub(57, -23, 8)),
+    ("binary_divide", Operations(57, -23)),
+    ("ieee754_addition", StandartIEEE754(0.1, 0.2)),
+]
+
+
+# Метод берётся из класса в момент замера: enable подменяет его обёрткой
+def per_call(name, instance):
+    method = getattr(type(instance), name)
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        method(instance)
+    return (time.perf_counter() - start) / CALLS
+
+
+def main():
+    header = (f"{'операция':>16} | {'обёртка в классе':>16} | {'выключен, мкс':>13} | "
+              f"{'включён, мкс':>12} | {'накладные вкл., %':>17}")
+    print(header)
+    print("-" * len(header))
+    for name, instance in WORKLOADS:
+        wrapped = hasattr(getattr(type(instance), name), "__wrapped__")
+        disabled = per_call(name, instance)
+        with Profiler.session():
+            enabled = per_call(name, instance)
+        overhead = (enabled - disabled) / disabled * 100
+        print(f"{name:>16} | {'да' if wrapped else 'нет':>16} | {disabled * 1e6:>13.2f} | "
+              f"{enabled * 1e6:>12.2f} | {overhead:>17.1f}")
+
+    print()
+    with Profiler.session():
+        for number in range(1, 200):
+            AddSub(number % 60, -(number % 50), 8).add_additional()
+            Operations(number, 7).binary_divide(10, "non_restoring")
+            StandartIEEE754(number / 7, 1 / number).ieee754_addition()
+    print(Profiler.to_json())
+
+
+if __name__ == '__main__':
+    main()
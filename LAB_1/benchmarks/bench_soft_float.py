@@ -0,0 +1,65 @@
+# Проверка SoftFloat.add на случайных словах против аппаратного сложения
+# numpy (округление к ближайшему чётному) и пропускная способность по режимам,
+# затем стоимость mul/div/sqrt/fma и их счётчики нормализации и округления.
+# Запуск из каталога LAB_1: python -m benchmarks.bench_soft_float
+import time
+
+import numpy as np
+
+from binary_calculator.soft_float import SoftFloat
+
+PAIRS = 2_000_000
+SCALAR_PAIRS = 50_000
+FORMATS = [(32, np.float32, np.uint32), (64, np.float64, np.uint64)]
+
+
+def random_words(rng, uint_type, count):
+    return rng.integers(0, np.iinfo(uint_type).max, count, dtype=uint_type, endpoint=True)
+
+
+def mismatches(result, expected, float_type):
+    nan = np.isnan(expected.view(float_type))
+    wrong_nan = nan != np.isnan(result.view(float_type))
+    return int(np.count_nonzero(wrong_nan | (~nan & (result != expected))))
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{PAIRS} случайных пар слов на формат")
+    header = f"{'bits':>5} | {'режим':>13} | {'нс/пара':>8} | {'расхождений с numpy':>20}"
+    print(header)
+    print("-" * len(header))
+    for bits, float_type, uint_type in FORMATS:
+        a = random_words(rng, uint_type, PAIRS)
+        b = random_words(rng, uint_type, PAIRS)
+        with np.errstate(all="ignore"):
+            expected = (a.view(float_type) + b.view(float_type)).view(uint_type)
+        for rounding in SoftFloat.ROUNDING_MODES:
+            start = time.perf_counter()
+            result, _ = SoftFloat(bits, rounding).add(a, b)
+            per_pair = (time.perf_counter() - start) / PAIRS
+            checked = mismatches(result, expected, float_type) if rounding == SoftFloat.ROUND_NEAREST_EVEN else "-"
+            print(f"{bits:>5} | {rounding:>13} | {per_pair * 1e9:>8.1f} | {checked:>20}")
+
+    print()
+    header = f"{'bits':>5} | {'операция':>8} | {'мкс/элемент':>11} | {'сдвигов/оп':>10} | {'округлений/оп':>13}"
+    print(header)
+    print("-" * len(header))
+    for bits, float_type, uint_type in FORMATS:
+        values = rng.standard_normal((3, SCALAR_PAIRS)) * np.exp2(rng.integers(-20, 20, (3, SCALAR_PAIRS)))
+        a, b, c = values.astype(float_type).view(uint_type)
+        operations = {"mul": (a, b), "div": (a, b), "sqrt": (np.abs(values[0]).astype(float_type).view(uint_type),),
+                      "fma": (a, b, c)}
+        for name, operands in operations.items():
+            soft_float = SoftFloat(bits)
+            start = time.perf_counter()
+            getattr(soft_float, name)(*operands)
+            per_item = (time.perf_counter() - start) / SCALAR_PAIRS
+            counters = soft_float.counters
+            print(f"{bits:>5} | {name:>8} | {per_item * 1e6:>11.2f} | "
+                  f"{counters['normalization_shifts'] / counters['operations']:>10.2f} | "
+                  f"{counters['rounding_events'] / counters['operations']:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
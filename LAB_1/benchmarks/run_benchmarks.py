@@ -0,0 +1,216 @@
+# Замеры всех арифметических путей LAB_1 (Converter, AddSub, Operations,
+# SoftFloat, StandartIEEE754) по разрядностям и размерам пакетов с отчётом
+# в JSON.
+# Отчёты двух ревизий сравниваются, замедление выше порога считается регрессией.
+# Запуск из каталога LAB_1:
+#   python -m benchmarks.run_benchmarks --output report.json
+#   python -m benchmarks.run_benchmarks --compare old.json new.json
+import argparse
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+
+import numpy as np
+
+from binary_calculator.add_sub import AddSub
+from binary_calculator.converter import Converter
+from binary_calculator.operations import Operations
+from binary_calculator.soft_float import SoftFloat
+from binary_calculator.standart_ieee754 import StandartIEEE754
+
+WIDTHS = [8, 16, 32, 64, 256, 4096]
+BATCH_SIZES = [1_000, 100_000]
+IEEE_WIDTHS = [32, 64]
+REPEAT = 3
+THRESHOLD = 0.10
+
+
+def random_operand(rng, bits):
+    # Запас в два разряда, чтобы сложение и вычитание не переполнялись
+    limit = 1 << max(1, bits - 2)
+    return rng.randrange(-limit + 1, limit)
+
+
+def scalar_cases(bits, rng):
+    number_1 = random_operand(rng, bits)
+    number_2 = random_operand(rng, bits)
+    factor_bits = max(1, (bits - 2) // 2)
+    factor_1 = rng.randrange(1, 1 << factor_bits)
+    factor_2 = -rng.randrange(1, 1 << factor_bits)
+    divisor = number_2 or 1
+
+    converter = Converter(number_1, bits)
+    add_sub = AddSub(number_1, number_2, bits)
+    multiplication = Operations(factor_1, factor_2, bits)
+    division = Operations(number_1, divisor, bits)
+    # Столько же символов, сколько в результате binary_divide
+    stream_length = len(division.binary_divide()[1])
+    return {
+        "converter.direct_code": converter.direct_code,
+        "converter.reverse_code": converter.reverse_code,
+        "converter.additional_code": converter.additional_code,
+        "add_sub.add_additional": add_sub.add_additional,
+        "add_sub.subtract_additional": lambda: AddSub(number_1, number_2, bits).subtract_additional(),
+        "add_sub.add_wide": add_sub.add_wide,
+        "add_sub.subtract_wide": add_sub.subtract_wide,
+        "operations.multiply_direct": multiplication.multiply_direct,
+        "operations.multiply_direct_full_width": lambda: multiplication.multiply_direct(full_width=True),
+        "operations.multiply_wide": multiplication.multiply_wide,
+        "operations.binary_divide": division.binary_divide,
+        "operations.iter_binary_divide":
+            lambda: list(itertools.islice(division.iter_binary_divide(), stream_length)),
+    }
+
+
+def batch_cases(bits, size, np_rng):
+    limit = 1 << (bits - 2)
+    numbers_1 = np_rng.integers(-limit + 1, limit, size=size, dtype=np.int64)
+    numbers_2 = np_rng.integers(-limit + 1, limit, size=size, dtype=np.int64)
+    return {
+        "converter.encode_many": lambda: Converter.encode_many(numbers_1, bits),
+        "add_sub.add_many": lambda: AddSub.add_many(numbers_1, numbers_2, bits),
+        "add_sub.subtract_many": lambda: AddSub.subtract_many(numbers_1, numbers_2, bits),
+    }
+
+
+def ieee_cases(bits, size, np_rng):
+    float_type = np.float32 if bits == 32 else np.float64
+    values = np_rng.standard_normal((3, size)) * np.exp2(np_rng.integers(-20, 20, (3, size)))
+    words_1, words_2, words_3 = values.astype(float_type).view(np.uint32 if bits == 32 else np.uint64)
+    positive = np.abs(values[0]).astype(float_type).view(words_1.dtype)
+    soft_float = SoftFloat(bits)
+    cases = {
+        "soft_float.add": lambda: soft_float.add(words_1, words_2),
+        "soft_float.sub": lambda: soft_float.sub(words_1, words_2),
+        "soft_float.mul": lambda: soft_float.mul(words_1, words_2),
+        "soft_float.div": lambda: soft_float.div(words_1, words_2),
+        "soft_float.sqrt": lambda: soft_float.sqrt(positive),
+        "soft_float.fma": lambda: soft_float.fma(words_1, words_2, words_3),
+    }
+    if bits == 32:
+        cases["standart_ieee754.ieee754_addition_many"] = \
+            lambda: StandartIEEE754.ieee754_addition_many(words_1, words_2)
+    return cases
+
+
+# Скалярные операции StandartIEEE754 (только binary32)
+def standart_cases():
+    ieee = StandartIEEE754(1.5, -0.375)
+    return {
+        "standart_ieee754.ieee754_addition": ieee.ieee754_addition,
+        "standart_ieee754.ieee754_multiplication": ieee.ieee754_multiplication,
+        "standart_ieee754.ieee754_division": ieee.ieee754_division,
+        "standart_ieee754.ieee754_sqrt": StandartIEEE754(2.25, 0).ieee754_sqrt,
+        "standart_ieee754.ieee754_fma": lambda: ieee.ieee754_fma(0.1),
+    }
+
+
+# Лучшее время одного вызова из repeat серий, размер серии подбирается timeit
+def measure(function, repeat):
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run(widths=WIDTHS, batch_sizes=BATCH_SIZES, repeat=REPEAT, log=print):
+    rng = random.Random(0)
+    np_rng = np.random.default_rng(0)
+    results = []
+
+    def record(name, bits, batch, seconds):
+        results.append({"name": name, "bits": bits, "batch": batch,
+                        "ns_per_item": seconds / batch * 1e9})
+        log(f"{name:>40} | {bits:>5} | {batch:>7} | {seconds / batch * 1e9:>12.1f}")
+
+    log(f"{'операция':>40} | {'bits':>5} | {'пакет':>7} | {'нс/элемент':>12}")
+    for bits in widths:
+        for name, function in scalar_cases(bits, rng).items():
+            record(name, bits, 1, measure(function, repeat))
+        if bits <= AddSub.MAX_BATCH_BITS:
+            for size in batch_sizes:
+                for name, function in batch_cases(bits, size, np_rng).items():
+                    record(name, bits, size, measure(function, repeat))
+
+    for name, function in standart_cases().items():
+        record(name, 32, 1, measure(function, repeat))
+    for bits in IEEE_WIDTHS:
+        for size in batch_sizes:
+            for name, function in ieee_cases(bits, size, np_rng).items():
+                record(name, bits, size, measure(function, repeat))
+
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def result_key(result):
+    return f"{result['name']}/{result['bits']}/{result['batch']}"
+
+
+# Сравнение отчётов: отношение new / old для общих замеров; возвращает
+# строки сравнения и список регрессий
+def compare(old_report, new_report, threshold=THRESHOLD):
+    old = {result_key(result): result["ns_per_item"] for result in old_report["results"]}
+    rows = []
+    regressions = []
+    for result in new_report["results"]:
+        key = result_key(result)
+        if key not in old:
+            continue
+        ratio = result["ns_per_item"] / old[key]
+        rows.append((key, old[key], result["ns_per_item"], ratio))
+        if ratio > 1 + threshold:
+            regressions.append(key)
+    return rows, regressions
+
+
+def print_comparison(rows, regressions):
+    header = f"{'замер':>55} | {'было, нс':>12} | {'стало, нс':>12} | {'отношение':>9}"
+    print(header)
+    print("-" * len(header))
+    for key, old, new, ratio in rows:
+        marker = "  <- регрессия" if key in regressions else ""
+        print(f"{key:>55} | {old:>12.1f} | {new:>12.1f} | {ratio:>8.2f}x{marker}")
+    print(f"Регрессий: {len(regressions)} из {len(rows)}")
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Замеры арифметики LAB_1")
+    parser.add_argument("--output", help="куда сохранить JSON-отчёт")
+    parser.add_argument("--widths", type=int, nargs="+", default=WIDTHS)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=BATCH_SIZES)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="сравнить два отчёта")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="допустимое относительное замедление")
+    arguments = parser.parse_args(arguments)
+
+    if arguments.compare:
+        reports = []
+        for path in arguments.compare:
+            with open(path, encoding="utf-8") as file:
+                reports.append(json.load(file))
+        rows, regressions = compare(*reports, arguments.threshold)
+        print_comparison(rows, regressions)
+        return 1 if regressions else 0
+
+    report = run(arguments.widths, arguments.batch_sizes, arguments.repeat)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,22 @@
+import itertools
+
+import numpy as np
+
+from binary_calculator.adder_engine import AdderEngine
+from binary_calculator.bit_vector import BitVector
 from binary_calculator.converter import *
+from binary_calculator.profiling import Profiler
+from binary_calculator.wide_word import WideWord
 
 class AddSub:
     DEFAULT_BITS = 8
     ERROR_OVERFLOW_MESSAGE = "Переполнение при сложении в дополнительном коде!"
     NEGATIVE_SIGN_ADJUSTMENT = 1
     BINARY_BASE = 2
+    MAX_BATCH_BITS = 64
+    ADDERS = AdderEngine.ADDERS
+    ACCUMULATE_CHUNK = 1 << 16
+    HALF_WORD_BITS = 32
 
     def __init__(self, number_1, number_2=None, bits=DEFAULT_BITS):
         self.number_1 = number_1
@@ -12,59 +24,215 @@ class AddSub:
         self.bits = bits
 
 
+    @Profiler.profiled("AddSub.add_additional")
     def add_additional(self):
-        number_1_additional = AddSub.additional_code(self.number_1, self.bits)
-        number_2_additional = AddSub.additional_code(self.number_2, self.bits)
-
-        init_carry = 0
-        result_additional = ""
+        number_1_additional = BitVector(self.number_1, self.bits)
+        number_2_additional = BitVector(self.number_2, self.bits)
 
-        for i in range(self.bits - 1, -1, -1):
-            bit1 = int(number_1_additional[i])
-            bit2 = int(number_2_additional[i])
+        result_additional, _ = number_1_additional.add(number_2_additional)
 
-            sum_bit = bit1 + bit2 + init_carry
-            result_additional = str(sum_bit % 2) + result_additional
-            init_carry = sum_bit // 2
-
-        sign_bit_1 = int(number_1_additional[0])
-        sign_bit_2 = int(number_2_additional[0])
-        sign_bit_res = int(result_additional[0])
+        sign_bit_1 = number_1_additional.sign
+        sign_bit_2 = number_2_additional.sign
+        sign_bit_res = result_additional.sign
 
         if (sign_bit_1 == sign_bit_2) and (sign_bit_res != sign_bit_1):
             raise OverflowError("Переполнение при сложении в дополнительном коде!")
 
-        if result_additional[0] == "1":
-            result_decimal = int(result_additional, AddSub.BINARY_BASE) - (AddSub.NEGATIVE_SIGN_ADJUSTMENT << self.bits)
-        else:
-            result_decimal = int(result_additional, AddSub.BINARY_BASE)
-
-        return result_decimal, result_additional
+        return result_additional.to_signed(), str(result_additional)
 
+    @Profiler.profiled("AddSub.subtract_additional")
     def subtract_additional(self):
         self.number_2 = -self.number_2
         return self.add_additional()
 
+    # Широкий режим: операнды хранятся как целые Python, знак и переполнение
+    # определяются несколькими операциями над всем словом сразу
+    @Profiler.profiled("AddSub.add_wide")
+    def add_wide(self):
+        return AddSub._add_wide(self.number_1, self.number_2, self.bits)
+
+    def subtract_wide(self):
+        return AddSub._add_wide(self.number_1, -self.number_2, self.bits)
+
+    @staticmethod
+    def _add_wide(number_1, number_2, bits):
+        mask = (AddSub.NEGATIVE_SIGN_ADJUSTMENT << bits) - 1
+        sign_bit = AddSub.NEGATIVE_SIGN_ADJUSTMENT << (bits - 1)
+
+        number_1_additional = number_1 & mask
+        number_2_additional = number_2 & mask
+        result_additional = (number_1_additional + number_2_additional) & mask
+
+        if (number_1_additional ^ result_additional) & (number_2_additional ^ result_additional) & sign_bit:
+            raise OverflowError(AddSub.ERROR_OVERFLOW_MESSAGE)
+
+        result_decimal = result_additional - ((result_additional & sign_bit) << 1)
+        return result_decimal, WideWord(result_decimal, bits)
+
+    # Сложение на модели аппаратного сумматора (см. AdderEngine): результат
+    # как у add_additional и статистика модели - задержка в вентилях,
+    # число вентилей и операций над словами
+    @Profiler.profiled("AddSub.add_model")
+    def add_model(self, adder="ripple"):
+        return AddSub._add_model(self.number_1, self.number_2, self.bits, adder)
+
+    def subtract_model(self, adder="ripple"):
+        return AddSub._add_model(self.number_1, -self.number_2, self.bits, adder)
+
+    @staticmethod
+    def _add_model(number_1, number_2, bits, adder):
+        number_1_additional = BitVector(number_1, bits)
+        number_2_additional = BitVector(number_2, bits)
+        result, _, stats = AdderEngine.add(number_1_additional.value, number_2_additional.value, bits, adder)
+        result_additional = BitVector(result, bits)
+
+        if (number_1_additional.sign == number_2_additional.sign
+                and result_additional.sign != number_1_additional.sign):
+            raise OverflowError(AddSub.ERROR_OVERFLOW_MESSAGE)
+
+        return result_additional.to_signed(), str(result_additional), stats
+
+    # Сумма нескольких чисел через слои сжатий 3:2 и один итоговый сумматор
+    @staticmethod
+    @Profiler.profiled("AddSub.sum_carry_save")
+    def sum_carry_save(numbers, bits=DEFAULT_BITS, final_adder="kogge_stone"):
+        numbers = list(numbers)
+        result, stats = AdderEngine.carry_save([BitVector(number, bits).value for number in numbers],
+                                               bits, final_adder)
+        limit = AddSub.NEGATIVE_SIGN_ADJUSTMENT << (bits - 1)
+        if not -limit <= sum(numbers) < limit:
+            raise OverflowError(AddSub.ERROR_OVERFLOW_MESSAGE)
+
+        result_additional = BitVector(result, bits)
+        return result_additional.to_signed(), str(result_additional), stats
+
+    # Пакетное сложение массивов в дополнительном коде: переполнение не
+    # прерывает вычисления, а отмечается во флагах
+    @staticmethod
+    @Profiler.profiled("AddSub.add_many")
+    def add_many(numbers_1, numbers_2, bits=DEFAULT_BITS):
+        number_1_additional, number_2_additional = AddSub._many_operands(numbers_1, numbers_2, bits)
+        result_additional = (number_1_additional + number_2_additional) & np.uint64((1 << bits) - 1)
+        return AddSub._many_result(number_1_additional, number_2_additional, result_additional, bits)
+
+    # Пакетное сложение на модели сумматора: к результату add_many
+    # добавляется статистика модели
+    @staticmethod
+    @Profiler.profiled("AddSub.add_many_model")
+    def add_many_model(numbers_1, numbers_2, bits=DEFAULT_BITS, adder="ripple"):
+        number_1_additional, number_2_additional = AddSub._many_operands(numbers_1, numbers_2, bits)
+        result_additional, _, stats = AdderEngine.add(number_1_additional, number_2_additional, bits, adder)
+        return AddSub._many_result(number_1_additional, number_2_additional, result_additional, bits) + (stats,)
+
+    @staticmethod
+    def _many_operands(numbers_1, numbers_2, bits):
+        if not 1 <= bits <= AddSub.MAX_BATCH_BITS:
+            raise ValueError(f"Разрядность должна быть от 1 до {AddSub.MAX_BATCH_BITS}")
+
+        mask = np.uint64((1 << bits) - 1)
+        number_1_additional = np.asarray(numbers_1, dtype=np.int64).astype(np.uint64) & mask
+        number_2_additional = np.asarray(numbers_2, dtype=np.int64).astype(np.uint64) & mask
+        return number_1_additional, number_2_additional
+
+    @staticmethod
+    def _many_result(number_1_additional, number_2_additional, result_additional, bits):
+        sign_shift = np.uint64(bits - 1)
+        extend_shift = np.uint64(64 - bits)
+
+        overflow = (((number_1_additional ^ result_additional) & (number_2_additional ^ result_additional))
+                    >> sign_shift).astype(bool)
+        result_decimal = (result_additional << extend_shift).view(np.int64) >> extend_shift.astype(np.int64)
+
+        return result_decimal, overflow, result_additional
+
+    @staticmethod
+    def subtract_many(numbers_1, numbers_2, bits=DEFAULT_BITS):
+        return AddSub.add_many(numbers_1, np.negative(np.asarray(numbers_2, dtype=np.int64)), bits)
+
+    # Потоковое суммирование последовательности чисел (итерируемое или
+    # массив) блоками по chunk_size, до 64 бит - векторно. Возвращает
+    # точную сумму, её значение в bits-разрядном регистре с отбрасыванием
+    # старших разрядов и с насыщением, а также индексы слагаемых, на
+    # которых цепочка add_additional остановилась бы с переполнением.
+    @staticmethod
+    @Profiler.profiled("AddSub.accumulate")
+    def accumulate(numbers, bits=DEFAULT_BITS, chunk_size=ACCUMULATE_CHUNK):
+        if bits < 1:
+            raise ValueError("Разрядность должна быть положительной")
+        if chunk_size < 1:
+            raise ValueError("Размер блока должен быть положительным")
+
+        limit = AddSub.NEGATIVE_SIGN_ADJUSTMENT << (bits - 1)
+        mask = 2 * limit - 1
+        as_array = bits <= AddSub.MAX_BATCH_BITS
+        total = 0
+        wrapped = 0
+        position = 0
+        overflow = []
+
+        for chunk in AddSub._accumulate_chunks(numbers, chunk_size, as_array):
+            if as_array:
+                if chunk.min() < -limit or chunk.max() >= limit:
+                    raise ValueError(f"Слагаемое не помещается в {bits} бит")
+                # Префиксные суммы по модулю 2^64 от текущего значения
+                # регистра: их младшие bits разрядов - регистр после каждого
+                # слагаемого, переполнение - по знаковым разрядам
+                words = chunk.astype(np.uint64)
+                prefix = np.cumsum(words, dtype=np.uint64) + np.uint64(wrapped & mask)
+                before = np.concatenate(([np.uint64(wrapped & mask)], prefix[:-1]))
+                signs = (((before ^ prefix) & (words ^ prefix)) >> np.uint64(bits - 1)) & np.uint64(1)
+                overflow.append(np.flatnonzero(signs) + position)
+                # Точная сумма блока по половинам слов без переполнения int64
+                high = chunk >> AddSub.HALF_WORD_BITS
+                low = chunk & ((1 << AddSub.HALF_WORD_BITS) - 1)
+                total += (int(high.sum()) << AddSub.HALF_WORD_BITS) + int(low.sum())
+                wrapped = ((int(prefix[-1]) & mask) ^ limit) - limit
+            else:
+                indices = []
+                for index, number in enumerate(chunk, position):
+                    if not -limit <= number < limit:
+                        raise ValueError(f"Слагаемое не помещается в {bits} бит")
+                    step = wrapped + number
+                    wrapped = ((step + limit) & mask) - limit
+                    if wrapped != step:
+                        indices.append(index)
+                    total += number
+                overflow.append(np.array(indices, dtype=np.int64))
+            position += len(chunk)
+
+        saturated = min(max(total, -limit), limit - 1)
+        overflow_indices = np.concatenate(overflow) if overflow else np.empty(0, dtype=np.int64)
+        return total, wrapped, saturated, overflow_indices
+
+    @staticmethod
+    def _accumulate_chunks(numbers, chunk_size, as_array):
+        if isinstance(numbers, np.ndarray) and as_array:
+            numbers = numbers.ravel().astype(np.int64, copy=False)
+            for start in range(0, len(numbers), chunk_size):
+                yield numbers[start:start + chunk_size]
+            return
+
+        iterator = iter(numbers)
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield np.array(chunk, dtype=np.int64) if as_array else [int(number) for number in chunk]
+
     def display_add_additional(self, result_decimal, result_additional):
 
         print(f"Результат: {result_decimal}")
-        converter_result = Converter(result_decimal, self.bits)
-        print(f"Прямой код: [{converter_result.direct_code()}]")
-        print(f"Обратный код: [{converter_result.reverse_code()}]")
+        print(f"Прямой код: [{Converter.cached_code(result_decimal, self.bits, 'direct')}]")
+        print(f"Обратный код: [{Converter.cached_code(result_decimal, self.bits, 'reverse')}]")
         print(f"Дополнительный код: {result_additional}\n")
 
     def display_number_info(self, number):
 
-        converter = Converter(number, self.bits)
         print(f"Число введено: {number}")
-        print(f"Прямой код: [{converter.direct_code()}]")
-        print(f"Обратный код: [{converter.reverse_code()}]")
-        print(f"Дополнительный код: [{converter.additional_code()}]\n")
+        print(f"Прямой код: [{Converter.cached_code(number, self.bits, 'direct')}]")
+        print(f"Обратный код: [{Converter.cached_code(number, self.bits, 'reverse')}]")
+        print(f"Дополнительный код: [{Converter.cached_code(number, self.bits, 'additional')}]\n")
 
     @staticmethod
     def additional_code(number, bits):
-        if number >= 0:
-            bin_number = bin(number)[2:].zfill(bits)
-        else:
-            bin_number = bin((AddSub.NEGATIVE_SIGN_ADJUSTMENT << bits) + number)[AddSub.NEGATIVE_SIGN_ADJUSTMENT:]
-        return bin_number[-bits:]
+        return str(BitVector(number, bits))
@@ -0,0 +1,267 @@
+import math
+
+import numpy as np
+
+from binary_calculator.profiling import Profiler
+
+
+class AdderEngine:
+    ADDERS = ("ripple", "carry_lookahead", "carry_select", "kogge_stone")
+
+    # Размер группы сумматора с ускоренным переносом
+    LOOKAHEAD_GROUP = 4
+
+    # Модель задержек: вентиль И/ИЛИ/исключающее ИЛИ - одна единица.
+    # p и g - один уровень, сумма p ^ c - ещё один, каждая ступень
+    # распространения переноса (ячейка g | p & c или мультиплексор) - два.
+    # Вентили считаются так: p, g и сумма по 3 на разряд, серая ячейка
+    # переноса - 2, чёрная ячейка (G и P) и мультиплексор - 3.
+    PG_AND_SUM_GATES = 3
+    GRAY_CELL_GATES = 2
+    BLACK_CELL_GATES = 3
+    MUX_GATES = 3
+    COMPRESSOR_GATES = 5
+    COMPRESSOR_DELAY = 2
+
+    # Сложение bits-разрядных слов a и b (целые Python или массивы uint64
+    # при bits <= 64) по модели выбранного сумматора. Возвращает сумму по
+    # модулю 2^bits, перенос из старшего разряда и статистику модели.
+    @staticmethod
+    @Profiler.profiled("AdderEngine.add")
+    def add(a, b, bits, adder="ripple", carry_in=0):
+        if adder not in AdderEngine.ADDERS:
+            raise ValueError(f"Неизвестный сумматор: {adder}")
+        if bits < 1:
+            raise ValueError("Разрядность должна быть положительной")
+        if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+            if bits > 64:
+                raise ValueError("Для массивов разрядность не может превышать 64")
+            a = np.asarray(a, dtype=np.uint64)
+            b = np.asarray(b, dtype=np.uint64)
+        return getattr(AdderEngine, adder)(a, b, bits, carry_in)
+
+    @staticmethod
+    def _stats(adder, bits, levels, cell_gates, operations, **extra):
+        stats = {
+            "adder": adder,
+            "bits": bits,
+            "gate_delay": 2 + 2 * levels,
+            "gates": AdderEngine.PG_AND_SUM_GATES * bits + cell_gates,
+            "word_operations": operations,
+        }
+        stats.update(extra)
+        return stats
+
+    @staticmethod
+    def _equal(x, y):
+        return bool(np.all(x == y))
+
+    @staticmethod
+    def _top_bit(value, bits):
+        return (value >> (bits - 1)) & 1
+
+    # Перенос бежит по разрядам: каждая итерация сдвигает его на один разряд,
+    # итерации продолжаются, пока переносы не перестанут меняться. Число
+    # итераций - фактическая длина самой длинной цепочки переноса.
+    @staticmethod
+    def ripple(a, b, bits, carry_in=0):
+        mask = (1 << bits) - 1
+        generate = a & b
+        propagate = a ^ b
+        carries = generate & 0 | carry_in
+        operations = 2
+        chain = 0
+        while True:
+            shifted = (((generate | (propagate & carries)) << 1) | carry_in) & mask
+            operations += 5
+            if AdderEngine._equal(shifted, carries):
+                break
+            carries = shifted
+            chain += 1
+        Profiler.count("bit_iterations", chain + 1)
+
+        carry_out = AdderEngine._top_bit(generate | (propagate & carries), bits)
+        stats = AdderEngine._stats("ripple", bits, bits, AdderEngine.GRAY_CELL_GATES * bits,
+                                   operations + 4, carry_chain=chain)
+        return propagate ^ carries, carry_out, stats
+
+    # Параллельный префикс Когге-Стоуна: на шаге d каждая позиция
+    # объединяет свою пару (G, P) с парой на d разрядов младше
+    @staticmethod
+    def kogge_stone(a, b, bits, carry_in=0):
+        mask = (1 << bits) - 1
+        propagate = a ^ b
+        group_generate = (a & b) | (propagate & carry_in)
+        group_propagate = propagate
+        operations = 4
+        levels = 0
+        cells = 0
+        distance = 1
+        while distance < bits:
+            group_generate = group_generate | (group_propagate & (group_generate << distance) & mask)
+            group_propagate = group_propagate & (group_propagate << distance)
+            operations += 6
+            cells += bits - distance
+            levels += 1
+            distance *= 2
+
+        carries = ((group_generate << 1) | carry_in) & mask
+        carry_out = AdderEngine._top_bit(group_generate, bits)
+        stats = AdderEngine._stats("kogge_stone", bits, levels, AdderEngine.BLACK_CELL_GATES * cells,
+                                   operations + 6)
+        return propagate ^ carries, carry_out, stats
+
+    @staticmethod
+    def _positions(bits, predicate):
+        mask = 0
+        for i in range(bits):
+            if predicate(i):
+                mask |= 1 << i
+        return mask
+
+    # Объединение (G, P) с парой на distance разрядов младше только в
+    # позициях active; остальные позиции не меняются
+    @staticmethod
+    def _combine(group_generate, group_propagate, distance, active, mask):
+        shifted_generate = (group_generate << distance) & active
+        shifted_propagate = ((group_propagate << distance) & active) | (mask ^ active)
+        return group_generate | (group_propagate & shifted_generate), group_propagate & shifted_propagate
+
+    # Сумматор с ускоренным переносом: перенос внутри групп по 4 разряда,
+    # затем между группами по их (G, P) и разводка переноса группы на
+    # младшие разряды следующей группы
+    @staticmethod
+    def carry_lookahead(a, b, bits, carry_in=0):
+        group = AdderEngine.LOOKAHEAD_GROUP
+        mask = (1 << bits) - 1
+        propagate = a ^ b
+        group_generate = (a & b) | (propagate & carry_in)
+        group_propagate = propagate
+        operations = 4
+        levels = 0
+        cells = 0
+
+        distance = 1
+        while distance < group:
+            active = AdderEngine._positions(bits, lambda i: i % group >= distance)
+            group_generate, group_propagate = AdderEngine._combine(
+                group_generate, group_propagate, distance, active, mask)
+            operations += 8
+            cells += active.bit_count()
+            levels += 1
+            distance *= 2
+
+        tops = AdderEngine._positions(bits, lambda i: i % group == group - 1)
+        distance = group
+        while distance < bits:
+            active = tops & (mask << distance) & mask
+            group_generate, group_propagate = AdderEngine._combine(
+                group_generate, group_propagate, distance, active, mask)
+            operations += 8
+            cells += active.bit_count()
+            levels += 1
+            distance *= 2
+
+        inner = AdderEngine._positions(bits, lambda i: i >= group and i % group != group - 1)
+        if inner:
+            top_generate = group_generate & tops
+            spread = 0
+            for shift in range(1, group):
+                spread = spread | (top_generate << shift)
+            group_generate = group_generate | (group_propagate & spread & inner)
+            operations += 2 * group + 2
+            cells += inner.bit_count()
+            levels += 1
+
+        carries = ((group_generate << 1) | carry_in) & mask
+        carry_out = AdderEngine._top_bit(group_generate, bits)
+        stats = AdderEngine._stats("carry_lookahead", bits, levels, AdderEngine.BLACK_CELL_GATES * cells,
+                                   operations + 6)
+        return propagate ^ carries, carry_out, stats
+
+    # Сумматор с выбором переноса: блоки по ~sqrt(bits) разрядов считаются
+    # параллельно для входного переноса 0 и 1, затем цепочка мультиплексоров
+    # выбирает готовый вариант для каждого блока
+    @staticmethod
+    def carry_select(a, b, bits, carry_in=0):
+        block = min(math.isqrt(bits - 1) + 1, bits)
+        blocks = (bits + block - 1) // block
+        mask = (1 << bits) - 1
+        generate = a & b
+        propagate = a ^ b
+        starts = AdderEngine._positions(bits, lambda i: i % block == 0)
+        not_starts = mask ^ starts
+        operations = 2
+
+        variants = []
+        for block_carry in (0, 1):
+            inject = (starts & ~1 if block_carry else 0) | carry_in
+            carries = generate & 0 | inject
+            while True:
+                shifted = ((((generate | (propagate & carries)) << 1) & not_starts) | inject) & mask
+                operations += 6
+                if AdderEngine._equal(shifted, carries):
+                    break
+                carries = shifted
+            variants.append(carries)
+
+        # Первый блок получает настоящий входной перенос в обоих вариантах,
+        # select отмечает блоки, для которых выбран вариант с переносом 1
+        carry_0, carry_1 = variants
+        out_0 = generate | (propagate & carry_0)
+        out_1 = generate | (propagate & carry_1)
+        block_carry = (out_0 >> (min(block, bits) - 1)) & 1
+        select = generate & 0
+        operations += 6
+        for low in range(block, bits, block):
+            width = min(block, bits - low)
+            select = select | ((((1 << width) - 1) << low) * block_carry)
+            top = low + width - 1
+            block_carry = ((out_0 >> top) & 1) | ((out_1 >> top) & 1 & block_carry)
+            operations += 9
+
+        carries = (carry_1 & select) | (carry_0 & (mask ^ select))
+        cell_gates = (AdderEngine.GRAY_CELL_GATES * (2 * bits - block)
+                      + AdderEngine.MUX_GATES * (bits - block + blocks - 1))
+        stats = AdderEngine._stats("carry_select", bits, block + blocks - 1, cell_gates,
+                                   operations + 4, block=block)
+        return propagate ^ carries, block_carry, stats
+
+    # Многооперандное сложение: слои сжатий 3:2 (сумма без переноса и
+    # сдвинутые переносы) до двух слов, затем один сумматор final_adder
+    @staticmethod
+    @Profiler.profiled("AdderEngine.carry_save")
+    def carry_save(operands, bits, final_adder="kogge_stone"):
+        if final_adder not in AdderEngine.ADDERS:
+            raise ValueError(f"Неизвестный сумматор: {final_adder}")
+        operands = list(operands)
+        if not operands:
+            raise ValueError("Нужен хотя бы один операнд")
+        mask = (1 << bits) - 1
+        levels = 0
+        compressors = 0
+        while len(operands) > 2:
+            reduced = []
+            full = len(operands) - len(operands) % 3
+            for i in range(0, full, 3):
+                x, y, z = operands[i:i + 3]
+                reduced.append(x ^ y ^ z)
+                reduced.append((((x & y) | (x & z) | (y & z)) << 1) & mask)
+                compressors += 1
+            operands = reduced + operands[full:]
+            levels += 1
+        if len(operands) == 1:
+            operands.append(operands[0] & 0)
+
+        total, _, final_stats = AdderEngine.add(operands[0], operands[1], bits, final_adder)
+        stats = {
+            "adder": "carry_save",
+            "bits": bits,
+            "final_adder": final_adder,
+            "csa_levels": levels,
+            "compressors": compressors,
+            "gate_delay": AdderEngine.COMPRESSOR_DELAY * levels + final_stats["gate_delay"],
+            "gates": AdderEngine.COMPRESSOR_GATES * bits * compressors + final_stats["gates"],
+            "word_operations": 8 * compressors + final_stats["word_operations"],
+        }
+        return total, stats
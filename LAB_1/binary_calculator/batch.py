@@ -0,0 +1,177 @@
+import csv
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from binary_calculator.add_sub import AddSub
+from binary_calculator.converter import Converter
+from binary_calculator.operations import Operations
+from binary_calculator.standart_ieee754 import StandartIEEE754
+
+
+class BatchProcessor:
+    OPERATIONS = ("convert", "add", "sub", "mul", "div", "ieee-add")
+    FORMATS = ("csv", "jsonl")
+    CONVERT_CODES = ("binary",) + Converter.CODES
+
+    # Поля входной записи; в ответ добавляются result, binary и error
+    INPUT_FIELDS = ("op", "a", "b", "bits", "code", "precision")
+    OUTPUT_FIELDS = ("result", "binary", "error")
+
+    DEFAULT_BITS = 8
+    DEFAULT_PRECISION = 5
+    CHUNK_SIZE = 1000
+    # Сколько пакетов на процесс может одновременно находиться в обработке
+    IN_FLIGHT_PER_WORKER = 2
+
+    def __init__(self, file_format="jsonl", workers=1, chunk_size=CHUNK_SIZE):
+        if file_format not in BatchProcessor.FORMATS:
+            raise ValueError(f"Неизвестный формат: {file_format}")
+        if workers < 1 or chunk_size < 1:
+            raise ValueError("Число процессов и размер пакета должны быть положительными")
+        self.file_format = file_format
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+    # Потоковая обработка: записи читаются, считаются и пишутся пакетами,
+    # так что память не зависит от размера входа. Возвращает число записей.
+    def process(self, input_stream, output_stream):
+        records = self.read_records(input_stream)
+        write = self._writer(output_stream)
+        count = 0
+        for results in self._process_chunks(self._chunks(records)):
+            for result in results:
+                write(result)
+            count += len(results)
+        return count
+
+    # Строки JSONL выдаются как есть: разбор идёт в process_record, чтобы
+    # испорченная строка стала записью с ошибкой, а не остановила пакет
+    def read_records(self, stream):
+        if self.file_format == "csv":
+            yield from csv.DictReader(stream)
+            return
+        for line in stream:
+            if line.strip():
+                yield line
+
+    def _writer(self, stream):
+        if self.file_format == "jsonl":
+            return lambda result: stream.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+        writer = None
+
+        def write_row(result):
+            nonlocal writer
+            if writer is None:
+                fields = list(result) + [field for field in BatchProcessor.OUTPUT_FIELDS if field not in result]
+                writer = csv.DictWriter(stream, fieldnames=fields, extrasaction="ignore", lineterminator="\n")
+                writer.writeheader()
+            writer.writerow(result)
+        return write_row
+
+    def _chunks(self, records):
+        while True:
+            chunk = list(islice(records, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    # С пулом процессов в обработке держится не больше
+    # workers * IN_FLIGHT_PER_WORKER пакетов, а результаты выдаются по порядку
+    def _process_chunks(self, chunks):
+        if self.workers == 1:
+            for chunk in chunks:
+                yield BatchProcessor.process_chunk(chunk)
+            return
+
+        limit = self.workers * BatchProcessor.IN_FLIGHT_PER_WORKER
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(BatchProcessor.process_chunk, chunk))
+                if len(pending) >= limit:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    @staticmethod
+    def process_chunk(records):
+        return [BatchProcessor.process_record(record) for record in records]
+
+    # Ошибка в одной записи не останавливает обработку, а попадает в поле
+    # error; строка JSONL, которую не удалось разобрать, выводится в поле input
+    @staticmethod
+    def process_record(record):
+        result = dict.fromkeys(BatchProcessor.OUTPUT_FIELDS, "")
+        try:
+            record = BatchProcessor.parse_record(record)
+        except ValueError as error:
+            result["error"] = str(error)
+            return {"input": record.rstrip("\n"), **result}
+        result = {**record, **result}
+        try:
+            result["result"], result["binary"] = BatchProcessor.evaluate(record)
+        except KeyError as error:
+            result["error"] = f"Нет поля: {error.args[0]}"
+        except (ValueError, TypeError, OverflowError, ZeroDivisionError) as error:
+            result["error"] = str(error)
+        return result
+
+    @staticmethod
+    def parse_record(record):
+        if isinstance(record, str):
+            try:
+                record = json.loads(record)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"Некорректная строка JSON: {error.msg}") from error
+        if not isinstance(record, dict):
+            raise ValueError("Запись должна быть объектом JSON")
+        return record
+
+    @staticmethod
+    def evaluate(record):
+        operation = record.get("op")
+        if operation not in BatchProcessor.OPERATIONS:
+            raise ValueError(f"Неизвестная операция: {operation}")
+        bits = BatchProcessor._integer(record, "bits", BatchProcessor.DEFAULT_BITS)
+        if bits < 1:
+            raise ValueError(f"Разрядность должна быть положительной: {bits}")
+
+        # Сумма - кратчайшая десятичная запись, как в меню программы
+        if operation == "ieee-add":
+            standart = StandartIEEE754(str(record["a"]), str(record["b"]))
+            binary = standart.ieee754_addition()
+            return standart.ieee754_to_decimal(binary), binary
+
+        number_1 = int(record["a"])
+        if operation == "convert":
+            return number_1, BatchProcessor._convert(number_1, bits, record.get("code") or "additional")
+
+        number_2 = int(record["b"])
+        if operation in ("add", "sub"):
+            add_sub = AddSub(number_1, number_2, bits)
+            decimal, word = add_sub.add_wide() if operation == "add" else add_sub.subtract_wide()
+            return decimal, str(word)
+        operations = Operations(number_1, number_2, bits)
+        if operation == "mul":
+            return operations.multiply_direct()
+        return operations.binary_divide(BatchProcessor._integer(record, "precision", BatchProcessor.DEFAULT_PRECISION))
+
+    # Пустое или отсутствующее поле - значение по умолчанию; 0 остаётся 0
+    @staticmethod
+    def _integer(record, field, default):
+        value = record.get(field)
+        if value is None or value == "":
+            return default
+        return int(value)
+
+    @staticmethod
+    def _convert(number, bits, code):
+        if code not in BatchProcessor.CONVERT_CODES:
+            raise ValueError(f"Неизвестный код: {code}")
+        converter = Converter(number, bits)
+        if code == "binary":
+            return converter.make_it_binary()
+        return getattr(converter, f"{code}_code")()
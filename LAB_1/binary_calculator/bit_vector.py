@@ -0,0 +1,99 @@
+class BitVector:
+    __slots__ = ("value", "width")
+
+    # Слово фиксированной разрядности в одном целом: value хранится без
+    # знака (младшие width битов, для отрицательного числа - его
+    # дополнительный код), строки строятся только для вывода
+    def __init__(self, value, width):
+        if width < 0:
+            raise ValueError("Разрядность не может быть отрицательной")
+        self.value = value & ((1 << width) - 1)
+        self.width = width
+
+    # Строка из 0 и 1; пробелы (как в "0 0000101") пропускаются
+    @staticmethod
+    def from_string(bits):
+        digits = bits.replace(" ", "")
+        if set(digits) - {"0", "1"}:
+            raise ValueError(f"Ожидалась строка из двоичных разрядов: {bits!r}")
+        return BitVector(int(digits, 2) if digits else 0, len(digits))
+
+    @property
+    def sign(self):
+        return (self.value >> (self.width - 1)) & 1 if self.width else 0
+
+    @property
+    def mask(self):
+        return (1 << self.width) - 1
+
+    def to_signed(self):
+        return self.value - (self.sign << self.width)
+
+    # Сумма по модулю 2^width и перенос из старшего разряда
+    def add(self, other, carry=0):
+        total = self.value + other.value + carry
+        return BitVector(total, self.width), total >> self.width
+
+    def resize(self, width):
+        return BitVector(self.value, width)
+
+    # Знаковый разряд отдельно от модуля: "1 0000101"
+    def format_code(self):
+        return f"{self.sign} {BitVector.to_string(self.value, self.width - 1)}"
+
+    @staticmethod
+    def to_string(value, width):
+        if width <= 0:
+            return ""
+        return format(value & ((1 << width) - 1), f"0{width}b")
+
+    def __str__(self):
+        return BitVector.to_string(self.value, self.width)
+
+    def __repr__(self):
+        return f"BitVector({self}, width={self.width})"
+
+    def __len__(self):
+        return self.width
+
+    # Индексация как у строки: 0 - старший разряд
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return str(self)[index]
+        if index < 0:
+            index += self.width
+        if not 0 <= index < self.width:
+            raise IndexError("Индекс разряда вне слова")
+        return (self.value >> (self.width - 1 - index)) & 1
+
+    def __int__(self):
+        return self.value
+
+    def __index__(self):
+        return self.value
+
+    def __and__(self, other):
+        return BitVector(self.value & other.value, self.width)
+
+    def __or__(self, other):
+        return BitVector(self.value | other.value, self.width)
+
+    def __xor__(self, other):
+        return BitVector(self.value ^ other.value, self.width)
+
+    def __invert__(self):
+        return BitVector(~self.value, self.width)
+
+    def __lshift__(self, shift):
+        return BitVector(self.value << shift, self.width)
+
+    def __rshift__(self, shift):
+        return BitVector(self.value >> shift, self.width)
+
+    def __eq__(self, other):
+        if not isinstance(other, BitVector):
+            return NotImplemented
+        return (self.value, self.width) == (other.value, other.width)
+
+    def __hash__(self):
+        return hash((self.value, self.width))
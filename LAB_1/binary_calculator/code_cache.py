@@ -0,0 +1,68 @@
+from collections import OrderedDict
+
+
+class CodeCache:
+    DEFAULT_SIZE = 4096
+    # Для разрядностей до 16 бит таблица кодов всех представимых чисел
+    # строится целиком при первом обращении
+    TABLE_MAX_BITS = 16
+
+    # compute(number, bits, code) - код одного числа,
+    # compute_table(bits, code) - коды чисел от -2^(bits-1) до 2^(bits-1) - 1
+    def __init__(self, compute, compute_table=None, max_size=DEFAULT_SIZE, table_max_bits=TABLE_MAX_BITS):
+        if max_size < 1:
+            raise ValueError("Размер кеша должен быть положительным")
+        self.compute = compute
+        self.compute_table = compute_table
+        self.max_size = max_size
+        self.table_max_bits = table_max_bits if compute_table else 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._tables = {}
+
+    def get(self, number, bits, code):
+        if bits <= self.table_max_bits:
+            offset = 1 << (bits - 1)
+            if -offset <= number < offset:
+                return self._table(bits, code)[number + offset]
+
+        key = (number, bits, code)
+        value = self._entries.get(key)
+        if value is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = self.compute(number, bits, code)
+        self._entries[key] = value
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return value
+
+    # Построение таблицы считается промахом, чтение готовой - попаданием
+    def _table(self, bits, code):
+        table = self._tables.get((bits, code))
+        if table is None:
+            self.misses += 1
+            table = self.compute_table(bits, code)
+            self._tables[(bits, code)] = table
+        else:
+            self.hits += 1
+        return table
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "tables": sorted(self._tables),
+        }
+
+    def clear(self):
+        self.hits = 0
+        self.misses = 0
+        self._entries.clear()
+        self._tables.clear()
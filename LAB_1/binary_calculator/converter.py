@@ -1,18 +1,123 @@
+import numpy as np
+
+from binary_calculator.bit_vector import BitVector
+from binary_calculator.code_cache import CodeCache
+
+
 class Converter:
     DEFAULT_BITS = 8
     CARRY_INITIAL = 1
     CARRY_RESET = 0
     BIT_SIGN_NEGATIVE = "1"
+    CODES = ("direct", "reverse", "additional")
+    OUTPUT_FORMATS = ("words", "bits", "packed")
+    MAX_BATCH_BITS = 64
+
     def __init__(self, number, bits=DEFAULT_BITS):
         self.number = number
         self.bits = bits
 
+    @staticmethod
+    def to_binary(value, bits):
+        return BitVector.to_string(value, bits)
+
+    # Знаковый разряд отдельно от модуля: "1 0000101"; слово - обычное
+    # целое, BitVector в горячем пути не создаётся
+    @staticmethod
+    def format_code(word, bits):
+        return f"{(word >> (bits - 1)) & 1} {BitVector.to_string(word, bits - 1)}"
+
+    # Коды как целые числа: знак в старшем бите, модуль в младших bits - 1
+    def direct_word(self):
+        magnitude = abs(self.number) & ((1 << (self.bits - 1)) - 1)
+        if self.number >= 0:
+            return magnitude
+        return (1 << (self.bits - 1)) | magnitude
+
+    def reverse_word(self):
+        if self.number >= 0:
+            return self.direct_word()
+        magnitude_mask = (1 << (self.bits - 1)) - 1
+        return (1 << (self.bits - 1)) | (magnitude_mask ^ (abs(self.number) & magnitude_mask))
+
+    def additional_word(self):
+        if self.number >= 0:
+            return self.direct_word()
+        magnitude_mask = (1 << (self.bits - 1)) - 1
+        return (1 << (self.bits - 1)) | (self.number & magnitude_mask)
+
+    def vector(self, code="additional"):
+        if code not in Converter.CODES:
+            raise ValueError(f"Неизвестный код: {code}")
+        return BitVector(getattr(self, f"{code}_word")(), self.bits)
+
+    # Пакетный перевод массива целых чисел за один векторный проход
+    @staticmethod
+    def encode_many(values, bits=DEFAULT_BITS, code="additional", output="words"):
+        if code not in Converter.CODES:
+            raise ValueError(f"Неизвестный код: {code}")
+        if output not in Converter.OUTPUT_FORMATS:
+            raise ValueError(f"Неизвестный формат вывода: {output}")
+        if not 1 <= bits <= Converter.MAX_BATCH_BITS:
+            raise ValueError(f"Разрядность должна быть от 1 до {Converter.MAX_BATCH_BITS}")
+
+        values = np.asarray(values, dtype=np.int64)
+        negative = values < 0
+        sign_bit = np.uint64(1 << (bits - 1))
+        magnitude_mask = np.uint64((1 << (bits - 1)) - 1)
+        magnitude = np.abs(values).view(np.uint64)
+        positive_word = magnitude & magnitude_mask
+
+        if code == "direct":
+            negative_word = sign_bit | positive_word
+        elif code == "reverse":
+            negative_word = sign_bit | (magnitude_mask ^ positive_word)
+        else:
+            negative_word = sign_bit | (values.view(np.uint64) & magnitude_mask)
+        words = np.where(negative, negative_word, positive_word)
+
+        if code == "additional":
+            overflow = (values < -(1 << (bits - 1))) | (values > (1 << (bits - 1)) - 1)
+        else:
+            overflow = magnitude > magnitude_mask
+
+        if output == "words":
+            return words, overflow
+        bit_matrix = Converter.words_to_bits(words, bits)
+        if output == "bits":
+            return bit_matrix, overflow
+        return np.packbits(bit_matrix, axis=-1), overflow
+
+    @staticmethod
+    def words_to_bits(words, bits):
+        words = np.asarray(words, dtype=np.uint64)
+        as_bytes = words.astype(">u8").view(np.uint8).reshape(words.shape + (8,))
+        return np.unpackbits(as_bytes, axis=-1)[..., 64 - bits:]
+
+    @staticmethod
+    def format_many(words, bits):
+        return [Converter.format_code(int(word), bits) for word in np.asarray(words, dtype=np.uint64).ravel()]
+
+    # Коды повторяющихся пар (number, bits) берутся из общего кеша
+    @staticmethod
+    def cached_code(number, bits, code):
+        if code not in Converter.CODES:
+            raise ValueError(f"Неизвестный код: {code}")
+        return Converter.CACHE.get(number, bits, code)
+
+    @staticmethod
+    def _compute_code(number, bits, code):
+        return getattr(Converter(number, bits), f"{code}_code")()
+
+    @staticmethod
+    def _compute_table(bits, code):
+        offset = 1 << (bits - 1)
+        words, _ = Converter.encode_many(np.arange(-offset, offset), bits, code)
+        return Converter.format_many(words, bits)
+
     def make_it_binary(self):
         if self.number >= 0:
-            binary = ""
-            for i in range(self.bits - 1, -1, -1):
-                binary += "1" if (self.number & (1 << i)) else "0"
-            return binary
+            return self.to_binary(self.number, self.bits)
         else:
             raise ValueError("Number must be positive")
 
@@ -23,47 +128,21 @@ class Converter:
         print(" ")
 
     def direct_code(self):
-        sign = "0" if self.number >= 0 else "1"
-        abs_value = abs(self.number)
-        direct = Converter(abs_value, self.bits - 1).make_it_binary()
-        return f"{sign} {direct}"
+        return Converter.format_code(self.direct_word(), self.bits)
 
     def display_number_direct(self):
         print(f"Десятичное: {self.number}")
         print(f"Прямой код: {self.direct_code()}")
 
     def reverse_code(self):
-        if self.number >= 0:
-            return self.direct_code()
-        abs_value = abs(self.number)
-        direct = Converter(abs_value, self.bits - 1).make_it_binary()
-        reverse = ''.join('1' if bit == '0' else '0' for bit in direct)
-        return f"1 {reverse}"
+        return Converter.format_code(self.reverse_word(), self.bits)
 
     def display_number_reverse(self):
         print(f"Десятичное: {self.number}")
         print(f"Обратный код: {self.reverse_code()}")
 
     def additional_code(self):
-        if self.number >= 0:
-            direct = self.direct_code().split(" ")[1]
-            return f"0 {direct.zfill(self.bits - 1)}"
-
-        reverse = self.reverse_code().split(" ")[1]
-
-        initial_carry = self.CARRY_INITIAL
-        additional = ""
-        for bit in reversed(reverse):
-            if bit == "1" and initial_carry == 1:
-                additional = "0" + additional
-            elif bit == "0" and initial_carry == 1:
-                additional = "1" + additional
-
-                initial_carry = self.CARRY_RESET
-            else:
-                additional = bit + additional
-
-        return f"{self.BIT_SIGN_NEGATIVE} {additional.zfill(self.bits - 1)}"
+        return Converter.format_code(self.additional_word(), self.bits)
 
     def display_number_additional(self):
         print(f"Десятичное: {self.number}")
@@ -74,9 +153,9 @@ class Converter:
 
     def display_number_info(self):
         print(f"Число введено: {self.number}")
-        print(f"Прямой код: [{self.direct_code()}]")
-        print(f"Обратный код: [{self.reverse_code()}]")
-        print(f"Дополнительный код: [{self.additional_code()}]\n")
+        print(f"Прямой код: [{Converter.cached_code(self.number, self.bits, 'direct')}]")
+        print(f"Обратный код: [{Converter.cached_code(self.number, self.bits, 'reverse')}]")
+        print(f"Дополнительный код: [{Converter.cached_code(self.number, self.bits, 'additional')}]\n")
 
     def display_add_additional(self, result_decimal, result_additional, bits=8):
         converter = Converter(result_decimal, bits)
@@ -93,4 +172,4 @@ class Converter:
         print(f"Дополнительный код: [{converter.additional_code()}]")
 
 
-
+Converter.CACHE = CodeCache(Converter._compute_code, Converter._compute_table)
@@ -0,0 +1,347 @@
+import math
+import re
+
+import numpy as np
+
+from binary_calculator.ieee754_codec import IEEE754Codec
+from binary_calculator.profiling import Profiler
+
+
+class DecimalConversion:
+    FORMATS = (32, 64)
+
+    # Десятичные порядки, за которыми результат точно ноль или
+    # бесконечность, и диапазон, где у Эйзеля-Лемира бывает ровно середина
+    # между соседними числами (значения как в fast_float)
+    SMALLEST_POWER = {32: -65, 64: -342}
+    LARGEST_POWER = {32: 38, 64: 308}
+    ROUND_TO_EVEN_POWERS = {32: (-17, 10), 64: (-4, 23)}
+    SAFE_POWERS = (-27, 55)
+
+    TABLE_SMALLEST_POWER = -342
+    TABLE_LARGEST_POWER = 308
+    MAX_DIGITS = 19
+    WORD_BITS = 64
+    WORD_MASK = (1 << WORD_BITS) - 1
+
+    # Только цифры ASCII: \d приняла бы и другие десятичные цифры Unicode
+    NUMBER = re.compile(r"([+-]?)(?:([0-9]+)\.?([0-9]*)|\.([0-9]+))(?:[eE]([+-]?[0-9]+))?")
+    INFINITIES = ("inf", "infinity")
+    NAN = "nan"
+
+    # Максимальное конечное число binary32 плюс половина его ulp: double,
+    # равный этой границе, нельзя округлять до binary32 приведением типа
+    FLOAT32_OVERFLOW_MIDPOINT = 2.0 ** 128 - 2.0 ** 103
+
+    _power_table = None
+
+    # Перевод десятичных строк в слова binary32/binary64 с правильным
+    # округлением к ближайшему чётному и обратный вывод кратчайшей строки,
+    # которая читается обратно в то же слово
+    def __init__(self, bits=64):
+        if bits not in DecimalConversion.FORMATS:
+            raise ValueError(f"Поддерживаются только форматы: {list(DecimalConversion.FORMATS)}")
+        self.bits = bits
+        self.codec = IEEE754Codec(bits)
+        self.mantissa_bits = self.codec.mantissa_bits
+        self.bias = self.codec.bias
+        self.infinite_power = (1 << self.codec.exponent_bits) - 1
+        self.infinity_word = self.infinite_power << self.mantissa_bits
+        self.quiet_nan_word = self.infinity_word | (1 << (self.mantissa_bits - 1))
+
+    # 128-битные приближения 5^q, нормированные так, что старший бит -
+    # 127-й (таблица Эйзеля-Лемира); строится один раз при первом вызове
+    @staticmethod
+    def power_table():
+        if DecimalConversion._power_table is None:
+            table = []
+            for q in range(DecimalConversion.TABLE_SMALLEST_POWER, 0):
+                power5 = 5 ** -q
+                z = (power5 - 1).bit_length()
+                if q >= DecimalConversion.SAFE_POWERS[0]:
+                    table.append((1 << (z + 127)) // power5 + 1)
+                else:
+                    c = (1 << (2 * z + 128)) // power5 + 1
+                    table.append(c >> max(0, c.bit_length() - 128))
+            for q in range(DecimalConversion.TABLE_LARGEST_POWER + 1):
+                power5 = 5 ** q
+                shift = power5.bit_length() - 128
+                table.append(power5 >> shift if shift > 0 else power5 << -shift)
+            DecimalConversion._power_table = table
+        return DecimalConversion._power_table
+
+    # Разбор строки: знак, значащие цифры без ведущих нулей и десятичный
+    # порядок последней цифры; для inf и nan вместо цифр - их имя
+    @staticmethod
+    def split(text):
+        stripped = text.strip()
+        negative = stripped.startswith("-")
+        if DecimalConversion._special(stripped):
+            return negative, stripped.lstrip("+-").lower()[:3], 0
+
+        match = DecimalConversion.NUMBER.fullmatch(stripped)
+        if match is None:
+            raise ValueError(f"Некорректное десятичное число: {text!r}")
+        sign, integer_part, fraction_part, only_fraction, exponent = match.groups()
+        if only_fraction is not None:
+            integer_part, fraction_part = "", only_fraction
+
+        digits = (integer_part + fraction_part).lstrip("0")
+        exponent = int(exponent or 0) - len(fraction_part)
+        stripped_digits = digits.rstrip("0")
+        exponent += len(digits) - len(stripped_digits)
+        return sign == "-", stripped_digits, exponent
+
+    # Та же проверка записи, что в split, без разбора на цифры
+    @staticmethod
+    def check(text):
+        stripped = text.strip()
+        if not DecimalConversion._special(stripped) and DecimalConversion.NUMBER.fullmatch(stripped) is None:
+            raise ValueError(f"Некорректное десятичное число: {text!r}")
+
+    @staticmethod
+    def _special(stripped):
+        lowered = (stripped[1:] if stripped[:1] in ("+", "-") else stripped).lower()
+        return lowered in DecimalConversion.INFINITIES or lowered == DecimalConversion.NAN
+
+    @Profiler.profiled("DecimalConversion.parse_word")
+    def parse_word(self, text):
+        negative, digits, exponent = DecimalConversion.split(text)
+        sign = (1 << (self.bits - 1)) if negative else 0
+        if digits == "nan":
+            return sign | self.quiet_nan_word
+        if digits == "inf":
+            return sign | self.infinity_word
+        return sign | self._parse_digits(digits, exponent)
+
+    def parse(self, text):
+        return format(self.parse_word(text), f"0{self.bits}b")
+
+    def _parse_digits(self, digits, exponent):
+        if not digits or exponent + len(digits) <= DecimalConversion.SMALLEST_POWER[self.bits]:
+            return 0
+        if exponent + len(digits) - 1 > DecimalConversion.LARGEST_POWER[self.bits]:
+            return self.infinity_word
+
+        # Больше 19 цифр: если усечённое значение и оно же плюс единица
+        # младшего разряда округляются одинаково, ответ найден
+        if len(digits) <= DecimalConversion.MAX_DIGITS:
+            word = self._eisel_lemire(int(digits), exponent)
+        else:
+            shift = len(digits) - DecimalConversion.MAX_DIGITS
+            truncated = int(digits[:DecimalConversion.MAX_DIGITS])
+            word = self._eisel_lemire(truncated, exponent + shift)
+            if word is not None and word != self._eisel_lemire(truncated + 1, exponent + shift):
+                word = None
+        if word is None:
+            word = self._exact(int(digits), exponent)
+        return word
+
+    # Алгоритм Эйзеля-Лемира: w * 10^q через 128-битное приближение 5^q.
+    # None - редкий случай, когда приближения не хватает для решения.
+    def _eisel_lemire(self, w, q):
+        mask = DecimalConversion.WORD_MASK
+        if w == 0 or q < DecimalConversion.SMALLEST_POWER[self.bits]:
+            return 0
+        if q > DecimalConversion.LARGEST_POWER[self.bits]:
+            return self.infinity_word
+
+        leading_zeros = DecimalConversion.WORD_BITS - w.bit_length()
+        w <<= leading_zeros
+        power = DecimalConversion.power_table()[q - DecimalConversion.TABLE_SMALLEST_POWER]
+
+        product = w * (power >> DecimalConversion.WORD_BITS)
+        product_high, product_low = product >> DecimalConversion.WORD_BITS, product & mask
+        precision_mask = mask >> (self.mantissa_bits + 3)
+        if product_high & precision_mask == precision_mask:
+            product_low += (w * (power & mask)) >> DecimalConversion.WORD_BITS
+            if product_low > mask:
+                product_low &= mask
+                product_high += 1
+        if product_low == mask and not DecimalConversion.SAFE_POWERS[0] <= q <= DecimalConversion.SAFE_POWERS[1]:
+            return None
+
+        upper_bit = product_high >> 63
+        shift = upper_bit + DecimalConversion.WORD_BITS - self.mantissa_bits - 3
+        mantissa = product_high >> shift
+        power2 = (((152170 + 65536) * q) >> 16) + 63 + upper_bit - leading_zeros + self.bias
+
+        if power2 <= 0:
+            if -power2 + 1 >= DecimalConversion.WORD_BITS:
+                return 0
+            mantissa >>= -power2 + 1
+            mantissa = (mantissa + (mantissa & 1)) >> 1
+            power2 = 0 if mantissa < (1 << self.mantissa_bits) else 1
+            return (power2 << self.mantissa_bits) | mantissa
+
+        low_even, high_even = DecimalConversion.ROUND_TO_EVEN_POWERS[self.bits]
+        if product_low <= 1 and low_even <= q <= high_even and mantissa & 3 == 1:
+            if (mantissa << shift) == product_high:
+                mantissa &= ~1
+        mantissa = (mantissa + (mantissa & 1)) >> 1
+        if mantissa >= (2 << self.mantissa_bits):
+            mantissa = 1 << self.mantissa_bits
+            power2 += 1
+        if power2 >= self.infinite_power:
+            return self.infinity_word
+        return (power2 << self.mantissa_bits) | (mantissa & self.codec.mantissa_mask)
+
+    # Точное округление digits * 10^exponent на длинных целых
+    def _exact(self, digits, exponent):
+        if exponent >= 0:
+            numerator, denominator = digits * 10 ** exponent, 1
+        else:
+            numerator, denominator = digits, 10 ** -exponent
+
+        precision = self.mantissa_bits + 1
+        min_exponent = 1 - self.bias - self.mantissa_bits
+        binary_exponent = max(numerator.bit_length() - denominator.bit_length() - precision, min_exponent)
+        while True:
+            if binary_exponent >= 0:
+                scaled = denominator << binary_exponent
+                quotient, remainder = divmod(numerator, scaled)
+            else:
+                scaled = denominator
+                quotient, remainder = divmod(numerator << -binary_exponent, denominator)
+            if quotient >= (1 << precision):
+                binary_exponent += 1
+            elif quotient < (1 << (precision - 1)) and binary_exponent > min_exponent:
+                binary_exponent -= 1
+            else:
+                break
+
+        if 2 * remainder > scaled or (2 * remainder == scaled and quotient & 1):
+            quotient += 1
+            if quotient == 1 << precision:
+                quotient >>= 1
+                binary_exponent += 1
+
+        if quotient < (1 << self.mantissa_bits):
+            return quotient
+        biased = binary_exponent - min_exponent + 1
+        if biased >= self.infinite_power:
+            return self.infinity_word
+        return (biased << self.mantissa_bits) | (quotient & self.codec.mantissa_mask)
+
+    @Profiler.profiled("DecimalConversion.format_word")
+    def format_word(self, word):
+        sign, exponent, mantissa = self.codec.fields(word)
+        prefix = "-" if sign else ""
+        if exponent == self.infinite_power:
+            return DecimalConversion.NAN if mantissa else prefix + DecimalConversion.INFINITIES[0]
+        if exponent == 0 and mantissa == 0:
+            return prefix + "0.0"
+        digits, decimal_exponent = self.shortest(exponent, mantissa)
+        return prefix + DecimalConversion.format_digits(digits, decimal_exponent)
+
+    def format(self, bit_string):
+        if len(bit_string) != self.bits or set(bit_string) - {"0", "1"}:
+            raise ValueError(f"Ожидалась строка из {self.bits} двоичных разрядов")
+        return self.format_word(int(bit_string, 2))
+
+    # Кратчайшее digits * 10^exponent внутри интервала чисел, которые
+    # округляются в это слово (как у Ryu): сначала все кандидаты на шаге
+    # меньше ширины интервала, затем отбрасываются младшие цифры, пока в
+    # интервале остаётся кандидат; из оставшихся берётся ближайший
+    def shortest(self, exponent, mantissa):
+        if exponent == 0:
+            significand = mantissa
+            binary_exponent = 1 - self.bias - self.mantissa_bits
+        else:
+            significand = mantissa | (1 << self.mantissa_bits)
+            binary_exponent = exponent - self.bias - self.mantissa_bits
+        inclusive = significand % 2 == 0
+
+        # Значения в единицах 2^(binary_exponent - 2); у степени двойки
+        # нижний сосед вдвое ближе
+        value = 4 * significand
+        lower_gap = 1 if mantissa == 0 and exponent > 1 else 2
+        low, high = value - lower_gap, value + 2
+        shift = binary_exponent - 2
+
+        decimal_exponent = math.floor(math.log10(high - low) + shift * math.log10(2)) - 1
+        while True:
+            low_digit, high_digit = self._digit_bounds(low, high, shift, decimal_exponent, inclusive)
+            if low_digit <= high_digit:
+                break
+            decimal_exponent -= 1
+
+        while -(-low_digit // 10) <= high_digit // 10:
+            low_digit, high_digit = -(-low_digit // 10), high_digit // 10
+            decimal_exponent += 1
+
+        numerator, denominator = DecimalConversion._scaled(value, shift, decimal_exponent)
+        nearest, remainder = divmod(numerator, denominator)
+        if 2 * remainder > denominator or (2 * remainder == denominator and nearest & 1):
+            nearest += 1
+        return min(max(nearest, low_digit), high_digit), decimal_exponent
+
+    # x * 2^shift / 10^decimal_exponent как дробь целых
+    @staticmethod
+    def _scaled(x, shift, decimal_exponent):
+        numerator = x << max(shift, 0)
+        denominator = 1 << max(-shift, 0)
+        if decimal_exponent >= 0:
+            denominator *= 10 ** decimal_exponent
+        else:
+            numerator *= 10 ** -decimal_exponent
+        return numerator, denominator
+
+    @staticmethod
+    def _digit_bounds(low, high, shift, decimal_exponent, inclusive):
+        numerator, denominator = DecimalConversion._scaled(low, shift, decimal_exponent)
+        quotient, remainder = divmod(numerator, denominator)
+        low_digit = quotient + (1 if remainder or not inclusive else 0)
+        numerator, denominator = DecimalConversion._scaled(high, shift, decimal_exponent)
+        quotient, remainder = divmod(numerator, denominator)
+        high_digit = quotient - (0 if remainder or inclusive else 1)
+        return low_digit, high_digit
+
+    # Запись как у repr(float): обычная при порядке от -4 до 15, иначе
+    # экспоненциальная с двузначным порядком
+    @staticmethod
+    def format_digits(digits, decimal_exponent):
+        text = str(digits)
+        point = len(text) + decimal_exponent
+        scientific = point - 1
+        if -4 <= scientific < 16:
+            if decimal_exponent >= 0:
+                return text + "0" * decimal_exponent + ".0"
+            if point > 0:
+                return f"{text[:point]}.{text[point:]}"
+            return "0." + "0" * -point + text
+        mantissa = text[0] + ("." + text[1:] if len(text) > 1 else "")
+        return f"{mantissa}e{'+' if scientific >= 0 else '-'}{abs(scientific):02d}"
+
+    # Пакетный разбор столбца строк. Каждая строка сначала проверяется так
+    # же, как в parse_word (check), затем встроенный разбор в double
+    # округляет правильно; для binary32 повторное округление double
+    # безопасно, кроме double, попавших ровно на середину между соседними
+    # binary32, - такие строки разбираются parse_word по одной
+    @Profiler.profiled("DecimalConversion.parse_many")
+    def parse_many(self, texts):
+        texts = list(texts)
+        for text in texts:
+            DecimalConversion.check(text)
+        values = np.array(texts, dtype=np.float64)
+        if self.bits == 64:
+            return values.view(np.uint64)
+
+        with np.errstate(over="ignore"):
+            rounded = values.astype(np.float32)
+        direction = np.where(values >= rounded, np.float32(np.inf), np.float32(-np.inf))
+        neighbours = np.nextafter(rounded, direction)
+        midpoints = (rounded.astype(np.float64) + neighbours.astype(np.float64)) / 2
+        ambiguous = (midpoints == values) | (np.abs(values) == DecimalConversion.FLOAT32_OVERFLOW_MIDPOINT)
+
+        words = rounded.view(np.uint32).copy()
+        for index in np.flatnonzero(ambiguous):
+            words[index] = self.parse_word(texts[index])
+        return words
+
+    @Profiler.profiled("DecimalConversion.format_many")
+    def format_many(self, words):
+        words = np.asarray(words, dtype=self.codec.uint_type).ravel()
+        if self.bits == 64:
+            return [repr(value) for value in words.view(np.float64).tolist()]
+        return [self.format_word(word) for word in words.tolist()]
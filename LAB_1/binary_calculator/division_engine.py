@@ -0,0 +1,119 @@
+from binary_calculator.profiling import Profiler
+
+
+class DivisionEngine:
+    METHODS = ("integer", "restoring", "non_restoring", "srt_radix4")
+
+    # Сколько старших битов остатка и делителя видит таблица выбора цифры SRT
+    SRT_ESTIMATE_BITS = 8
+
+    # Целочисленное частное dividend // divisor для неотрицательных операндов
+    @staticmethod
+    @Profiler.profiled("DivisionEngine.divide")
+    def divide(dividend, divisor, method="integer"):
+        if method not in DivisionEngine.METHODS:
+            raise ValueError(f"Неизвестный метод деления: {method}")
+        if divisor == 0:
+            raise ZeroDivisionError("Деление на ноль невозможно!")
+        if dividend < 0 or divisor < 0:
+            raise ValueError("Делимое и делитель должны быть неотрицательными")
+        if method == "integer":
+            return dividend // divisor
+        if method == "restoring":
+            return DivisionEngine.restoring(dividend, divisor)
+        if method == "non_restoring":
+            return DivisionEngine.non_restoring(dividend, divisor)
+        return DivisionEngine.srt_radix4(dividend, divisor)
+
+    # Число битов целой части частного, которое даёт выравнивание делителя
+    # сдвигами влево до тех пор, пока он меньше делимого
+    @staticmethod
+    def integer_width(dividend, divisor):
+        shift_count = max(0, dividend.bit_length() - divisor.bit_length())
+        if (divisor << shift_count) < dividend:
+            shift_count += 1
+        return shift_count + 1
+
+    @staticmethod
+    def restoring(dividend, divisor):
+        remainder = dividend
+        quotient = 0
+        steps = max(0, dividend.bit_length() - divisor.bit_length())
+        for i in range(steps, -1, -1):
+            trial = remainder - (divisor << i)
+            if trial >= 0:
+                remainder = trial
+                quotient |= 1 << i
+        Profiler.count("bit_iterations", steps + 1)
+        return quotient
+
+    @staticmethod
+    def non_restoring(dividend, divisor):
+        steps = max(0, dividend.bit_length() - divisor.bit_length())
+        remainder = dividend - (divisor << steps)
+        quotient = 0
+        for i in range(steps, -1, -1):
+            if remainder >= 0:
+                quotient |= 1 << i
+                if i:
+                    remainder -= divisor << (i - 1)
+            elif i:
+                remainder += divisor << (i - 1)
+        Profiler.count("bit_iterations", steps + 1)
+        return quotient
+
+    # SRT с основанием 4 и избыточным набором цифр {-2, ..., 2}: цифра
+    # выбирается по усечённым оценкам остатка и делителя, а ошибка оценки
+    # поглощается избыточностью (|остаток| <= 2/3 делителя)
+    @staticmethod
+    def srt_radix4(dividend, divisor):
+        digits = max(0, (dividend.bit_length() - divisor.bit_length()) // 2)
+        while 3 * dividend > 2 * (divisor << (2 * digits)):
+            digits += 1
+
+        remainder = dividend
+        positive = 0
+        negative = 0
+        for step in range(digits - 1, -1, -1):
+            aligned_divisor = divisor << (2 * step)
+            digit = DivisionEngine._select_srt_digit(remainder, aligned_divisor)
+            remainder -= digit * aligned_divisor
+            if digit > 0:
+                positive |= digit << (2 * step)
+            elif digit < 0:
+                negative |= -digit << (2 * step)
+
+        quotient = positive - negative
+        Profiler.count("bit_iterations", 2 * digits)
+        if remainder < 0:
+            quotient -= 1
+        return quotient
+
+    @staticmethod
+    def _select_srt_digit(remainder, aligned_divisor):
+        shift = max(0, aligned_divisor.bit_length() - DivisionEngine.SRT_ESTIMATE_BITS)
+        remainder_estimate = remainder >> shift
+        divisor_estimate = aligned_divisor >> shift
+        if 2 * remainder_estimate >= 3 * divisor_estimate:
+            return 2
+        if 2 * remainder_estimate >= divisor_estimate:
+            return 1
+        if 2 * remainder_estimate >= -divisor_estimate:
+            return 0
+        if 2 * remainder_estimate >= -3 * divisor_estimate:
+            return -1
+        return -2
+
+    # Биты дробной части остатка remainder / divisor по одному, по мере
+    # получения; без precision генератор бесконечен
+    @staticmethod
+    def stream_bits(remainder, divisor, precision=None):
+        produced = 0
+        while precision is None or produced < precision:
+            remainder <<= 1
+            if remainder >= divisor:
+                remainder -= divisor
+                yield 1
+            else:
+                yield 0
+            produced += 1
@@ -0,0 +1,224 @@
+import numpy as np
+
+
+class FixedPoint:
+    OVERFLOW_MODES = ("saturate", "wrap")
+    DEFAULT_INTEGER_BITS = 7
+    DEFAULT_FRACTION_BITS = 8
+
+    __slots__ = ("raw", "integer_bits", "fraction_bits", "signed", "overflow")
+
+    # Формат Qm.n: m целых и n дробных разрядов, у знакового ещё знаковый
+    # разряд. Значение хранится целым raw = value * 2^n.
+    def __init__(self, raw, integer_bits=DEFAULT_INTEGER_BITS, fraction_bits=DEFAULT_FRACTION_BITS,
+                 signed=True, overflow="saturate"):
+        FixedPoint.check_format(integer_bits, fraction_bits, overflow)
+        self.integer_bits = integer_bits
+        self.fraction_bits = fraction_bits
+        self.signed = signed
+        self.overflow = overflow
+        self.raw = FixedPoint.fit(raw, *self.format())
+
+    @staticmethod
+    def check_format(integer_bits, fraction_bits, overflow):
+        if integer_bits < 0 or fraction_bits < 0:
+            raise ValueError("Число разрядов не может быть отрицательным")
+        if overflow not in FixedPoint.OVERFLOW_MODES:
+            raise ValueError(f"Неизвестный режим переполнения: {overflow}")
+
+    @staticmethod
+    def raw_range(integer_bits, fraction_bits, signed):
+        bits = integer_bits + fraction_bits
+        if signed:
+            return -(1 << bits), (1 << bits) - 1
+        return 0, (1 << bits) - 1
+
+    # Приведение к диапазону формата насыщением или отбрасыванием старших
+    # разрядов (как в регистре фиксированной длины)
+    @staticmethod
+    def fit(raw, integer_bits, fraction_bits, signed, overflow):
+        low, high = FixedPoint.raw_range(integer_bits, fraction_bits, signed)
+        if low <= raw <= high:
+            return raw
+        if overflow == "saturate":
+            return min(max(raw, low), high)
+        return ((raw - low) & (high - low)) + low
+
+    @staticmethod
+    def from_float(value, integer_bits=DEFAULT_INTEGER_BITS, fraction_bits=DEFAULT_FRACTION_BITS,
+                   signed=True, overflow="saturate"):
+        return FixedPoint(round(value * (1 << fraction_bits)), integer_bits, fraction_bits, signed, overflow)
+
+    def format(self):
+        return self.integer_bits, self.fraction_bits, self.signed, self.overflow
+
+    @property
+    def total_bits(self):
+        return self.integer_bits + self.fraction_bits + (1 if self.signed else 0)
+
+    def _same_format(self, other):
+        if not isinstance(other, FixedPoint) or other.format() != self.format():
+            raise ValueError("Операнды должны быть в одном формате Q")
+        return other
+
+    def _result(self, raw):
+        return FixedPoint(raw, *self.format())
+
+    def add(self, other):
+        return self._result(self.raw + self._same_format(other).raw)
+
+    def sub(self, other):
+        return self._result(self.raw - self._same_format(other).raw)
+
+    # Произведение имеет 2n дробных разрядов и округляется к ближайшему
+    def mul(self, other):
+        product = self.raw * self._same_format(other).raw
+        return self._result(FixedPoint.round_shift(product, self.fraction_bits))
+
+    def div(self, other):
+        divisor = self._same_format(other).raw
+        if divisor == 0:
+            raise ZeroDivisionError("Деление на ноль невозможно!")
+        return self._result(FixedPoint.round_divide(self.raw << self.fraction_bits, divisor))
+
+    # Округление к ближайшему, половина - в сторону +бесконечности
+    @staticmethod
+    def round_shift(value, shift):
+        if shift == 0:
+            return value
+        return (value + (1 << (shift - 1))) >> shift
+
+    @staticmethod
+    def round_divide(dividend, divisor):
+        if divisor < 0:
+            dividend, divisor = -dividend, -divisor
+        return (2 * dividend + divisor) // (2 * divisor)
+
+    def to_float(self):
+        return self.raw / (1 << self.fraction_bits)
+
+    # Двоичная запись дополнительного кода с точкой: "0011.0100"
+    def binary(self):
+        word = format(self.raw & ((1 << self.total_bits) - 1), f"0{self.total_bits}b")
+        point = self.total_bits - self.fraction_bits
+        if not self.fraction_bits:
+            return word
+        return f"{word[:point]}.{word[point:]}"
+
+    __add__ = add
+    __sub__ = sub
+    __mul__ = mul
+    __truediv__ = div
+
+    def __neg__(self):
+        return self._result(-self.raw)
+
+    def __float__(self):
+        return self.to_float()
+
+    def __eq__(self, other):
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        return (self.raw, self.format()) == (other.raw, other.format())
+
+    def __hash__(self):
+        return hash((self.raw, self.format()))
+
+    def __str__(self):
+        return self.binary()
+
+    def __repr__(self):
+        sign = "Q" if self.signed else "UQ"
+        return f"FixedPoint({self.to_float()}, {sign}{self.integer_bits}.{self.fraction_bits}, {self.overflow})"
+
+
+class FixedPointArray:
+    # Произведение двух слов и сдвинутое делимое (с удвоением при округлении)
+    # должны помещаться в int64
+    MAX_BITS = 30
+
+    # Массив значений одного формата Qm.n: все операции выполняются над
+    # целыми int64 без циклов Python
+    def __init__(self, raw, integer_bits=FixedPoint.DEFAULT_INTEGER_BITS,
+                 fraction_bits=FixedPoint.DEFAULT_FRACTION_BITS, signed=True, overflow="saturate"):
+        FixedPoint.check_format(integer_bits, fraction_bits, overflow)
+        if integer_bits + fraction_bits + (1 if signed else 0) > FixedPointArray.MAX_BITS:
+            raise ValueError(f"Разрядность массива не может превышать {FixedPointArray.MAX_BITS}")
+        self.integer_bits = integer_bits
+        self.fraction_bits = fraction_bits
+        self.signed = signed
+        self.overflow = overflow
+        self.raw = self._fit(np.asarray(raw, dtype=np.int64))
+
+    @staticmethod
+    def from_float(values, integer_bits=FixedPoint.DEFAULT_INTEGER_BITS,
+                   fraction_bits=FixedPoint.DEFAULT_FRACTION_BITS, signed=True, overflow="saturate"):
+        low, high = FixedPoint.raw_range(integer_bits, fraction_bits, signed)
+        scaled = np.rint(np.asarray(values, dtype=np.float64) * (1 << fraction_bits))
+        if overflow == "saturate":
+            scaled = np.clip(scaled, low, high)
+        else:
+            # Сначала ограничиваем, чтобы перевод в int64 был определён
+            scaled = np.clip(scaled, -2.0 ** 62, 2.0 ** 62)
+        return FixedPointArray(scaled.astype(np.int64), integer_bits, fraction_bits, signed, overflow)
+
+    def format(self):
+        return self.integer_bits, self.fraction_bits, self.signed, self.overflow
+
+    def _fit(self, raw):
+        low, high = FixedPoint.raw_range(self.integer_bits, self.fraction_bits, self.signed)
+        if self.overflow == "saturate":
+            return np.clip(raw, low, high)
+        return ((raw - low) & (high - low)) + low
+
+    def _same_format(self, other):
+        if not isinstance(other, FixedPointArray) or other.format() != self.format():
+            raise ValueError("Операнды должны быть в одном формате Q")
+        return other
+
+    def _result(self, raw):
+        return FixedPointArray(raw, *self.format())
+
+    def add(self, other):
+        return self._result(self.raw + self._same_format(other).raw)
+
+    def sub(self, other):
+        return self._result(self.raw - self._same_format(other).raw)
+
+    def mul(self, other):
+        product = self.raw * self._same_format(other).raw
+        if self.fraction_bits:
+            product = (product + (1 << (self.fraction_bits - 1))) >> self.fraction_bits
+        return self._result(product)
+
+    def div(self, other):
+        divisor = self._same_format(other).raw
+        if np.any(divisor == 0):
+            raise ZeroDivisionError("Деление на ноль невозможно!")
+        dividend = np.where(divisor < 0, -self.raw, self.raw) << self.fraction_bits
+        divisor = np.abs(divisor)
+        return self._result((2 * dividend + divisor) // (2 * divisor))
+
+    def to_float(self):
+        return self.raw / float(1 << self.fraction_bits)
+
+    def __getitem__(self, index):
+        raw = self.raw[index]
+        if np.ndim(raw) == 0:
+            return FixedPoint(int(raw), *self.format())
+        return self._result(raw)
+
+    def __len__(self):
+        return len(self.raw)
+
+    __add__ = add
+    __sub__ = sub
+    __mul__ = mul
+    __truediv__ = div
+
+    def __neg__(self):
+        return self._result(-self.raw)
+
+    def __repr__(self):
+        sign = "Q" if self.signed else "UQ"
+        return f"FixedPointArray({self.to_float()!r}, {sign}{self.integer_bits}.{self.fraction_bits}, {self.overflow})"
@@ -0,0 +1,137 @@
+import numpy as np
+
+from binary_calculator.adder_engine import AdderEngine
+from binary_calculator.profiling import Profiler
+
+
+class HardwareMultiplier:
+    ENCODINGS = ("booth2", "booth4")
+    TREES = ("wallace", "dadda")
+
+    # Произведение двух слов занимает 2 * bits разрядов и должно
+    # помещаться в uint64
+    MAX_BATCH_BITS = 32
+
+    # Задержка выбора частичного произведения по кодировке Бута
+    # (дешифратор цифры и мультиплексор) и вентили на разряд этого выбора
+    ENCODER_DELAY = 2
+    SELECT_GATES = 3
+
+    # Умножение в дополнительном коде: цифры множителя кодируются по Буту,
+    # частичные произведения сжимаются деревом Уоллеса или Дадды до двух
+    # слов, которые складывает final_adder. a и b - целые или массивы
+    # целых (bits <= 32), результат - слово из 2 * bits разрядов.
+    @staticmethod
+    @Profiler.profiled("HardwareMultiplier.multiply")
+    def multiply(a, b, bits, encoding="booth4", tree="wallace", final_adder="kogge_stone"):
+        if encoding not in HardwareMultiplier.ENCODINGS:
+            raise ValueError(f"Неизвестная кодировка множителя: {encoding}")
+        if tree not in HardwareMultiplier.TREES:
+            raise ValueError(f"Неизвестное дерево сжатия: {tree}")
+        if bits < 1:
+            raise ValueError("Разрядность должна быть положительной")
+
+        if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+            if bits > HardwareMultiplier.MAX_BATCH_BITS:
+                raise ValueError(f"Для массивов разрядность не может превышать {HardwareMultiplier.MAX_BATCH_BITS}")
+            a = np.asarray(a, dtype=np.int64).astype(np.uint64)
+            b = np.asarray(b, dtype=np.int64).astype(np.uint64)
+
+        width = 2 * bits
+        partial_products, zero_products = HardwareMultiplier.partial_products(a, b, bits, encoding)
+        rows, stages = HardwareMultiplier.reduce(partial_products, width, tree)
+        product, _, adder_stats = AdderEngine.add(rows[0], rows[1], width, final_adder)
+
+        compressors = sum(stage["compressors"] for stage in stages)
+        stats = {
+            "encoding": encoding,
+            "tree": tree,
+            "final_adder": final_adder,
+            "bits": bits,
+            "partial_products": len(partial_products),
+            "zero_partial_products": zero_products,
+            "stages": stages,
+            "gate_delay": (HardwareMultiplier.ENCODER_DELAY + AdderEngine.COMPRESSOR_DELAY * len(stages)
+                           + adder_stats["gate_delay"]),
+            "gates": (HardwareMultiplier.SELECT_GATES * width * len(partial_products)
+                      + AdderEngine.COMPRESSOR_GATES * width * compressors + adder_stats["gates"]),
+        }
+        return product, stats
+
+    # Знаковое расширение слова до width разрядов
+    @staticmethod
+    def _extend(value, bits, width):
+        sign = 1 << (bits - 1)
+        return (((value & ((1 << bits) - 1)) ^ sign) - sign) & ((1 << width) - 1)
+
+    @staticmethod
+    def _count(flags):
+        return int(np.sum(flags))
+
+    # Частичные произведения (слова 2 * bits, уже сдвинутые на свой вес) и
+    # число нулевых среди них. Радикс 2: цифра b[i-1] - b[i] из {-1, 0, 1};
+    # радикс 4: цифра -2b[2i+1] + b[2i] + b[2i-1] из {-2, ..., 2}.
+    # Отрицательное кратное - инверсия плюс единица в младший разряд.
+    @staticmethod
+    def partial_products(a, b, bits, encoding="booth4"):
+        width = 2 * bits
+        mask = (1 << width) - 1
+        multiplicand = HardwareMultiplier._extend(a, bits, width)
+        multiplier = HardwareMultiplier._extend(b, bits, width)
+
+        def bit(position):
+            return (multiplier >> position) & 1 if position >= 0 else multiplier & 0
+
+        products = []
+        zero_products = 0
+        if encoding == "booth2":
+            for i in range(bits):
+                negative = bit(i) & (bit(i - 1) ^ 1)
+                one = bit(i) ^ bit(i - 1)
+                selected = ((multiplicand ^ ((0 - negative) & mask)) + negative) & ((0 - one) & mask)
+                products.append((selected << i) & mask)
+                zero_products += HardwareMultiplier._count(one ^ 1)
+        else:
+            for i in range(0, bits, 2):
+                high, middle, low = bit(i + 1), bit(i), bit(i - 1)
+                one = middle ^ low
+                two = (one ^ 1) & (high ^ middle)
+                negative = high & ((middle & low) ^ 1)
+                multiple = (multiplicand & ((0 - one) & mask)) | ((multiplicand << 1) & ((0 - two) & mask))
+                selected = ((multiple ^ ((0 - negative) & mask)) + negative) & ((0 - (one | two)) & mask)
+                products.append((selected << i) & mask)
+                zero_products += HardwareMultiplier._count((one | two) ^ 1)
+        return products, zero_products
+
+    # Сжатие строк частичных произведений сумматорами 3:2 над целыми
+    # словами. Уоллес сжимает на каждом этапе все полные тройки строк,
+    # Дадда - только столько, сколько нужно для перехода к следующей высоте
+    # из ряда 2, 3, 4, 6, 9, 13, ...
+    @staticmethod
+    def reduce(rows, width, tree="wallace"):
+        mask = (1 << width) - 1
+        rows = list(rows)
+        while len(rows) < 2:
+            rows.append(rows[0] & 0 if rows else 0)
+
+        heights = [2]
+        while heights[-1] < len(rows):
+            heights.append(heights[-1] * 3 // 2)
+
+        stages = []
+        while len(rows) > 2:
+            if tree == "wallace":
+                compressors = len(rows) // 3
+            else:
+                target = max(height for height in heights if height < len(rows))
+                compressors = len(rows) - target
+
+            reduced = []
+            for i in range(compressors):
+                x, y, z = rows[3 * i:3 * i + 3]
+                reduced.append(x ^ y ^ z)
+                reduced.append((((x & y) | (x & z) | (y & z)) << 1) & mask)
+            stages.append({"rows": len(rows), "compressors": compressors,
+                           "rows_after": len(rows) - compressors})
+            rows = reduced + rows[3 * compressors:]
+        return rows, stages
@@ -0,0 +1,88 @@
+import numbers
+import struct
+
+import numpy as np
+
+
+class IEEE754Codec:
+    # bits: (формат struct, тип с плавающей точкой, беззнаковый тип, биты порядка, биты мантиссы)
+    FORMATS = {
+        16: (">e", np.float16, np.uint16, 5, 10),
+        32: (">f", np.float32, np.uint32, 8, 23),
+        64: (">d", np.float64, np.uint64, 11, 52),
+    }
+
+    ZERO = 0
+    SUBNORMAL = 1
+    NORMAL = 2
+    INFINITY = 3
+    NAN = 4
+    CLASS_NAMES = ("zero", "subnormal", "normal", "infinity", "nan")
+
+    def __init__(self, bits=32):
+        if bits not in IEEE754Codec.FORMATS:
+            raise ValueError(f"Поддерживаются только форматы: {sorted(IEEE754Codec.FORMATS)}")
+        self.bits = bits
+        (self.struct_format, self.float_type, self.uint_type,
+         self.exponent_bits, self.mantissa_bits) = IEEE754Codec.FORMATS[bits]
+        self.bias = (1 << (self.exponent_bits - 1)) - 1
+        self.sign_mask = 1 << (bits - 1)
+        self.exponent_mask = ((1 << self.exponent_bits) - 1) << self.mantissa_bits
+        self.mantissa_mask = (1 << self.mantissa_bits) - 1
+
+    # Скалярное кодирование: struct округляет к ближайшему чётному и честно
+    # обрабатывает субнормальные числа, бесконечности и NaN
+    def encode_word(self, value):
+        if isinstance(value, bool) or not isinstance(value, numbers.Real):
+            raise TypeError(f"Ожидалось число, получено: {type(value).__name__}")
+        try:
+            packed = struct.pack(self.struct_format, value)
+        except OverflowError:
+            sign = self.sign_mask if value < 0 else 0
+            return sign | self.exponent_mask
+        return int.from_bytes(packed, "big")
+
+    def encode(self, value):
+        return format(self.encode_word(value), f"0{self.bits}b")
+
+    def decode_word(self, word):
+        return struct.unpack(self.struct_format, word.to_bytes(self.bits // 8, "big"))[0]
+
+    def decode(self, bit_string):
+        if len(bit_string) != self.bits or set(bit_string) - {"0", "1"}:
+            raise ValueError(f"Ожидалась строка из {self.bits} двоичных разрядов")
+        return self.decode_word(int(bit_string, 2))
+
+    def fields(self, word):
+        return (word >> (self.bits - 1),
+                (word & self.exponent_mask) >> self.mantissa_bits,
+                word & self.mantissa_mask)
+
+    def classify(self, word):
+        return int(self.classify_many(np.array([word], dtype=self.uint_type))[0])
+
+    # Пакетные операции: перевод через приведение типа и view без циклов
+    def encode_many(self, values):
+        with np.errstate(over="ignore", invalid="ignore"):
+            return np.asarray(values).astype(self.float_type).view(self.uint_type)
+
+    # Тип слов задаётся сразу: список целых Python со словами от 2^63 и
+    # меньше NumPy иначе прочитал бы как float64 с потерей разрядов
+    def decode_many(self, words):
+        return np.asarray(words, dtype=self.uint_type).view(self.float_type)
+
+    def classify_many(self, words):
+        words = np.asarray(words, dtype=self.uint_type)
+        exponent = words & self.uint_type(self.exponent_mask)
+        mantissa = words & self.uint_type(self.mantissa_mask)
+        exponent_max = self.uint_type(self.exponent_mask)
+
+        classes = np.full(words.shape, IEEE754Codec.NORMAL, dtype=np.uint8)
+        classes[(exponent == 0) & (mantissa == 0)] = IEEE754Codec.ZERO
+        classes[(exponent == 0) & (mantissa != 0)] = IEEE754Codec.SUBNORMAL
+        classes[(exponent == exponent_max) & (mantissa == 0)] = IEEE754Codec.INFINITY
+        classes[(exponent == exponent_max) & (mantissa != 0)] = IEEE754Codec.NAN
+        return classes
+
+    def to_bit_strings(self, words):
+        return [format(int(word), f"0{self.bits}b") for word in np.asarray(words, dtype=self.uint_type).ravel()]
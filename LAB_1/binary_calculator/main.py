@@ -1,10 +1,18 @@
+import argparse
+import sys
+from contextlib import ExitStack
+
+from binary_calculator.batch import BatchProcessor
 from binary_calculator.converter import *
 from binary_calculator.add_sub import *
+from binary_calculator.profiling import Profiler
 from operations import Operations
 from standart_ieee754 import StandartIEEE754
 
 
 class Main:
+    STREAM_PATH = "-"
+
     def menu(self):
         print("Выберите операцию: ")
         print("1. Перевести число в двоичную систему счисления.")
@@ -113,8 +121,8 @@ class Main:
 
                 elif choice == 9:
                     print("Сложение чисел с плавающей точкой StandartIEEE754:")
-                    number_1 = float(input("Ввод числа №1\n"))
-                    number_2 = float(input("Ввод числа №2\n"))
+                    number_1 = input("Ввод числа №1\n").strip()
+                    number_2 = input("Ввод числа №2\n").strip()
 
                     standart = StandartIEEE754(number_1, number_2)
 
@@ -122,12 +130,12 @@ class Main:
                     ieee_number_2 = standart.float_to_ieee754(number_2)
 
                     ieee_result = standart.ieee754_addition()
-                    result_float = standart.ieee754_to_float(ieee_result)
+                    result_decimal = standart.ieee754_to_decimal(ieee_result)
 
                     print(f"Число A ({number_1}) -> IEEE-754: {ieee_number_1}")
                     print(f"Число B ({number_2}) -> IEEE-754: {ieee_number_2}")
                     print(f"Сумма в IEEE-754 формате: {ieee_result}")
-                    print(f"Сумма в десятичном формате: {result_float}")
+                    print(f"Сумма в десятичном формате: {result_decimal}")
 
 
                 elif choice == 10:
@@ -145,6 +153,49 @@ class Main:
         finally:
             print("Завершение программы.")
 
+    # Пакетный режим: операции читаются из CSV/JSONL файла или stdin,
+    # результаты пишутся в том же формате
+    @staticmethod
+    def parse_arguments(arguments=None):
+        parser = argparse.ArgumentParser(description="Двоичный калькулятор")
+        parser.add_argument("--batch", nargs="?", const=Main.STREAM_PATH, metavar="FILE",
+                            help="файл с операциями (без имени или '-' - stdin)")
+        parser.add_argument("--format", choices=BatchProcessor.FORMATS,
+                            help="формат записей (по умолчанию по расширению, иначе jsonl)")
+        parser.add_argument("--output", default=Main.STREAM_PATH, metavar="FILE",
+                            help="файл результатов (по умолчанию stdout)")
+        parser.add_argument("--workers", type=int, default=1, help="число процессов")
+        parser.add_argument("--chunk-size", type=int, default=BatchProcessor.CHUNK_SIZE,
+                            help="записей в одном пакете")
+        parser.add_argument("--profile", metavar="FILE",
+                            help="записать профиль операций в JSON (учитывается только текущий процесс)")
+        return parser.parse_args(arguments)
+
+    def run_batch(self, arguments):
+        file_format = arguments.format
+        if file_format is None:
+            file_format = "csv" if arguments.batch.endswith(".csv") else "jsonl"
+        processor = BatchProcessor(file_format, arguments.workers, arguments.chunk_size)
+
+        with ExitStack() as stack:
+            input_stream = sys.stdin
+            if arguments.batch != Main.STREAM_PATH:
+                input_stream = stack.enter_context(open(arguments.batch, newline="", encoding="utf-8"))
+            output_stream = sys.stdout
+            if arguments.output != Main.STREAM_PATH:
+                output_stream = stack.enter_context(open(arguments.output, "w", newline="", encoding="utf-8"))
+            if arguments.profile is None:
+                return processor.process(input_stream, output_stream)
+            with Profiler.session():
+                processed = processor.process(input_stream, output_stream)
+            Profiler.to_json(arguments.profile)
+            return processed
+
+
 if __name__ == '__main__':
+    arguments = Main.parse_arguments()
     program = Main()
-    program.run()
\ No newline at end of file
+    if arguments.batch is None:
+        program.run()
+    else:
+        program.run_batch(arguments)
\ No newline at end of file
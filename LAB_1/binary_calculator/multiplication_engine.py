@@ -0,0 +1,192 @@
+from array import array
+
+from binary_calculator.profiling import Profiler
+
+
+class MultiplicationEngine:
+    LIMB_BITS = 32
+    LIMB_MASK = (1 << LIMB_BITS) - 1
+    LIMB_TYPECODE = "Q"
+
+    # Порог перехода schoolbook -> Toom-3 в лимбах по таблице
+    # benchmarks/bench_multiplication.py: Toom-3 обгоняет schoolbook с 24
+    # лимбов (768 бит). Karatsuba в таблице ни на одной длине не быстрее
+    # обоих, поэтому выбирается только явно.
+    TOOM3_THRESHOLD = 24
+
+    ALGORITHMS = ("auto", "schoolbook", "karatsuba", "toom3")
+
+    @staticmethod
+    def to_limbs(number):
+        if number < 0:
+            raise ValueError("Лимбы строятся только для неотрицательных чисел")
+        limbs = array(MultiplicationEngine.LIMB_TYPECODE)
+        while number:
+            limbs.append(number & MultiplicationEngine.LIMB_MASK)
+            number >>= MultiplicationEngine.LIMB_BITS
+        return limbs
+
+    @staticmethod
+    def from_limbs(limbs):
+        number = 0
+        for limb in reversed(limbs):
+            number = (number << MultiplicationEngine.LIMB_BITS) | limb
+        return number
+
+    @staticmethod
+    def select_algorithm(limb_count):
+        if limb_count < MultiplicationEngine.TOOM3_THRESHOLD:
+            return "schoolbook"
+        return "toom3"
+
+    # Умножение модулей: a и b неотрицательные целые. По умолчанию (auto) -
+    # встроенное умножение int, модели на лимбах (schoolbook, karatsuba,
+    # toom3) выполняются только по явному запросу
+    @staticmethod
+    @Profiler.profiled("MultiplicationEngine.multiply")
+    def multiply(a, b, algorithm="auto"):
+        if algorithm not in MultiplicationEngine.ALGORITHMS:
+            raise ValueError(f"Неизвестный алгоритм умножения: {algorithm}")
+        if algorithm == "auto" or (a <= MultiplicationEngine.LIMB_MASK and b <= MultiplicationEngine.LIMB_MASK):
+            return a * b
+        limbs_a = MultiplicationEngine.to_limbs(a)
+        limbs_b = MultiplicationEngine.to_limbs(b)
+        return MultiplicationEngine.from_limbs(MultiplicationEngine.multiply_limbs(limbs_a, limbs_b, algorithm))
+
+    # Умножение массивов лимбов; auto выбирает модель по TOOM3_THRESHOLD
+    @staticmethod
+    def multiply_limbs(a, b, algorithm="auto"):
+        if algorithm == "auto":
+            algorithm = MultiplicationEngine.select_algorithm(min(len(a), len(b)))
+        if algorithm == "schoolbook":
+            return MultiplicationEngine.schoolbook(a, b)
+        if algorithm == "karatsuba":
+            return MultiplicationEngine.karatsuba(a, b)
+        return MultiplicationEngine.toom3(a, b)
+
+    @staticmethod
+    def schoolbook(a, b):
+        bits = MultiplicationEngine.LIMB_BITS
+        mask = MultiplicationEngine.LIMB_MASK
+        result = array(MultiplicationEngine.LIMB_TYPECODE, bytes(8 * (len(a) + len(b))))
+        for i, limb_a in enumerate(a):
+            if not limb_a:
+                continue
+            carry = 0
+            for j, limb_b in enumerate(b):
+                total = result[i + j] + limb_a * limb_b + carry
+                result[i + j] = total & mask
+                carry = total >> bits
+            result[i + len(b)] = carry
+        return MultiplicationEngine._normalize(result)
+
+    # Karatsuba и Toom-3 выполняют одно разбиение, а части умножаются с
+    # автоматическим выбором алгоритма по их длине
+    @staticmethod
+    def karatsuba(a, b):
+        if min(len(a), len(b)) < 2:
+            return MultiplicationEngine.schoolbook(a, b)
+
+        half = max(len(a), len(b)) // 2
+        a_low, a_high = MultiplicationEngine._normalize(a[:half]), a[half:]
+        b_low, b_high = MultiplicationEngine._normalize(b[:half]), b[half:]
+
+        z0 = MultiplicationEngine.multiply_limbs(a_low, b_low)
+        z2 = MultiplicationEngine.multiply_limbs(a_high, b_high)
+        z1 = MultiplicationEngine.multiply_limbs(MultiplicationEngine._add(a_low, a_high),
+                                                 MultiplicationEngine._add(b_low, b_high))
+        z1 = MultiplicationEngine._sub(MultiplicationEngine._sub(z1, z0), z2)
+
+        result = array(MultiplicationEngine.LIMB_TYPECODE, bytes(8 * (len(a) + len(b) + 1)))
+        MultiplicationEngine._add_into(result, z0, 0)
+        MultiplicationEngine._add_into(result, z1, half)
+        MultiplicationEngine._add_into(result, z2, 2 * half)
+        return MultiplicationEngine._normalize(result)
+
+    # Toom-3: точки 0, 1, -1, -2, бесконечность; интерполяция по схеме Бодрато.
+    # Вычисление и интерполяция линейны и выполняются над целыми, а пять
+    # поточечных произведений рекурсивно умножаются на массивах лимбов.
+    @staticmethod
+    def toom3(a, b):
+        if min(len(a), len(b)) < 3:
+            return MultiplicationEngine.schoolbook(a, b)
+
+        part = (max(len(a), len(b)) + 2) // 3
+        a0, a1, a2 = MultiplicationEngine._split3(a, part)
+        b0, b1, b2 = MultiplicationEngine._split3(b, part)
+
+        p0 = MultiplicationEngine._signed_multiply(a0, b0)
+        p1 = MultiplicationEngine._signed_multiply(a0 + a1 + a2, b0 + b1 + b2)
+        p_minus_1 = MultiplicationEngine._signed_multiply(a0 - a1 + a2, b0 - b1 + b2)
+        p_minus_2 = MultiplicationEngine._signed_multiply(a0 - 2 * a1 + 4 * a2, b0 - 2 * b1 + 4 * b2)
+        p_infinity = MultiplicationEngine._signed_multiply(a2, b2)
+
+        r0 = p0
+        r4 = p_infinity
+        r3 = (p_minus_2 - p1) // 3
+        r1 = (p1 - p_minus_1) // 2
+        r2 = p_minus_1 - p0
+        r3 = (r2 - r3) // 2 + 2 * p_infinity
+        r2 = r2 + r1 - r4
+        r1 = r1 - r3
+
+        shift = part * MultiplicationEngine.LIMB_BITS
+        product = r0 + (r1 << shift) + (r2 << (2 * shift)) + (r3 << (3 * shift)) + (r4 << (4 * shift))
+        return MultiplicationEngine.to_limbs(product)
+
+    @staticmethod
+    def _split3(limbs, part):
+        return tuple(MultiplicationEngine.from_limbs(limbs[i * part:(i + 1) * part]) for i in range(3))
+
+    @staticmethod
+    def _signed_multiply(a, b):
+        product = MultiplicationEngine.from_limbs(MultiplicationEngine.multiply_limbs(
+            MultiplicationEngine.to_limbs(abs(a)), MultiplicationEngine.to_limbs(abs(b))))
+        return -product if (a < 0) != (b < 0) else product
+
+    @staticmethod
+    def _normalize(limbs):
+        end = len(limbs)
+        while end and not limbs[end - 1]:
+            end -= 1
+        return limbs[:end] if end != len(limbs) else limbs
+
+    @staticmethod
+    def _add(a, b):
+        if len(a) < len(b):
+            a, b = b, a
+        result = array(MultiplicationEngine.LIMB_TYPECODE, a)
+        result.append(0)
+        MultiplicationEngine._add_into(result, b, 0)
+        return MultiplicationEngine._normalize(result)
+
+    @staticmethod
+    def _add_into(target, limbs, offset):
+        bits = MultiplicationEngine.LIMB_BITS
+        mask = MultiplicationEngine.LIMB_MASK
+        carry = 0
+        i = offset
+        for limb in limbs:
+            total = target[i] + limb + carry
+            target[i] = total & mask
+            carry = total >> bits
+            i += 1
+        while carry:
+            total = target[i] + carry
+            target[i] = total & mask
+            carry = total >> bits
+            i += 1
+
+    # Вычитание модулей, a >= b
+    @staticmethod
+    def _sub(a, b):
+        mask = MultiplicationEngine.LIMB_MASK
+        result = array(MultiplicationEngine.LIMB_TYPECODE, a)
+        borrow = 0
+        for i in range(len(result)):
+            if i >= len(b) and not borrow:
+                break
+            total = result[i] - (b[i] if i < len(b) else 0) - borrow
+            borrow = 1 if total < 0 else 0
+            result[i] = total & mask
+        return MultiplicationEngine._normalize(result)
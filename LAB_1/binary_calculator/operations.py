@@ -1,4 +1,12 @@
+import numpy as np
+
+from binary_calculator.bit_vector import BitVector
 from binary_calculator.converter import *
+from binary_calculator.division_engine import DivisionEngine
+from binary_calculator.hardware_multiplier import HardwareMultiplier
+from binary_calculator.multiplication_engine import MultiplicationEngine
+from binary_calculator.profiling import Profiler
+from binary_calculator.wide_word import WideWord
 
 class Operations:
     DEFAULT_BITS = 8
@@ -13,111 +21,119 @@ class Operations:
         self.bits = bits
 
     # Умножение прямой код
-    def multiply_direct(self):
-        number_1_direct = self.direct_code(self.number_1)
-        number_2_direct = self.direct_code(self.number_2)
-
-        sign_1 = int(number_1_direct[0])
-        sign_2 = int(number_2_direct[0])
+    @Profiler.profiled("Operations.multiply_direct")
+    def multiply_direct(self, full_width=False, algorithm="auto"):
+        result_abs = MultiplicationEngine.multiply(abs(self.number_1), abs(self.number_2), algorithm)
 
-        number_1_abs = int(number_1_direct[1:], 2)
-        number_2_abs = int(number_2_direct[1:], 2)
+        result_sign = 0 if (self.number_1 < 0) == (self.number_2 < 0) else 1
 
-        result_abs = number_1_abs * number_2_abs
+        result_bits = 2 * self.bits if full_width else self.bits
+        max_value = (1 << (result_bits - 1)) - 1
+        if result_abs > max_value:
+            raise OverflowError(f"Переполнение: результат не помещается в {result_bits} бит.")
 
-        result_sign = "0" if sign_1 == sign_2 else "1"
+        result_direct = BitVector((result_sign << (result_bits - 1)) | result_abs, result_bits)
 
-        max_value = (1 << (self.bits - 1)) - 1
-        if result_abs > max_value:
-            OVERFLOW_ERROR = "Переполнение: результат {result_abs} не помещается в {self.bits} бит."
-            raise OverflowError(OVERFLOW_ERROR)
+        result_decimal = -result_abs if result_sign else result_abs
 
-        result_binary = bin(result_abs)[2:].zfill(self.bits - 1)
-        result_binary = result_sign + result_binary
+        return result_decimal, str(result_direct)
 
-        result_decimal = -result_abs if result_sign == "1" else result_abs
+    # Умножение в прямом коде для широких слов без промежуточных строк
+    @Profiler.profiled("Operations.multiply_wide")
+    def multiply_wide(self, full_width=False, algorithm="auto"):
+        result_abs = MultiplicationEngine.multiply(abs(self.number_1), abs(self.number_2), algorithm)
 
-        return result_decimal, result_binary
+        result_bits = 2 * self.bits if full_width else self.bits
+        max_value = (1 << (result_bits - 1)) - 1
+        if result_abs > max_value:
+            raise OverflowError(f"Переполнение: результат не помещается в {result_bits} бит.")
+
+        negative = (self.number_1 < 0) != (self.number_2 < 0)
+        result_decimal = -result_abs if negative else result_abs
+
+        return result_decimal, WideWord(result_decimal, result_bits, code="direct", negative=negative)
+
+    # Умножение на модели аппаратного умножителя (см. HardwareMultiplier):
+    # произведение в дополнительном коде из 2 * bits разрядов и статистика
+    # частичных произведений по этапам сжатия
+    @Profiler.profiled("Operations.multiply_hardware")
+    def multiply_hardware(self, encoding="booth4", tree="wallace"):
+        limit = 1 << (self.bits - 1)
+        for number in (self.number_1, self.number_2):
+            if not -limit <= number < limit:
+                raise OverflowError(f"Переполнение: число {number} не помещается в {self.bits} бит.")
+
+        product, stats = HardwareMultiplier.multiply(self.number_1, self.number_2, self.bits, encoding, tree)
+        result_additional = BitVector(product, 2 * self.bits)
+        return result_additional.to_signed(), str(result_additional), stats
+
+    # Пакетный вариант multiply_hardware: операнды берутся по модулю 2^bits
+    @staticmethod
+    @Profiler.profiled("Operations.multiply_many_hardware")
+    def multiply_many_hardware(numbers_1, numbers_2, bits=DEFAULT_BITS, encoding="booth4", tree="wallace"):
+        product, stats = HardwareMultiplier.multiply(np.asarray(numbers_1), np.asarray(numbers_2),
+                                                     bits, encoding, tree)
+        extend_shift = 64 - 2 * bits
+        result_decimal = (product << np.uint64(extend_shift)).view(np.int64) >> np.int64(extend_shift)
+        return result_decimal, product, stats
 
     # Деление прямой код
-    def binary_divide(self, precision=DEFAULT_PRECISION):
+    @Profiler.profiled("Operations.binary_divide")
+    def binary_divide(self, precision=DEFAULT_PRECISION, method="integer"):
         if self.number_2 == 0:
             DIVISION_BY_ZERO_ERROR = "Деление на ноль невозможно!"
             raise ZeroDivisionError(DIVISION_BY_ZERO_ERROR)
 
-        def direct_code(n):
-            if n >= 0:
-                return f"0{n:0{self.bits - 1}b}"
-            else:
-                return f"1{(-n):0{self.bits - 1}b}"
-
-        number_1_direct = direct_code(self.number_1)
-        number_2_direct = direct_code(self.number_2)
+        result_sign = "0" if (self.number_1 < 0) == (self.number_2 < 0) else "1"
 
-        sign_1 = int(number_1_direct[0])
-        sign_2 = int(number_2_direct[0])
-        result_sign = "0" if sign_1 == sign_2 else "1"
+        dividend = abs(self.number_1) # делимое
+        divisor = abs(self.number_2) # делитель
 
-        dividend = int(number_1_direct[1:], 2) # делимое
-        divisor = int(number_2_direct[1:], 2) # делитель
+        # Частное сразу со всеми дробными битами как одно целое число
+        quotient = DivisionEngine.divide(dividend << precision, divisor, method)
 
-        shift_count = 0
-        while divisor < dividend:
-            divisor <<= 1
-            shift_count += 1
+        integer_part = format(quotient >> precision, f"0{DivisionEngine.integer_width(dividend, divisor)}b")
+        fractional_part = format(quotient & ((1 << precision) - 1), f"0{precision}b") if precision else ""
 
-        quotient = ""
-
-        for _ in range(shift_count + 1):
-            if dividend >= divisor:
-                quotient += "1"
-                dividend -= divisor
-            else:
-                quotient += "0"
-            divisor >>= 1
+        decimal_value = quotient / (1 << precision)
+        if result_sign == "1":
+            decimal_value = -decimal_value
 
         BINARY_POINT = "."
-        quotient += BINARY_POINT
-
-        for _ in range(precision):
-            dividend <<= 1
-            if dividend >= int(number_2_direct[1:], 2):
-                quotient += "1"
-                dividend -= int(number_2_direct[1:], 2)
-            else:
-                quotient += "0"
+        res_binary = result_sign + integer_part + BINARY_POINT + fractional_part
 
-        integer_part, fractional_part = quotient.split(".")
-        decimal_value = int(integer_part, 2) + sum(
-            int(bit) * (2 ** -(i + 1)) for i, bit in enumerate(fractional_part)
-        )
+        return decimal_value, res_binary
 
-        if result_sign == "1":
-            decimal_value = -decimal_value
+    # Потоковое деление: символы результата binary_divide выдаются по мере
+    # получения, дробные биты - без ограничения точности
+    def iter_binary_divide(self):
+        if self.number_2 == 0:
+            raise ZeroDivisionError("Деление на ноль невозможно!")
 
-        res_binary = result_sign + integer_part + "." + fractional_part
+        dividend = abs(self.number_1)
+        divisor = abs(self.number_2)
+        integer_part, remainder = divmod(dividend, divisor)
 
-        return decimal_value, res_binary
+        yield "0" if (self.number_1 < 0) == (self.number_2 < 0) else "1"
+        yield from format(integer_part, f"0{DivisionEngine.integer_width(dividend, divisor)}b")
+        yield "."
+        for bit in DivisionEngine.stream_bits(remainder, divisor):
+            yield str(bit)
 
     def display_mult_direct(self, decimal_value, res_binary, bits=DEFAULT_BITS):
-        converter = Converter(decimal_value, bits)
         print(f"Результат: {decimal_value}")
         print(f"Прямой код: {res_binary}")
-        print(f"Обратный код: [{converter.reverse_code()}]")
-        print(f"Дополнительный код: [{converter.additional_code()}]")
+        print(f"Обратный код: [{Converter.cached_code(decimal_value, bits, 'reverse')}]")
+        print(f"Дополнительный код: [{Converter.cached_code(decimal_value, bits, 'additional')}]")
 
     def display_number_info(self, number, bits=DEFAULT_BITS):
 
-        converter = Converter(number, self.bits)
         print(f"Число введено: {number}")
-        print(f"Прямой код: [{converter.direct_code()}]")
-        print(f"Обратный код: [{converter.reverse_code()}]")
-        print(f"Дополнительный код: [{converter.additional_code()}]\n")
+        print(f"Прямой код: [{Converter.cached_code(number, self.bits, 'direct')}]")
+        print(f"Обратный код: [{Converter.cached_code(number, self.bits, 'reverse')}]")
+        print(f"Дополнительный код: [{Converter.cached_code(number, self.bits, 'additional')}]\n")
 
+    # Модуль, не помещающийся в bits - 1 разрядов, не обрезается
     def direct_code(self, number):
-        if number >= 0:
-            bin_number = bin(number)[2:].zfill(self.bits - 1)
-            return "0" + bin_number
-        else:
-            bin_number = bin(abs(number))[2:].zfill(self.bits - 1)
-            return "1" + bin_number
+        width = max(self.bits - 1, abs(number).bit_length())
+        return str(BitVector(((1 if number < 0 else 0) << width) | abs(number), width + 1))
@@ -0,0 +1,144 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from binary_calculator.add_sub import AddSub
+from binary_calculator.operations import Operations
+from binary_calculator.soft_float import SoftFloat
+
+
+def _add(a, b, bits):
+    return AddSub.add_many(a, b, bits)
+
+
+def _sub(a, b, bits):
+    return AddSub.subtract_many(a, b, bits)
+
+
+def _mul(a, b, bits):
+    return Operations.multiply_many_hardware(a, b, bits)[:2]
+
+
+def _soft_float(operation):
+    def run(a, b, bits):
+        return getattr(SoftFloat(bits), operation)(a, b)
+    return run
+
+
+# Операция: функция над блоком операндов, тип операндов и типы выходных
+# массивов. Функции должны только читать свои блоки, поэтому блоки из общей
+# памяти передаются им без копирования.
+OPERATIONS = {
+    "add": (_add, np.int64, (np.int64, np.bool_, np.uint64)),
+    "sub": (_sub, np.int64, (np.int64, np.bool_, np.uint64)),
+    "mul": (_mul, np.int64, (np.int64, np.uint64)),
+    "ieee-add": (_soft_float("add"), np.uint64, (np.uint64, np.uint8)),
+    "ieee-mul": (_soft_float("mul"), np.uint64, (np.uint64, np.uint8)),
+    "ieee-div": (_soft_float("div"), np.uint64, (np.uint64, np.uint8)),
+}
+
+# Выполняется в рабочем процессе: по именам блоков общей памяти читает
+# операнды [start, stop) и пишет результаты в те же позиции выходных
+# массивов; через очередь процессов передаются только имена и границы
+def _run_chunk(operation, bits, inputs, outputs, start, stop):
+    blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in inputs + outputs]
+    arrays = results = None
+    try:
+        arrays = [np.ndarray(length, dtype=dtype, buffer=block.buf)
+                  for block, (_, dtype, length) in zip(blocks, inputs + outputs)]
+        results = OPERATIONS[operation][0](*(array[start:stop] for array in arrays[:len(inputs)]), bits)
+        for array, result in zip(arrays[len(inputs):], results):
+            array[start:stop] = result
+    finally:
+        # Блок нельзя закрыть, пока на его память ссылаются массивы
+        arrays = results = None
+        for block in blocks:
+            block.close()
+    return stop - start
+
+
+class ParallelExecutor:
+    OPERATIONS = tuple(OPERATIONS)
+    CHUNK_SIZE = 1 << 16
+
+    # Параллельное выполнение пакетных операций LAB_1 над большими массивами:
+    # операнды и результаты лежат в multiprocessing.shared_memory, поток
+    # операций режется на блоки по chunk_size, блоки считаются в пуле из
+    # workers процессов, результат собирается в исходном порядке
+    def __init__(self, workers=None, chunk_size=CHUNK_SIZE):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1 or chunk_size < 1:
+            raise ValueError("Число процессов и размер блока должны быть положительными")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    # Возвращает кортеж массивов той же длины, что и операнды, как
+    # соответствующая пакетная функция (add_many, SoftFloat.add, ...)
+    def run(self, operation, a, b, bits):
+        if operation not in OPERATIONS:
+            raise ValueError(f"Неизвестная операция: {operation}")
+        function, input_type, output_types = OPERATIONS[operation]
+        # Сразу в тип операндов: список слов binary64 от 2^63 и меньше NumPy
+        # без dtype прочитал бы как float64 с потерей разрядов
+        operands = [np.ascontiguousarray(np.asarray(values, dtype=input_type).ravel()) for values in (a, b)]
+        if len(operands[0]) != len(operands[1]):
+            raise ValueError("Массивы операндов должны быть одной длины")
+        length = len(operands[0])
+
+        if self.workers == 1 or length <= self.chunk_size:
+            return tuple(np.asarray(result, dtype=dtype)
+                         for result, dtype in zip(function(*operands, bits), output_types))
+
+        blocks = []
+        futures = []
+        try:
+            inputs = [self._share(blocks, operand.dtype, length, operand) for operand in operands]
+            outputs = [self._share(blocks, np.dtype(dtype), length) for dtype in output_types]
+            specs_in = [(block.name, dtype, length) for block, dtype in inputs]
+            specs_out = [(block.name, dtype, length) for block, dtype in outputs]
+
+            pool = self._get_pool()
+            for start in range(0, length, self.chunk_size):
+                futures.append(pool.submit(_run_chunk, operation, bits, specs_in, specs_out,
+                                           start, min(start + self.chunk_size, length)))
+            for future in futures:
+                future.result()
+
+            return tuple(np.ndarray(length, dtype=dtype, buffer=block.buf).copy() for block, dtype in outputs)
+        finally:
+            # После ошибки в одном блоке остальные отменяются или
+            # дожидаются: общую память нельзя удалять из-под работающих
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    @staticmethod
+    def _share(blocks, dtype, length, values=None):
+        block = shared_memory.SharedMemory(create=True, size=max(1, length * dtype.itemsize))
+        blocks.append(block)
+        if values is not None:
+            np.ndarray(length, dtype=dtype, buffer=block.buf)[:] = values
+        return block, dtype
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
@@ -0,0 +1,125 @@
+import functools
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+
+class Profiler:
+    # Счётчики, которые выводятся всегда (остальные - если встречались)
+    COUNTERS = ("calls", "time", "bit_iterations", "normalization_shifts", "rounding_events")
+    OUTSIDE = "other"
+
+    enabled = False
+    records = {}
+    _active = []
+    # Пары (исходная функция, обёртка) всех операций под @profiled
+    _registry = []
+
+    # Включение подставляет обёртки вместо операций в их классы, выключение
+    # возвращает исходные функции
+    @staticmethod
+    def enable():
+        if Profiler.enabled:
+            return
+        Profiler.enabled = True
+        for function, wrapper in Profiler._registry:
+            Profiler._install(function, wrapper)
+
+    @staticmethod
+    def disable():
+        if not Profiler.enabled:
+            return
+        Profiler.enabled = False
+        for function, _ in Profiler._registry:
+            Profiler._install(function, function)
+
+    @staticmethod
+    def reset():
+        Profiler.records.clear()
+        Profiler._active.clear()
+
+    # Декоратор операции: обёртка считает вызовы и время и делает операцию
+    # текущей для count. Пока профилировщик выключен, в классе остаётся
+    # исходная функция, и вызов ничего не стоит; обёртку подставляет enable
+    @staticmethod
+    def profiled(name):
+        def decorate(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not Profiler.enabled:
+                    return function(*args, **kwargs)
+                Profiler._active.append(name)
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    elapsed = time.perf_counter() - start
+                    Profiler._active.pop()
+                    record = Profiler._record(name)
+                    record["calls"] += 1
+                    record["time"] += elapsed
+            Profiler._registry.append((function, wrapper))
+            return wrapper if Profiler.enabled else function
+        return decorate
+
+    # Замена операции в её классе (по __module__ и __qualname__ исходной
+    # функции) с сохранением staticmethod
+    @staticmethod
+    def _install(function, replacement):
+        *path, attribute = function.__qualname__.split(".")
+        owner = sys.modules.get(function.__module__)
+        for part in path:
+            owner = getattr(owner, part, None)
+        if owner is None or attribute not in vars(owner):
+            return
+        if isinstance(vars(owner)[attribute], staticmethod):
+            replacement = staticmethod(replacement)
+        setattr(owner, attribute, replacement)
+
+    # Счётчик относится к самой внутренней выполняемой операции. Вызывающий
+    # код проверяет Profiler.enabled сам, если amount дорого считать.
+    @staticmethod
+    def count(counter, amount=1):
+        if not Profiler.enabled:
+            return
+        record = Profiler._record(Profiler._active[-1] if Profiler._active else Profiler.OUTSIDE)
+        record[counter] = record.get(counter, 0) + amount
+
+    @staticmethod
+    def _record(name):
+        record = Profiler.records.get(name)
+        if record is None:
+            record = dict.fromkeys(Profiler.COUNTERS, 0)
+            Profiler.records[name] = record
+        return record
+
+    @staticmethod
+    @contextmanager
+    def session(reset=True):
+        previous = Profiler.enabled
+        if reset:
+            Profiler.reset()
+        Profiler.enable()
+        try:
+            yield Profiler
+        finally:
+            if not previous:
+                Profiler.disable()
+
+    # Операции по убыванию суммарного времени, с временем на вызов
+    @staticmethod
+    def report():
+        report = {}
+        for name, record in sorted(Profiler.records.items(), key=lambda item: -item[1]["time"]):
+            report[name] = dict(record)
+            report[name]["time_per_call"] = record["time"] / record["calls"] if record["calls"] else 0.0
+        return report
+
+    @staticmethod
+    def to_json(path=None):
+        text = json.dumps(Profiler.report(), ensure_ascii=False, indent=2)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(text + "\n")
+        return text
@@ -0,0 +1,458 @@
+import math
+
+import numpy as np
+
+from binary_calculator.ieee754_codec import IEEE754Codec
+from binary_calculator.profiling import Profiler
+
+
+class SoftFloat:
+    ROUND_NEAREST_EVEN = "nearest_even"
+    ROUND_TOWARD_ZERO = "toward_zero"
+    ROUND_UP = "up"
+    ROUND_DOWN = "down"
+    ROUNDING_MODES = (ROUND_NEAREST_EVEN, ROUND_TOWARD_ZERO, ROUND_UP, ROUND_DOWN)
+
+    # Флаги исключений IEEE-754, по одному байту на элемент
+    FLAG_INVALID = 1
+    FLAG_DIVIDE_BY_ZERO = 2
+    FLAG_OVERFLOW = 4
+    FLAG_UNDERFLOW = 8
+    FLAG_INEXACT = 16
+
+    # guard, round и sticky биты справа от мантиссы
+    EXTRA_BITS = 3
+
+    # Счётчики для профилирования: сдвиги нормализации (в разрядах) и
+    # результаты, потребовавшие округления
+    COUNTERS = ("operations", "normalization_shifts", "rounding_events")
+
+    def __init__(self, bits=32, rounding=ROUND_NEAREST_EVEN):
+        if rounding not in SoftFloat.ROUNDING_MODES:
+            raise ValueError(f"Неизвестный режим округления: {rounding}")
+        self.codec = IEEE754Codec(bits)
+        self.bits = bits
+        self.rounding = rounding
+        self.mantissa_bits = self.codec.mantissa_bits
+        self.exponent_max = (1 << self.codec.exponent_bits) - 1
+        self.quiet_bit = 1 << (self.mantissa_bits - 1)
+        self.default_nan = self.codec.exponent_mask | self.quiet_bit
+        self.max_finite = ((self.exponent_max - 1) << self.mantissa_bits) | self.codec.mantissa_mask
+        # Порядок младшего разряда субнормальных чисел
+        self.min_exponent = 1 - self.codec.bias - self.mantissa_bits
+        self.counters = dict.fromkeys(SoftFloat.COUNTERS, 0)
+
+    def reset_counters(self):
+        self.counters = dict.fromkeys(SoftFloat.COUNTERS, 0)
+
+    @Profiler.profiled("SoftFloat.add")
+    def add(self, a, b):
+        a, b = np.broadcast_arrays(self._as_words(a), self._as_words(b))
+        return self._counted(self._add_words, a, b)
+
+    # Одиночные слова (целые Python) складываются скалярным ядром без
+    # массивов NumPy; результат и флаги - целые
+    @Profiler.profiled("SoftFloat.add")
+    def add_word(self, a, b):
+        self.counters["operations"] += 1
+        return self._counted(self._add_word, a, b)
+
+    @Profiler.profiled("SoftFloat.sub")
+    def sub(self, a, b):
+        return self.add(a, self._as_words(b) ^ np.uint64(self.codec.sign_mask))
+
+    # Умножение, деление, корень и FMA требуют произведений шире 64 бит,
+    # поэтому каждый элемент считается скалярным ядром на целых Python
+    @Profiler.profiled("SoftFloat.mul")
+    def mul(self, a, b):
+        return self._counted(self._map_words, self._mul_word, a, b)
+
+    @Profiler.profiled("SoftFloat.div")
+    def div(self, a, b):
+        return self._counted(self._map_words, self._div_word, a, b)
+
+    @Profiler.profiled("SoftFloat.sqrt")
+    def sqrt(self, a):
+        return self._counted(self._map_words, self._sqrt_word, a)
+
+    @Profiler.profiled("SoftFloat.fma")
+    def fma(self, a, b, c):
+        return self._counted(self._map_words, self._fma_word, a, b, c)
+
+    # Приращения счётчиков нормализации и округления за операцию
+    # передаются профилировщику, если он включён
+    def _counted(self, operation, *operands):
+        if not Profiler.enabled:
+            return operation(*operands)
+        before = dict(self.counters)
+        result = operation(*operands)
+        for counter in ("normalization_shifts", "rounding_events"):
+            Profiler.count(counter, self.counters[counter] - before[counter])
+        return result
+
+    # Тип задаётся сразу: по списку целых Python со словами от 2^63 и
+    # меньше NumPy выбрал бы float64 и потерял младшие разряды
+    def _as_words(self, words):
+        return np.asarray(words, dtype=self.codec.uint_type).astype(np.uint64)
+
+    def _add_words(self, a, b):
+        u = np.uint64
+        fraction_bits = self.mantissa_bits
+        hidden = u(1 << fraction_bits)
+        magnitude_mask = u(self.codec.sign_mask - 1)
+
+        # |x| >= |y|: тогда и порядок x не меньше порядка y
+        swap = (b & magnitude_mask) > (a & magnitude_mask)
+        x = np.where(swap, b, a)
+        y = np.where(swap, a, b)
+
+        sign_x, exponent_x, fraction_x = self._fields(x)
+        sign_y, exponent_y, fraction_y = self._fields(y)
+
+        mantissa_x = np.where(exponent_x > 0, fraction_x | hidden, fraction_x) << u(self.EXTRA_BITS)
+        mantissa_y = np.where(exponent_y > 0, fraction_y | hidden, fraction_y) << u(self.EXTRA_BITS)
+        exponent = np.maximum(exponent_x, u(1)).astype(np.int64)
+        distance = exponent - np.maximum(exponent_y, u(1)).astype(np.int64)
+
+        # Выравнивание: выдвинутые биты сворачиваются в sticky
+        shift = np.minimum(distance, 63).astype(np.uint64)
+        lost = mantissa_y & ((u(1) << shift) - u(1))
+        mantissa_y = (mantissa_y >> shift) | (lost != 0).astype(np.uint64)
+
+        subtract = sign_x != sign_y
+        mantissa = np.where(subtract, mantissa_x - mantissa_y, mantissa_x + mantissa_y)
+
+        # Нормализация: перенос вправо или сдвиг влево до скрытого бита,
+        # но не ниже минимального порядка
+        carry = mantissa >= (hidden << u(self.EXTRA_BITS + 1))
+        mantissa = np.where(carry, (mantissa >> u(1)) | (mantissa & u(1)), mantissa)
+        exponent = exponent + carry
+
+        target_length = fraction_bits + 1 + self.EXTRA_BITS
+        left_shift = np.clip(target_length - self._bit_length(mantissa), 0, None)
+        left_shift = np.minimum(left_shift, exponent - 1)
+        left_shift = np.where(mantissa == 0, 0, left_shift)
+        mantissa = mantissa << left_shift.astype(np.uint64)
+        exponent = exponent - left_shift
+        self.counters["normalization_shifts"] += int(np.count_nonzero(carry)) + int(left_shift.sum())
+
+        result, flags = self._round_pack(sign_x, exponent, mantissa)
+
+        # Точное взаимное уничтожение даёт +0, а при округлении вниз -0
+        cancelled = subtract & (mantissa == 0)
+        negative_zero = u(self.codec.sign_mask if self.rounding == self.ROUND_DOWN else 0)
+        result = np.where(cancelled, negative_zero, result)
+
+        result, flags = self._apply_specials(a, b, x, result, flags)
+        self.counters["operations"] += result.size
+        self.counters["rounding_events"] += int(np.count_nonzero(flags & self.FLAG_INEXACT))
+        return result, flags
+
+    def _fields(self, words):
+        u = np.uint64
+        sign = words >> u(self.bits - 1)
+        exponent = (words >> u(self.mantissa_bits)) & u(self.exponent_max)
+        fraction = words & u(self.codec.mantissa_mask)
+        return sign, exponent, fraction
+
+    @staticmethod
+    def _bit_length(values):
+        length = np.zeros(values.shape, dtype=np.int64)
+        for shift in (32, 16, 8, 4, 2, 1):
+            has_high = values >= np.uint64(1 << shift)
+            values = np.where(has_high, values >> np.uint64(shift), values)
+            length += np.where(has_high, shift, 0)
+        return length + (values > 0)
+
+    # Округление мантиссы с guard/round/sticky битами и упаковка в слово
+    def _round_pack(self, sign, exponent, mantissa):
+        u = np.uint64
+        fraction_bits = self.mantissa_bits
+
+        extra = mantissa & u((1 << self.EXTRA_BITS) - 1)
+        mantissa = mantissa >> u(self.EXTRA_BITS)
+        inexact = extra != 0
+
+        if self.rounding == self.ROUND_NEAREST_EVEN:
+            half = u(1 << (self.EXTRA_BITS - 1))
+            increment = (extra > half) | ((extra == half) & ((mantissa & u(1)) == 1))
+        elif self.rounding == self.ROUND_TOWARD_ZERO:
+            increment = np.zeros(mantissa.shape, dtype=bool)
+        elif self.rounding == self.ROUND_UP:
+            increment = inexact & (sign == 0)
+        else:
+            increment = inexact & (sign == 1)
+
+        tiny = mantissa < u(1 << fraction_bits)
+        mantissa = mantissa + increment
+        carry = mantissa >= u(1 << (fraction_bits + 1))
+        mantissa = np.where(carry, mantissa >> u(1), mantissa)
+        exponent = exponent + carry
+
+        exponent_field = np.where(mantissa < u(1 << fraction_bits), 0, exponent).astype(np.uint64)
+        result = ((sign << u(self.bits - 1)) | (exponent_field << u(fraction_bits))
+                  | (mantissa & u(self.codec.mantissa_mask)))
+
+        overflow = exponent >= self.exponent_max
+        result = np.where(overflow, np.where(sign == 0, u(self._overflow_word(0)), u(self._overflow_word(1))),
+                          result)
+
+        flags = np.zeros(mantissa.shape, dtype=np.uint8)
+        flags |= np.where(inexact | overflow, self.FLAG_INEXACT, 0).astype(np.uint8)
+        flags |= np.where(overflow, self.FLAG_OVERFLOW, 0).astype(np.uint8)
+        flags |= np.where(tiny & inexact, self.FLAG_UNDERFLOW, 0).astype(np.uint8)
+        return result, flags
+
+    # При переполнении результат - бесконечность или максимальное конечное
+    # число, в зависимости от режима округления и знака
+    def _overflow_word(self, sign):
+        to_infinity = (self.rounding == self.ROUND_NEAREST_EVEN
+                       or (self.rounding == self.ROUND_UP and not sign)
+                       or (self.rounding == self.ROUND_DOWN and sign))
+        magnitude = self.codec.exponent_mask if to_infinity else self.max_finite
+        return (sign << (self.bits - 1)) | magnitude
+
+    # NaN и бесконечности: NaN распространяется (становясь тихим),
+    # inf - inf даёт NaN по умолчанию и флаг invalid
+    def _apply_specials(self, a, b, x, result, flags):
+        u = np.uint64
+        _, exponent_a, fraction_a = self._fields(a)
+        _, exponent_b, fraction_b = self._fields(b)
+        nan_a = (exponent_a == self.exponent_max) & (fraction_a != 0)
+        nan_b = (exponent_b == self.exponent_max) & (fraction_b != 0)
+        infinity_a = (exponent_a == self.exponent_max) & (fraction_a == 0)
+        infinity_b = (exponent_b == self.exponent_max) & (fraction_b == 0)
+        quiet = u(self.quiet_bit)
+
+        signaling = (nan_a & ((fraction_a & quiet) == 0)) | (nan_b & ((fraction_b & quiet) == 0))
+        invalid_infinity = infinity_a & infinity_b & ((a ^ b) >> u(self.bits - 1) == 1)
+
+        result = np.where(infinity_a | infinity_b, x, result)
+        result = np.where(invalid_infinity, u(self.default_nan), result)
+        result = np.where(nan_b, b | quiet, result)
+        result = np.where(nan_a, a | quiet, result)
+
+        special = nan_a | nan_b | infinity_a | infinity_b
+        flags = np.where(special, 0, flags).astype(np.uint8)
+        flags |= np.where(signaling | invalid_infinity, self.FLAG_INVALID, 0).astype(np.uint8)
+        return result.astype(self.codec.uint_type), flags
+
+    def _map_words(self, operation, *operands):
+        operands = np.broadcast_arrays(*(self._as_words(operand) for operand in operands))
+        words = np.empty(operands[0].shape, dtype=self.codec.uint_type)
+        flags = np.empty(operands[0].shape, dtype=np.uint8)
+        columns = [operand.ravel().tolist() for operand in operands]
+        for index, values in enumerate(zip(*columns)):
+            words.flat[index], flags.flat[index] = operation(*values)
+        self.counters["operations"] += words.size
+        return words, flags
+
+    # Скалярное ядро: конечное число раскладывается в sign, exponent и
+    # целую мантиссу significand, значение = significand * 2^exponent
+    def _unpack(self, word):
+        sign, exponent, fraction = self.codec.fields(word)
+        if exponent == 0:
+            return sign, self.min_exponent, fraction
+        return sign, exponent - 1 + self.min_exponent, fraction | (1 << self.mantissa_bits)
+
+    def _is_nan(self, word):
+        return (word & self.codec.exponent_mask) == self.codec.exponent_mask and bool(word & self.codec.mantissa_mask)
+
+    def _is_infinity(self, word):
+        return (word & (self.codec.sign_mask - 1)) == self.codec.exponent_mask
+
+    def _is_zero(self, word):
+        return not word & (self.codec.sign_mask - 1)
+
+    def _propagate_nan(self, *words):
+        signaling = any(self._is_nan(word) and not word & self.quiet_bit for word in words)
+        flags = self.FLAG_INVALID if signaling else 0
+        for word in words:
+            if self._is_nan(word):
+                return word | self.quiet_bit, flags
+
+    def _zero_word(self, sign):
+        return sign << (self.bits - 1)
+
+    # Знак точного нуля при сложении слагаемых разных знаков
+    def _cancelled_zero(self):
+        return self._zero_word(1 if self.rounding == self.ROUND_DOWN else 0)
+
+    # Округление significand * 2^exponent (sticky - отброшенный ненулевой
+    # остаток меньше младшего разряда) и упаковка в слово. width - ожидаемая
+    # длина мантиссы результата; отклонение от неё считается сдвигом
+    # нормализации. Малость определяется до округления.
+    def _round_pack_word(self, sign, exponent, significand, sticky, width):
+        fraction_bits = self.mantissa_bits
+        self.counters["normalization_shifts"] += abs(significand.bit_length() - width)
+
+        shift = max(significand.bit_length() - (fraction_bits + 1), self.min_exponent - exponent)
+        if shift > 0:
+            remainder = significand & ((1 << shift) - 1)
+            half = 1 << (shift - 1)
+            significand >>= shift
+        else:
+            remainder, half = 0, 1
+            significand <<= -shift
+        exponent += shift
+
+        inexact = bool(remainder or sticky)
+        tiny = significand < (1 << fraction_bits)
+        if self.rounding == self.ROUND_NEAREST_EVEN:
+            increment = remainder > half or (remainder == half and (sticky or significand & 1))
+        elif self.rounding == self.ROUND_TOWARD_ZERO:
+            increment = False
+        elif self.rounding == self.ROUND_UP:
+            increment = inexact and not sign
+        else:
+            increment = inexact and sign
+
+        if increment:
+            significand += 1
+            if significand == 1 << (fraction_bits + 1):
+                significand >>= 1
+                exponent += 1
+
+        flags = 0
+        if inexact:
+            self.counters["rounding_events"] += 1
+            flags |= self.FLAG_INEXACT
+            if tiny:
+                flags |= self.FLAG_UNDERFLOW
+
+        exponent_field = 0 if significand < (1 << fraction_bits) else exponent - self.min_exponent + 1
+        if exponent_field >= self.exponent_max:
+            return self._overflow_word(sign), self.FLAG_OVERFLOW | self.FLAG_INEXACT
+        word = (sign << (self.bits - 1)) | (exponent_field << fraction_bits) | (significand & self.codec.mantissa_mask)
+        return word, flags
+
+    # Слагаемые выравниваются по меньшему порядку и складываются точно,
+    # затем округляются один раз, как в _fma_word
+    def _add_word(self, a, b):
+        sign_a = a >> (self.bits - 1)
+        sign_b = b >> (self.bits - 1)
+        if self._is_nan(a) or self._is_nan(b):
+            return self._propagate_nan(a, b)
+        if self._is_infinity(a):
+            if self._is_infinity(b) and sign_a != sign_b:
+                return self.default_nan, self.FLAG_INVALID
+            return a, 0
+        if self._is_infinity(b):
+            return b, 0
+
+        _, exponent_a, significand_a = self._unpack(a)
+        _, exponent_b, significand_b = self._unpack(b)
+        exponent = min(exponent_a, exponent_b)
+        significand_a <<= exponent_a - exponent
+        significand_b <<= exponent_b - exponent
+        total = (-significand_a if sign_a else significand_a) + (-significand_b if sign_b else significand_b)
+        if not total:
+            if sign_a == sign_b:
+                return self._zero_word(sign_a), 0
+            return self._cancelled_zero(), 0
+        width = max(significand_a.bit_length(), significand_b.bit_length())
+        return self._round_pack_word(1 if total < 0 else 0, exponent, abs(total), False, width)
+
+    def _mul_word(self, a, b):
+        sign = (a ^ b) >> (self.bits - 1)
+        if self._is_nan(a) or self._is_nan(b):
+            return self._propagate_nan(a, b)
+        if self._is_infinity(a) or self._is_infinity(b):
+            if self._is_zero(a) or self._is_zero(b):
+                return self.default_nan, self.FLAG_INVALID
+            return self._zero_word(sign) | self.codec.exponent_mask, 0
+        if self._is_zero(a) or self._is_zero(b):
+            return self._zero_word(sign), 0
+
+        _, exponent_a, significand_a = self._unpack(a)
+        _, exponent_b, significand_b = self._unpack(b)
+        return self._round_pack_word(sign, exponent_a + exponent_b, significand_a * significand_b,
+                                     False, 2 * self.mantissa_bits + 1)
+
+    def _div_word(self, a, b):
+        sign = (a ^ b) >> (self.bits - 1)
+        if self._is_nan(a) or self._is_nan(b):
+            return self._propagate_nan(a, b)
+        if self._is_infinity(a):
+            if self._is_infinity(b):
+                return self.default_nan, self.FLAG_INVALID
+            return self._zero_word(sign) | self.codec.exponent_mask, 0
+        if self._is_infinity(b):
+            return self._zero_word(sign), 0
+        if self._is_zero(b):
+            if self._is_zero(a):
+                return self.default_nan, self.FLAG_INVALID
+            return self._zero_word(sign) | self.codec.exponent_mask, self.FLAG_DIVIDE_BY_ZERO
+        if self._is_zero(a):
+            return self._zero_word(sign), 0
+
+        # Делимое сдвигается так, чтобы частное имело мантиссу, guard/round
+        # биты и ещё один разряд; остаток деления становится sticky
+        _, exponent_a, significand_a = self._unpack(a)
+        _, exponent_b, significand_b = self._unpack(b)
+        width = self.mantissa_bits + 1 + self.EXTRA_BITS
+        shift = width + significand_b.bit_length() - significand_a.bit_length()
+        quotient, remainder = divmod(significand_a << shift, significand_b)
+        return self._round_pack_word(sign, exponent_a - exponent_b - shift, quotient, remainder != 0, width)
+
+    def _sqrt_word(self, a):
+        if self._is_nan(a):
+            return self._propagate_nan(a)
+        if self._is_zero(a):
+            return a, 0
+        if a & self.codec.sign_mask:
+            return self.default_nan, self.FLAG_INVALID
+        if self._is_infinity(a):
+            return a, 0
+
+        # Порядок подкоренного выражения делается чётным, а мантисса -
+        # достаточно длинной для корня с guard/round битами
+        _, exponent, significand = self._unpack(a)
+        width = self.mantissa_bits + 1 + self.EXTRA_BITS
+        shift = max(0, 2 * width - significand.bit_length())
+        if (exponent - shift) % 2:
+            shift += 1
+        radicand = significand << shift
+        root = math.isqrt(radicand)
+        return self._round_pack_word(0, (exponent - shift) // 2, root, root * root != radicand, width)
+
+    # a * b + c с единственным округлением: произведение и слагаемое
+    # выравниваются по меньшему порядку и складываются точно
+    def _fma_word(self, a, b, c):
+        product_sign = (a ^ b) >> (self.bits - 1)
+        addend_sign = c >> (self.bits - 1)
+        if self._is_nan(a) or self._is_nan(b) or self._is_nan(c):
+            return self._propagate_nan(a, b, c)
+        if ((self._is_infinity(a) and self._is_zero(b))
+                or (self._is_zero(a) and self._is_infinity(b))):
+            return self.default_nan, self.FLAG_INVALID
+        if self._is_infinity(a) or self._is_infinity(b):
+            if self._is_infinity(c) and addend_sign != product_sign:
+                return self.default_nan, self.FLAG_INVALID
+            return self._zero_word(product_sign) | self.codec.exponent_mask, 0
+        if self._is_infinity(c):
+            return c, 0
+
+        _, exponent_a, significand_a = self._unpack(a)
+        _, exponent_b, significand_b = self._unpack(b)
+        _, addend_exponent, addend = self._unpack(c)
+        product = significand_a * significand_b
+        product_exponent = exponent_a + exponent_b
+        if not product and not addend:
+            if product_sign == addend_sign:
+                return self._zero_word(product_sign), 0
+            return self._cancelled_zero(), 0
+
+        if not product:
+            exponent = addend_exponent
+        elif not addend:
+            exponent = product_exponent
+        else:
+            exponent = min(product_exponent, addend_exponent)
+        product <<= product_exponent - exponent if product else 0
+        addend <<= addend_exponent - exponent if addend else 0
+        width = max(product.bit_length(), addend.bit_length())
+        total = (-product if product_sign else product) + (-addend if addend_sign else addend)
+        if not total:
+            return self._cancelled_zero(), 0
+        return self._round_pack_word(1 if total < 0 else 0, exponent, abs(total), False, width)
@@ -1,3 +1,8 @@
+from binary_calculator.bit_vector import BitVector
+from binary_calculator.decimal_conversion import DecimalConversion
+from binary_calculator.ieee754_codec import IEEE754Codec
+from binary_calculator.profiling import Profiler
+from binary_calculator.soft_float import SoftFloat
 
 EXPONENT_BIAS = 127
 IEEE754_TOTAL_BITS = 32
@@ -5,114 +10,100 @@ IEEE754_MAX_EXPONENT = 255
 IEEE754_MANTISSA_BITS = 23
 IEEE754_EXPONENT_BITS = 8
 class StandartIEEE754:
+    CODEC = IEEE754Codec(IEEE754_TOTAL_BITS)
+    DECIMAL = DecimalConversion(IEEE754_TOTAL_BITS)
+
     def __init__(self, num1, num2):
         self.num1 = num1
         self.num2 = num2
 
     def float_to_ieee754(self, num):
-        sign = '1' if num < 0 else '0'
-        if num == 0:
-            return '0' * IEEE754_TOTAL_BITS
-
-        num = abs(num)
-        int_part = int(num)
-        frac_part = num - int_part
-        int_bin = bin(int_part)[2:] if int_part > 0 else ''
-        frac_bin = ''
-
-        while frac_part and len(frac_bin) < IEEE754_MANTISSA_BITS:
-            frac_part *= 2
-            bit = int(frac_part)
-            frac_bin += str(bit)
-            frac_part -= bit
-
-        # Определяем экспоненту
-        if int_bin:
-            exp = len(int_bin) - 1
-        elif '1' in frac_bin:
-            exp = -frac_bin.index('1') - 1
-        else:
-            return '0' * IEEE754_TOTAL_BITS  # Ноль
+        return str(self.float_to_vector(num))
 
-        exp_bits = bin(exp + EXPONENT_BIAS)[2:].zfill(IEEE754_EXPONENT_BITS)
-        mantissa_bits = (int_bin[1:] + frac_bin).ljust(IEEE754_MANTISSA_BITS, '0')[:IEEE754_MANTISSA_BITS]
+    def float_to_vector(self, num):
+        return BitVector(self.encode_word(num), IEEE754_TOTAL_BITS)
 
-        return f'{sign}{exp_bits}{mantissa_bits}'
+    # Десятичная строка округляется сразу в binary32, без промежуточного
+    # double; число float кодируется как раньше. Строка, которая не
+    # является числом, даёт ValueError, как float().
+    @staticmethod
+    def encode_word(num):
+        if isinstance(num, str):
+            return StandartIEEE754.DECIMAL.parse_word(num)
+        return StandartIEEE754.CODEC.encode_word(num)
 
+    # Принимает строку из 32 разрядов или BitVector
     def ieee754_to_float(self, ieee_bin):
-        sign = int(ieee_bin[0])
-        exp = int(ieee_bin[1:9], 2) - EXPONENT_BIAS
-        mantissa = ieee_bin[9:]
-
-        if exp == -127:
-            mantissa_value = 0.0
-            for i, bit in enumerate(mantissa):
-                if bit == '1':
-                    mantissa_value += 2 ** -(i + 1)
-            result = mantissa_value * (2 ** -(EXPONENT_BIAS-1))
+        if isinstance(ieee_bin, BitVector):
+            if ieee_bin.width != IEEE754_TOTAL_BITS:
+                raise ValueError(f"Ожидалось слово из {IEEE754_TOTAL_BITS} разрядов")
+            return self.CODEC.decode_word(ieee_bin.value)
+        return self.CODEC.decode(ieee_bin)
+
+    # Кратчайшая десятичная запись, которая читается обратно в то же слово
+    def ieee754_to_decimal(self, ieee_bin):
+        if isinstance(ieee_bin, BitVector):
+            return self.DECIMAL.format_word(ieee_bin.value)
+        return self.DECIMAL.format(ieee_bin)
+
+    # Пакетный перевод столбца десятичных строк в слова binary32 и обратно
+    @staticmethod
+    def decimal_to_ieee754_many(texts):
+        return StandartIEEE754.DECIMAL.parse_many(texts)
+
+    @staticmethod
+    def ieee754_to_decimal_many(words):
+        return StandartIEEE754.DECIMAL.format_many(words)
+
+    # Пакетный перевод массивов float в слова binary32 и обратно
+    @staticmethod
+    def float_to_ieee754_many(values):
+        return StandartIEEE754.CODEC.encode_many(values)
+
+    @staticmethod
+    def ieee754_to_float_many(words):
+        return StandartIEEE754.CODEC.decode_many(words)
+
+    # Операции выполняет программная модель SoftFloat на целых мантиссах:
+    # guard/round/sticky биты, нормализация и округление по режиму
+    @Profiler.profiled("StandartIEEE754.ieee754_addition")
+    def ieee754_addition(self, rounding=SoftFloat.ROUND_NEAREST_EVEN):
+        return self._soft_float_result("add", rounding, self.num1, self.num2)
+
+    @Profiler.profiled("StandartIEEE754.ieee754_multiplication")
+    def ieee754_multiplication(self, rounding=SoftFloat.ROUND_NEAREST_EVEN):
+        return self._soft_float_result("mul", rounding, self.num1, self.num2)
+
+    @Profiler.profiled("StandartIEEE754.ieee754_division")
+    def ieee754_division(self, rounding=SoftFloat.ROUND_NEAREST_EVEN):
+        return self._soft_float_result("div", rounding, self.num1, self.num2)
+
+    @Profiler.profiled("StandartIEEE754.ieee754_sqrt")
+    def ieee754_sqrt(self, rounding=SoftFloat.ROUND_NEAREST_EVEN):
+        return self._soft_float_result("sqrt", rounding, self.num1)
+
+    # num1 * num2 + addend с одним округлением
+    @Profiler.profiled("StandartIEEE754.ieee754_fma")
+    def ieee754_fma(self, addend, rounding=SoftFloat.ROUND_NEAREST_EVEN):
+        return self._soft_float_result("fma", rounding, self.num1, self.num2, addend)
+
+    # Сложение одного слова идёт скалярным ядром SoftFloat.add_word,
+    # остальные операции - через массивы из одного элемента
+    def _soft_float_result(self, operation, rounding, *values):
+        soft_float = SoftFloat(IEEE754_TOTAL_BITS, rounding)
+        words = [self.encode_word(value) for value in values]
+        if operation == "add":
+            word, _ = soft_float.add_word(*words)
         else:
-            mantissa_value = 1.0
-            for i, bit in enumerate(mantissa):
-                if bit == '1':
-                    mantissa_value += 2 ** -(i + 1)
-            result = mantissa_value * (2 ** exp)
-
-        return -result if sign else result
-
-    def ieee754_addition(self):
-        a_ieee = self.float_to_ieee754(self.num1)  # Using constants implicitly
-        b_ieee = self.float_to_ieee754(self.num2)
-
-        # Разбираем
-        sign_a, exp_a, mant_a = int(a_ieee[0]), int(a_ieee[1:9], 2), int('1' + a_ieee[IEEE754_EXPONENT_BITS+1:], 2)
-        sign_b, exp_b, mant_b = int(b_ieee[0]), int(b_ieee[1:9], 2), int('1' + b_ieee[IEEE754_EXPONENT_BITS:], 2)
-
-        # Выравниваем
-        if exp_a > exp_b:
-            shift = exp_a - exp_b
-            mant_b >>= shift
-            exp_b = exp_a
-        elif exp_b > exp_a:
-            shift = exp_b - exp_a
-            mant_a >>= shift
-            exp_a = exp_b
-
-        if sign_a:
-            mant_a = -mant_a
-        if sign_b:
-            mant_b = -mant_b
-
-        # Складываем мантиссы
-        mant_sum = mant_a + mant_b
-        sign_res = 0 if mant_sum >= 0 else 1
-        mant_sum = abs(mant_sum)
-        exp_res = exp_a
-
-
-        if mant_sum == 0:
-            return '0' * IEEE754_TOTAL_BITS
-
-        while mant_sum and not (mant_sum & (1 << IEEE754_MANTISSA_BITS)):
-            mant_sum <<= 1
-            exp_res -= 1
-
-        if mant_sum & (1 << (IEEE754_MANTISSA_BITS + 1)):
-            mant_sum >>= 1
-            exp_res += 1
-
-        if exp_res <= 0:
-            exp_res = 0
-            mant_sum = 0
-        elif exp_res >= IEEE754_MAX_EXPONENT:
-            exp_res = IEEE754_MAX_EXPONENT
-            mant_sum = 0
-
-        mantissa_bits = bin(mant_sum)[3:3 + IEEE754_MANTISSA_BITS].ljust(IEEE754_MANTISSA_BITS, '0')
-        exp_bits = bin(exp_res)[2:].zfill(IEEE754_EXPONENT_BITS)
-
-        return f'{sign_res}{exp_bits}{mantissa_bits}'
+            result, _ = getattr(soft_float, operation)(*([word] for word in words))
+            word = int(result[0])
+        return str(BitVector(word, IEEE754_TOTAL_BITS))
+
+    # Пакетное сложение массивов слов binary32, возвращает слова и флаги
+    @staticmethod
+    @Profiler.profiled("StandartIEEE754.ieee754_addition_many")
+    def ieee754_addition_many(a_words, b_words, rounding=SoftFloat.ROUND_NEAREST_EVEN):
+        return SoftFloat(IEEE754_TOTAL_BITS, rounding).add(a_words, b_words)
 
     def sum_of_binary_ieee754(self):
-        num1 = self.float_to_ieee754(self.num1)
-        num2 = self.float_to_ieee754(self.num2)
         return self.ieee754_addition()
@@ -0,0 +1,75 @@
+from binary_calculator.bit_vector import BitVector
+
+
+class WideWord:
+    CODES = ("direct", "reverse", "additional")
+
+    __slots__ = ("value", "bits", "code", "negative", "_views")
+
+    # negative позволяет задать "минус ноль" для прямого и обратного кодов
+    def __init__(self, value, bits, code="additional", negative=None):
+        if code not in WideWord.CODES:
+            raise ValueError(f"Неизвестный код: {code}")
+        self.value = value
+        self.bits = bits
+        self.code = code
+        self.negative = value < 0 if negative is None else negative
+        self._views = {}
+
+    # Двоичные строки строятся только при первом обращении и кешируются
+    @property
+    def direct(self):
+        return self._view("direct")
+
+    @property
+    def reverse(self):
+        return self._view("reverse")
+
+    @property
+    def additional(self):
+        return self._view("additional")
+
+    def word(self, code=None):
+        code = code or self.code
+        magnitude_mask = (1 << (self.bits - 1)) - 1
+        sign_bit = 1 << (self.bits - 1)
+        if code == "additional":
+            if self.value >= 0:
+                return self.value & magnitude_mask
+            return sign_bit | (self.value & magnitude_mask)
+        magnitude = abs(self.value) & magnitude_mask
+        if not self.negative:
+            return magnitude
+        if code == "direct":
+            return sign_bit | magnitude
+        return sign_bit | (magnitude_mask ^ magnitude)
+
+    def vector(self, code=None):
+        return BitVector(self.word(code), self.bits)
+
+    def _view(self, code):
+        view = self._views.get(code)
+        if view is None:
+            view = BitVector.to_string(self.word(code), self.bits)
+            self._views[code] = view
+        return view
+
+    def __str__(self):
+        return self._view(self.code)
+
+    def __repr__(self):
+        return f"WideWord({self.value}, bits={self.bits}, code={self.code!r})"
+
+    def __len__(self):
+        return self.bits
+
+    def __getitem__(self, index):
+        return str(self)[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, WideWord):
+            return NotImplemented
+        return (self.value, self.bits, self.code) == (other.value, other.bits, other.code)
+
+    def __hash__(self):
+        return hash((self.value, self.bits, self.code))
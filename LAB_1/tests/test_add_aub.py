@@ -1,4 +1,7 @@
 import unittest
+
+import numpy as np
+
 from binary_calculator.add_sub import AddSub
 
 
@@ -53,6 +56,118 @@ class TestAddSub(unittest.TestCase):
         self.assertEqual(AddSub.additional_code(-5, bits=8), "11111011")
         self.assertEqual(AddSub.additional_code(0, bits=8), "00000000")
 
+    def test_add_wide(self):
+        result_decimal, result_additional = AddSub(-5, 2, bits=8).add_wide()
+        self.assertEqual(result_decimal, -3)
+        self.assertEqual(str(result_additional), "11111101")
+
+        result_decimal, result_additional = AddSub(7, 4, bits=8).subtract_wide()
+        self.assertEqual(result_decimal, 3)
+        self.assertEqual(str(result_additional), "00000011")
+
+    def test_add_wide_large_width(self):
+        number = 2 ** 4000
+        result_decimal, result_additional = AddSub(number, -number - 1, bits=4096).add_wide()
+        self.assertEqual(result_decimal, -1)
+        self.assertEqual(str(result_additional), "1" * 4096)
+
+        with self.assertRaises(OverflowError):
+            AddSub(2 ** 4094, 2 ** 4094, bits=4096).add_wide()
+
+    def test_add_many(self):
+        results, overflow, additional = AddSub.add_many([5, -5, 5, 100, -100], [3, -3, -2, 30, -50], bits=8)
+        self.assertEqual(results.tolist(), [8, -8, 3, -126, 106])
+        self.assertEqual(overflow.tolist(), [False, False, False, True, True])
+        self.assertEqual(additional.tolist(), [0b00001000, 0b11111000, 0b00000011, 0b10000010, 0b01101010])
+
+    def test_subtract_many(self):
+        results, overflow, _ = AddSub.subtract_many(np.array([7, 4, -128]), np.array([4, 7, 1]), bits=8)
+        self.assertEqual(results.tolist(), [3, -3, 127])
+        self.assertEqual(overflow.tolist(), [False, False, True])
+
+    def test_add_many_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        numbers_1 = rng.integers(-128, 128, size=200)
+        numbers_2 = rng.integers(-128, 128, size=200)
+        results, overflow, additional = AddSub.add_many(numbers_1, numbers_2, bits=8)
+        for i in range(len(numbers_1)):
+            add_sub = AddSub(int(numbers_1[i]), int(numbers_2[i]), bits=8)
+            if overflow[i]:
+                with self.assertRaises(OverflowError):
+                    add_sub.add_additional()
+            else:
+                self.assertEqual(add_sub.add_additional(), (results[i], f"{additional[i]:08b}"))
+
+    def test_add_many_full_width(self):
+        results, overflow, _ = AddSub.add_many([2 ** 63 - 1, -1], [1, -1], bits=64)
+        self.assertEqual(results.tolist(), [-2 ** 63, -2])
+        self.assertEqual(overflow.tolist(), [True, False])
+
+    def test_add_model(self):
+        for adder in AddSub.ADDERS:
+            result_decimal, result_additional, stats = AddSub(-5, 2, bits=8).add_model(adder)
+            self.assertEqual((result_decimal, result_additional), (-3, "11111101"))
+            self.assertEqual(stats["adder"], adder)
+            self.assertEqual(AddSub(4, 7, bits=8).subtract_model(adder)[:2], (-3, "11111101"))
+            with self.assertRaises(OverflowError):
+                AddSub(100, 30, bits=8).add_model(adder)
+
+    def test_sum_carry_save(self):
+        result_decimal, result_additional, stats = AddSub.sum_carry_save([5, -3, 7, -20, 1], bits=8)
+        self.assertEqual((result_decimal, result_additional), (-10, "11110110"))
+        self.assertEqual(stats["compressors"], 3)
+        with self.assertRaises(OverflowError):
+            AddSub.sum_carry_save([100, 20, 10], bits=8)
+
+    def test_add_many_model(self):
+        numbers_1, numbers_2 = [5, -5, 100, -100], [3, -3, 30, -50]
+        expected = AddSub.add_many(numbers_1, numbers_2, bits=8)
+        for adder in AddSub.ADDERS:
+            results, overflow, additional, stats = AddSub.add_many_model(numbers_1, numbers_2, 8, adder)
+            self.assertEqual(results.tolist(), expected[0].tolist())
+            self.assertEqual(overflow.tolist(), expected[1].tolist())
+            self.assertEqual(additional.tolist(), expected[2].tolist())
+            self.assertEqual(stats["bits"], 8)
+
+    def test_accumulate(self):
+        total, wrapped, saturated, overflow = AddSub.accumulate([100, 20, 10, -50, -100, -100, 5], bits=8)
+        self.assertEqual(total, -115)
+        self.assertEqual(wrapped, -115)
+        self.assertEqual(saturated, -115)
+        self.assertEqual(overflow.tolist(), [2, 3])
+
+        total, wrapped, saturated, _ = AddSub.accumulate(iter([127, 127, 127]), bits=8)
+        self.assertEqual((total, wrapped, saturated), (381, 125, 127))
+
+    def test_accumulate_matches_chained_add(self):
+        rng = np.random.default_rng(3)
+        for bits in (8, 40, 64):
+            limit = 1 << (bits - 1)
+            numbers = rng.integers(-limit, limit, size=3000)
+            expected = []
+            running = 0
+            for index, number in enumerate(numbers.tolist()):
+                try:
+                    running = AddSub(running, number, bits).add_additional()[0]
+                except OverflowError:
+                    expected.append(index)
+                    running = ((running + number + limit) & (2 * limit - 1)) - limit
+            total, wrapped, _, overflow = AddSub.accumulate(numbers, bits, chunk_size=257)
+            self.assertEqual(total, sum(numbers.tolist()))
+            self.assertEqual(wrapped, running)
+            self.assertEqual(overflow.tolist(), expected)
+
+    def test_accumulate_rejects_wide_terms(self):
+        with self.assertRaises(ValueError):
+            AddSub.accumulate([1, 200], bits=8)
+        with self.assertRaises(ValueError):
+            AddSub.accumulate([1, 2 ** 50], bits=40)
+        total, wrapped, saturated, overflow = AddSub.accumulate([2 ** 69 - 1, 1, -5], bits=70)
+        self.assertEqual((total, wrapped, saturated, overflow.tolist()), (2 ** 69 - 5, 2 ** 69 - 5, 2 ** 69 - 5, [1, 2]))
+        total, wrapped, saturated, overflow = AddSub.accumulate([], bits=8)
+        self.assertEqual((total, wrapped, saturated, overflow.tolist()), (0, 0, 0, []))
+
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,69 @@
+import random
+import unittest
+
+import numpy as np
+
+from binary_calculator.adder_engine import AdderEngine
+
+
+class TestAdderEngine(unittest.TestCase):
+
+    def test_adders_match_integer_sum(self):
+        rng = random.Random(0)
+        for bits in (1, 3, 4, 7, 8, 16, 33, 64, 130):
+            mask = (1 << bits) - 1
+            for adder in AdderEngine.ADDERS:
+                for _ in range(50):
+                    a, b, carry_in = rng.getrandbits(bits), rng.getrandbits(bits), rng.randint(0, 1)
+                    total, carry_out, _ = AdderEngine.add(a, b, bits, adder, carry_in)
+                    self.assertEqual(total, (a + b + carry_in) & mask, (adder, bits, a, b))
+                    self.assertEqual(carry_out, (a + b + carry_in) >> bits, (adder, bits, a, b))
+
+    def test_adders_on_arrays(self):
+        rng = np.random.default_rng(1)
+        a = rng.integers(0, 1 << 63, size=500, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        b = rng.integers(0, 1 << 63, size=500, dtype=np.uint64) * np.uint64(2)
+        expected = [int(x) + int(y) for x, y in zip(a, b)]
+        for adder in AdderEngine.ADDERS:
+            total, carry_out, _ = AdderEngine.add(a, b, 64, adder)
+            self.assertEqual(total.tolist(), [value & ((1 << 64) - 1) for value in expected])
+            self.assertEqual(carry_out.tolist(), [value >> 64 for value in expected])
+
+    def test_ripple_carry_chain(self):
+        _, carry_out, stats = AdderEngine.add(0b11111111, 0b00000001, 8, "ripple")
+        self.assertEqual(carry_out, 1)
+        self.assertEqual(stats["carry_chain"], 7)
+        self.assertEqual(AdderEngine.add(0b1010, 0b0101, 4, "ripple")[2]["carry_chain"], 0)
+
+    def test_gate_delay_model(self):
+        delays = {adder: AdderEngine.add(0, 0, 64, adder)[2]["gate_delay"] for adder in AdderEngine.ADDERS}
+        self.assertEqual(delays["ripple"], 2 + 2 * 64)
+        self.assertEqual(delays["kogge_stone"], 2 + 2 * 6)
+        self.assertLess(delays["kogge_stone"], delays["carry_lookahead"])
+        self.assertLess(delays["carry_lookahead"], delays["carry_select"])
+        self.assertLess(delays["carry_select"], delays["ripple"])
+
+        gates = {adder: AdderEngine.add(0, 0, 64, adder)[2]["gates"] for adder in AdderEngine.ADDERS}
+        self.assertEqual(min(gates, key=gates.get), "ripple")
+        self.assertEqual(max(gates, key=gates.get), "kogge_stone")
+
+    def test_carry_save(self):
+        rng = random.Random(2)
+        for count in (1, 2, 3, 10, 31):
+            operands = [rng.getrandbits(16) for _ in range(count)]
+            total, stats = AdderEngine.carry_save(operands, 16, "carry_lookahead")
+            self.assertEqual(total, sum(operands) & 0xFFFF)
+            self.assertEqual(stats["final_adder"], "carry_lookahead")
+        self.assertEqual(AdderEngine.carry_save([1, 2, 3, 4], 8)[1]["csa_levels"], 2)
+
+    def test_invalid_adder(self):
+        with self.assertRaises(ValueError):
+            AdderEngine.add(1, 2, 8, "magic")
+        with self.assertRaises(ValueError):
+            AdderEngine.carry_save([], 8)
+        with self.assertRaises(ValueError):
+            AdderEngine.add(np.zeros(2, dtype=np.uint64), 0, 65)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import io
+import json
+import unittest
+
+from binary_calculator.batch import BatchProcessor
+
+
+class TestBatchProcessor(unittest.TestCase):
+
+    def run_jsonl(self, records, **options):
+        source = io.StringIO("".join(json.dumps(record) + "\n" for record in records))
+        target = io.StringIO()
+        count = BatchProcessor("jsonl", **options).process(source, target)
+        self.assertEqual(count, len(records))
+        return [json.loads(line) for line in target.getvalue().splitlines()]
+
+    def test_operations(self):
+        results = self.run_jsonl([
+            {"op": "convert", "a": -5, "bits": 8, "code": "direct"},
+            {"op": "add", "a": 5, "b": -3},
+            {"op": "sub", "a": 3, "b": 5, "bits": 4},
+            {"op": "mul", "a": -4, "b": 3},
+            {"op": "div", "a": 7, "b": 2, "precision": 3},
+            {"op": "ieee-add", "a": 2.5, "b": 3.5},
+        ])
+        self.assertEqual([result["binary"] for result in results],
+                         ["1 0000101", "00000010", "1110", "10001100", "0011.100",
+                          "01000000110000000000000000000000"])
+        self.assertEqual([result["result"] for result in results], [-5, 2, -2, -12, 3.5, "6.0"])
+        self.assertTrue(all(result["error"] == "" for result in results))
+
+    def test_errors_do_not_stop_stream(self):
+        results = self.run_jsonl([
+            {"op": "div", "a": 1, "b": 0},
+            {"op": "add", "a": 100, "b": 100},
+            {"op": "pow", "a": 2, "b": 3},
+            {"op": "convert", "a": "x"},
+            {"op": "add", "a": 1, "b": 1},
+        ])
+        self.assertEqual(results[0]["error"], "Деление на ноль невозможно!")
+        self.assertEqual(results[1]["error"], "Переполнение при сложении в дополнительном коде!")
+        self.assertEqual(results[2]["error"], "Неизвестная операция: pow")
+        self.assertNotEqual(results[3]["error"], "")
+        self.assertEqual(results[4]["result"], 2)
+
+    def test_bad_lines_become_error_records(self):
+        source = io.StringIO('{"op": "add", "a": 1}\n{"op": "add", "a": 1,\n[1, 2]\n'
+                             '{"op": "add", "a": 1, "b": 1, "bits": 0}\n{"op": "add", "a": 1, "b": 2}\n')
+        target = io.StringIO()
+        self.assertEqual(BatchProcessor("jsonl").process(source, target), 5)
+        results = [json.loads(line) for line in target.getvalue().splitlines()]
+        self.assertEqual(results[0]["error"], "Нет поля: b")
+        self.assertTrue(results[1]["error"].startswith("Некорректная строка JSON"))
+        self.assertEqual(results[1]["input"], '{"op": "add", "a": 1,')
+        self.assertEqual(results[2]["error"], "Запись должна быть объектом JSON")
+        self.assertEqual(results[3]["error"], "Разрядность должна быть положительной: 0")
+        self.assertEqual(results[4]["result"], 3)
+
+    def test_ieee_add_shortest_decimal(self):
+        results = self.run_jsonl([{"op": "ieee-add", "a": "0.1", "b": "0.2"}])
+        self.assertEqual(results[0]["result"], "0.3")
+
+    def test_csv_round_trip(self):
+        source = io.StringIO("op,a,b,bits\nsub,10,3,16\nconvert,13,,8\n")
+        target = io.StringIO()
+        BatchProcessor("csv").process(source, target)
+        self.assertEqual(target.getvalue().splitlines(), [
+            "op,a,b,bits,result,binary,error",
+            "sub,10,3,16,7,0000000000000111,",
+            "convert,13,,8,13,0 0001101,",
+        ])
+
+    def test_process_pool_keeps_order(self):
+        records = [{"op": "add", "a": i, "b": 1, "bits": 16} for i in range(50)]
+        results = self.run_jsonl(records, workers=2, chunk_size=7)
+        self.assertEqual([result["result"] for result in results], list(range(1, 51)))
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            BatchProcessor("xml")
+        with self.assertRaises(ValueError):
+            BatchProcessor("csv", workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
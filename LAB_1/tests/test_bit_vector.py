@@ -0,0 +1,62 @@
+import unittest
+
+from binary_calculator.bit_vector import BitVector
+from binary_calculator.converter import Converter
+from binary_calculator.standart_ieee754 import StandartIEEE754
+from binary_calculator.wide_word import WideWord
+
+
+class TestBitVector(unittest.TestCase):
+
+    def test_twos_complement_storage(self):
+        vector = BitVector(-5, 8)
+        self.assertEqual(vector.value, 0b11111011)
+        self.assertEqual(str(vector), "11111011")
+        self.assertEqual(vector.sign, 1)
+        self.assertEqual(vector.to_signed(), -5)
+        self.assertEqual(BitVector(300, 8).to_signed(), 44)
+        self.assertEqual(str(BitVector(0, 0)), "")
+
+    def test_from_string(self):
+        self.assertEqual(BitVector.from_string("1 0000101"), BitVector(0b10000101, 8))
+        self.assertEqual(BitVector.from_string("0011"), BitVector(3, 4))
+        with self.assertRaises(ValueError):
+            BitVector.from_string("01a1")
+
+    def test_add_with_carry(self):
+        result, carry = BitVector(-1, 8).add(BitVector(1, 8))
+        self.assertEqual((result.value, carry), (0, 1))
+        result, carry = BitVector(100, 8).add(BitVector(27, 8), carry=1)
+        self.assertEqual((result.to_signed(), carry), (-128, 0))
+
+    def test_indexing_and_format(self):
+        vector = BitVector(0b10000101, 8)
+        self.assertEqual([vector[0], vector[-1], vector[1]], [1, 1, 0])
+        self.assertEqual(vector[1:4], "000")
+        self.assertEqual(vector.format_code(), "1 0000101")
+        self.assertEqual(len(vector), 8)
+        with self.assertRaises(IndexError):
+            vector[8]
+
+    def test_bitwise(self):
+        a, b = BitVector(0b1100, 4), BitVector(0b1010, 4)
+        self.assertEqual(str(a & b), "1000")
+        self.assertEqual(str(a | b), "1110")
+        self.assertEqual(str(a ^ b), "0110")
+        self.assertEqual(str(~a), "0011")
+        self.assertEqual(str(a << 1), "1000")
+        self.assertEqual(str(a >> 3), "0001")
+        self.assertEqual(str(a.resize(6)), "001100")
+
+    def test_used_by_lab_classes(self):
+        self.assertEqual(Converter(-5, 8).vector("reverse"), BitVector(0b11111010, 8))
+        self.assertEqual(WideWord(-5, 8).vector("direct"), BitVector(0b10000101, 8))
+        calc = StandartIEEE754(1.0, 2.0)
+        vector = calc.float_to_vector(-2.5)
+        self.assertEqual(calc.ieee754_to_float(vector), -2.5)
+        with self.assertRaises(ValueError):
+            calc.ieee754_to_float(BitVector(0, 16))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+from binary_calculator.code_cache import CodeCache
+from binary_calculator.converter import Converter
+
+
+class TestCodeCache(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+
+        def compute(number, bits, code):
+            self.calls.append((number, bits, code))
+            return f"{code}:{number}:{bits}"
+
+        self.cache = CodeCache(compute, max_size=2)
+
+    def test_hits_and_misses(self):
+        self.assertEqual(self.cache.get(5, 8, "direct"), "direct:5:8")
+        self.assertEqual(self.cache.get(5, 8, "direct"), "direct:5:8")
+        self.assertEqual(self.calls, [(5, 8, "direct")])
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (1, 1, 1))
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.get(1, 8, "direct")
+        self.cache.get(2, 8, "direct")
+        self.cache.get(1, 8, "direct")
+        self.cache.get(3, 8, "direct")
+        self.cache.get(1, 8, "direct")
+        self.cache.get(2, 8, "direct")
+        self.assertEqual(self.calls.count((1, 8, "direct")), 1)
+        self.assertEqual(self.calls.count((2, 8, "direct")), 2)
+        self.assertEqual(self.cache.stats()["size"], 2)
+
+    def test_tables_for_narrow_widths(self):
+        built = []
+
+        def compute_table(bits, code):
+            built.append((bits, code))
+            return [f"{code}{number}" for number in range(-(1 << (bits - 1)), 1 << (bits - 1))]
+
+        cache = CodeCache(lambda number, bits, code: "lru", compute_table, table_max_bits=4)
+        self.assertEqual(cache.get(-8, 4, "reverse"), "reverse-8")
+        self.assertEqual(cache.get(7, 4, "reverse"), "reverse7")
+        self.assertEqual(cache.get(8, 4, "reverse"), "lru")
+        self.assertEqual(cache.get(1, 5, "reverse"), "lru")
+        self.assertEqual(built, [(4, "reverse")])
+        self.assertEqual(cache.stats()["tables"], [(4, "reverse")])
+
+    def test_table_build_is_a_miss(self):
+        cache = CodeCache(lambda number, bits, code: "lru", lambda bits, code: [code] * (1 << bits))
+        cache.get(1, 8, "direct")
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        cache.get(-3, 8, "direct")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        cache.get(1, 8, "reverse")
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_clear(self):
+        self.cache.get(1, 8, "direct")
+        self.cache.clear()
+        self.assertEqual(self.cache.stats()["size"], 0)
+        self.assertEqual(self.cache.hits + self.cache.misses, 0)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            CodeCache(str, max_size=0)
+
+
+class TestConverterCache(unittest.TestCase):
+
+    def test_table_matches_scalar_codes(self):
+        for code in Converter.CODES:
+            for bits in (1, 2, 8):
+                for number in range(-(1 << (bits - 1)), 1 << (bits - 1)):
+                    expected = getattr(Converter(number, bits), f"{code}_code")()
+                    self.assertEqual(Converter.cached_code(number, bits, code), expected)
+
+    def test_wide_and_out_of_range_values(self):
+        self.assertEqual(Converter.cached_code(-5, 40, "reverse"), Converter(-5, 40).reverse_code())
+        self.assertEqual(Converter.cached_code(300, 8, "direct"), Converter(300, 8).direct_code())
+
+    def test_unknown_code(self):
+        with self.assertRaises(ValueError):
+            Converter.cached_code(1, 8, "binary")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,8 @@
 import unittest
+
+import numpy as np
+
+from binary_calculator.bit_vector import BitVector
 from binary_calculator.converter import Converter
 
 
@@ -50,6 +54,59 @@ class TestConverter(unittest.TestCase):
         self.assertEqual(Converter(0, bits=8).additional_code(), "0 0000000")
         self.assertEqual(Converter(-128, bits=8).additional_code(), "1 0000000")
 
+    def test_code_words(self):
+        self.assertEqual(Converter(5, bits=8).direct_word(), 0b00000101)
+        self.assertEqual(Converter(-5, bits=8).direct_word(), 0b10000101)
+        self.assertEqual(Converter(-5, bits=8).reverse_word(), 0b11111010)
+        self.assertEqual(Converter(-5, bits=8).additional_word(), 0b11111011)
+        self.assertEqual(Converter(-128, bits=8).additional_word(), 0b10000000)
+
+    def test_wide_codes(self):
+        converter = Converter(-1, bits=64)
+        self.assertEqual(converter.direct_code(), "1 " + "0" * 62 + "1")
+        self.assertEqual(converter.reverse_code(), "1 " + "1" * 62 + "0")
+        self.assertEqual(converter.additional_code(), "1 " + "1" * 63)
+
+    def test_format_code(self):
+        self.assertEqual(Converter.format_code(0b11111011, 8), "1 1111011")
+        self.assertEqual(Converter.to_binary(5, 0), "")
+        for word, bits in ((0, 1), (1, 1), (0b10000000, 8), (-5, 8), (1 << 70, 64)):
+            self.assertEqual(Converter.format_code(word, bits), BitVector(word, bits).format_code())
+
+    def test_encode_many_matches_scalar(self):
+        values = np.array([0, 5, -5, 127, -127, -128, 200, -300])
+        for code in Converter.CODES:
+            words, _ = Converter.encode_many(values, bits=8, code=code)
+            expected = [getattr(Converter(int(v), 8), f"{code}_word")() for v in values]
+            self.assertEqual(words.tolist(), expected)
+
+    def test_encode_many_overflow_mask(self):
+        values = np.array([127, -127, -128, 128])
+        _, overflow = Converter.encode_many(values, bits=8, code="additional")
+        self.assertEqual(overflow.tolist(), [False, False, False, True])
+        _, overflow = Converter.encode_many(values, bits=8, code="direct")
+        self.assertEqual(overflow.tolist(), [False, False, True, True])
+
+    def test_encode_many_bit_formats(self):
+        bit_matrix, _ = Converter.encode_many([-5, 5], bits=8, code="additional", output="bits")
+        self.assertEqual(bit_matrix.dtype, np.uint8)
+        self.assertEqual(bit_matrix.tolist(), [[1, 1, 1, 1, 1, 0, 1, 1], [0, 0, 0, 0, 0, 1, 0, 1]])
+        packed, _ = Converter.encode_many([-5, 5], bits=12, code="direct", output="packed")
+        self.assertEqual(packed.tolist(), [[0b10000000, 0b01010000], [0b00000000, 0b01010000]])
+        words, _ = Converter.encode_many([-1], bits=64)
+        self.assertEqual(Converter.format_many(words, 64), ["1 " + "1" * 63])
+        # Список целых со словами от 2^63 и меньше не должен читаться как float64
+        words = [Converter(-3, 64).direct_word(), Converter(3, 64).direct_word()]
+        self.assertEqual(Converter.format_many(words, 64), ["1 " + "0" * 61 + "11", "0 " + "0" * 61 + "11"])
+
+    def test_encode_many_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            Converter.encode_many([1], bits=65)
+        with self.assertRaises(ValueError):
+            Converter.encode_many([1], code="unknown")
+        with self.assertRaises(ValueError):
+            Converter.encode_many([1], output="unknown")
+
 
 
 if __name__ == "__main__":
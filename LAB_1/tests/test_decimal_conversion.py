@@ -0,0 +1,113 @@
+import random
+import struct
+import unittest
+
+import numpy as np
+
+from binary_calculator.decimal_conversion import DecimalConversion
+
+
+class TestDecimalConversion(unittest.TestCase):
+
+    def setUp(self):
+        self.binary32 = DecimalConversion(32)
+        self.binary64 = DecimalConversion(64)
+
+    @staticmethod
+    def double_word(text):
+        return struct.unpack(">Q", struct.pack(">d", float(text)))[0]
+
+    def test_parse_binary64_matches_float(self):
+        rng = random.Random(0)
+        texts = ["0.1", "1e23", "9007199254740993", "2.2250738585072011e-308", "4.9e-324",
+                 "2.4703282292062327e-324", "2.4703282292062328e-324", "1.7976931348623157e308",
+                 "1.7976931348623159e308", "3.14159265358979323846264338327950288419716939937510",
+                 "-0", ".5", "5.", "+1E5", "  42  "]
+        for _ in range(2000):
+            digits = "".join(rng.choice("0123456789") for _ in range(rng.randint(1, 25)))
+            texts.append(f"{digits}e{rng.randint(-345, 310)}")
+        for text in texts:
+            self.assertEqual(self.binary64.parse_word(text), self.double_word(text), text)
+
+    def test_parse_binary32_rounds_once(self):
+        # Через double эти строки округлились бы дважды
+        self.assertEqual(self.binary32.parse_word("16777217"), 0x4B800000)
+        self.assertEqual(self.binary32.parse_word("16777219"), 0x4B800002)
+        self.assertEqual(self.binary32.parse_word("1.00000005960464477539062500001"), 0x3F800001)
+        self.assertEqual(self.binary32.parse_word("1.000000059604644775390625"), 0x3F800000)
+        self.assertEqual(self.binary32.parse_word("3.4028235677973366e38"), 0x7F7FFFFF)
+        self.assertEqual(self.binary32.parse_word("3.4028235677973367e38"), 0x7F800000)
+        self.assertEqual(self.binary32.parse_word("7.0064923216240862e-46"), 0x00000001)
+        self.assertEqual(self.binary32.parse_word("7.006492321624085e-46"), 0x00000000)
+        self.assertEqual(self.binary32.parse("0.1"), "00111101110011001100110011001101")
+
+    def test_eisel_lemire_matches_exact(self):
+        rng = random.Random(1)
+        for _ in range(2000):
+            digits = rng.randint(1, 10 ** 19 - 1)
+            exponent = rng.randint(-70, 40)
+            fast = self.binary32._eisel_lemire(digits, exponent)
+            if fast is not None:
+                self.assertEqual(fast, self.binary32._exact(digits, exponent), (digits, exponent))
+
+    def test_specials_and_errors(self):
+        self.assertEqual(self.binary32.parse_word("-inf"), 0xFF800000)
+        self.assertEqual(self.binary32.parse_word("Infinity"), 0x7F800000)
+        self.assertEqual(self.binary32.parse_word("nan"), 0x7FC00000)
+        self.assertEqual(self.binary32.parse_word("-0.0"), 0x80000000)
+        self.assertEqual(self.binary64.parse_word("1e-400"), 0)
+        self.assertEqual(self.binary64.parse_word("1e99999999999"), 0x7FF0000000000000)
+        for text in ("", "1..2", "e5", "--1", "1e", "0x10"):
+            with self.assertRaises(ValueError):
+                self.binary32.parse_word(text)
+        with self.assertRaises(ValueError):
+            DecimalConversion(16)
+
+    def test_format_binary64_matches_repr(self):
+        rng = random.Random(2)
+        for _ in range(3000):
+            word = rng.getrandbits(64)
+            value = struct.unpack(">d", struct.pack(">Q", word))[0]
+            if value == value:
+                self.assertEqual(self.binary64.format_word(word), repr(value))
+
+    def test_format_binary32_shortest(self):
+        self.assertEqual(self.binary32.format_word(0x3DCCCCCD), "0.1")
+        self.assertEqual(self.binary32.format_word(0x7F7FFFFF), "3.4028235e+38")
+        self.assertEqual(self.binary32.format_word(0x00000001), "1e-45")
+        self.assertEqual(self.binary32.format_word(0x4B800000), "16777216.0")
+        self.assertEqual(self.binary32.format_word(0xFF800000), "-inf")
+        self.assertEqual(self.binary32.format("10000000000000000000000000000000"), "-0.0")
+
+        rng = np.random.default_rng(3)
+        words = rng.integers(0, 1 << 32, size=3000, dtype=np.uint64).astype(np.uint32)
+        for word, value in zip(words.tolist(), words.view(np.float32)):
+            if not np.isfinite(value):
+                continue
+            text = self.binary32.format_word(word)
+            self.assertEqual(self.binary32.parse_word(text), word)
+            reference = np.format_float_scientific(value, unique=True)
+            self.assertEqual(float(text), float(reference))
+
+    def test_bulk(self):
+        texts = ["0.1", "16777217", "-2.5e-3", "3.4028235677973366e38", "1e39", "7.0064923216240862e-46"]
+        self.assertEqual(self.binary32.parse_many(texts).tolist(),
+                         [self.binary32.parse_word(text) for text in texts])
+        self.assertEqual(self.binary64.parse_many(texts).tolist(), [self.double_word(text) for text in texts])
+        self.assertEqual(self.binary32.format_many(self.binary32.parse_many(texts)),
+                         ["0.1", "16777216.0", "-0.0025", "3.4028235e+38", "inf", "1e-45"])
+        self.assertEqual(self.binary64.format_many(self.binary64.parse_many(["0.1", "1e23"])), ["0.1", "1e+23"])
+        words = [self.binary64.parse_word("-0.1"), self.binary64.parse_word("0.1")]
+        self.assertEqual(self.binary64.format_many(words), ["-0.1", "0.1"])
+
+    def test_bulk_rejects_like_scalar(self):
+        for text in ("1_0", "١٢", "", "1..2", "e5", "--1", "1e", "0x10", "infinit"):
+            for conversion in (self.binary32, self.binary64):
+                with self.assertRaises(ValueError):
+                    conversion.parse_word(text)
+                with self.assertRaises(ValueError):
+                    conversion.parse_many(["1", text])
+
+
+if __name__ == '__main__':
+    unittest.main()
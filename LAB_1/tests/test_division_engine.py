@@ -0,0 +1,42 @@
+import random
+import unittest
+
+from binary_calculator.division_engine import DivisionEngine
+
+
+class TestDivisionEngine(unittest.TestCase):
+
+    def test_methods_match_integer_division(self):
+        rng = random.Random(0)
+        for method in DivisionEngine.METHODS:
+            for _ in range(300):
+                dividend = rng.getrandbits(rng.choice([1, 8, 64, 300]))
+                divisor = rng.getrandbits(rng.choice([1, 8, 64, 200])) or 1
+                self.assertEqual(DivisionEngine.divide(dividend, divisor, method), dividend // divisor)
+
+    def test_srt_radix4_edge_divisors(self):
+        for divisor in [1, 2, 3, 255, 256, (1 << 100) - 1, 1 << 100]:
+            for dividend in [0, divisor - 1, divisor, divisor * 7 + 3, (1 << 300) - 1]:
+                self.assertEqual(DivisionEngine.srt_radix4(dividend, divisor), dividend // divisor)
+
+    def test_integer_width(self):
+        self.assertEqual(DivisionEngine.integer_width(6, 3), 2)
+        self.assertEqual(DivisionEngine.integer_width(7, 3), 3)
+        self.assertEqual(DivisionEngine.integer_width(0, 3), 1)
+
+    def test_stream_bits(self):
+        bits = DivisionEngine.stream_bits(1, 3)
+        self.assertEqual([next(bits) for _ in range(6)], [0, 1, 0, 1, 0, 1])
+        self.assertEqual(list(DivisionEngine.stream_bits(1, 4, precision=3)), [0, 1, 0])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ZeroDivisionError):
+            DivisionEngine.divide(1, 0)
+        with self.assertRaises(ValueError):
+            DivisionEngine.divide(1, 1, "newton")
+        with self.assertRaises(ValueError):
+            DivisionEngine.divide(-1, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
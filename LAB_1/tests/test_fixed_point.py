@@ -0,0 +1,82 @@
+import unittest
+
+import numpy as np
+
+from binary_calculator.fixed_point import FixedPoint, FixedPointArray
+
+
+class TestFixedPoint(unittest.TestCase):
+
+    def test_from_float_and_binary(self):
+        value = FixedPoint.from_float(3.25, 3, 4)
+        self.assertEqual(value.raw, 52)
+        self.assertEqual(value.binary(), "0011.0100")
+        self.assertEqual(FixedPoint.from_float(-3.25, 3, 4).binary(), "1100.1100")
+        self.assertEqual(FixedPoint.from_float(5, 3, 0, signed=False).binary(), "101")
+        self.assertEqual(float(FixedPoint.from_float(-0.5, 0, 7)), -0.5)
+
+    def test_arithmetic(self):
+        a = FixedPoint.from_float(2.5, 7, 8)
+        b = FixedPoint.from_float(-1.25, 7, 8)
+        self.assertEqual((a + b).to_float(), 1.25)
+        self.assertEqual((a - b).to_float(), 3.75)
+        self.assertEqual((a * b).to_float(), -3.125)
+        self.assertEqual((a / b).to_float(), -2.0)
+        self.assertEqual((-b).to_float(), 1.25)
+
+    def test_rounding(self):
+        third = FixedPoint.from_float(1, 3, 4) / FixedPoint.from_float(3, 3, 4)
+        self.assertEqual(third.raw, 5)
+        # 0.5 * 0.0625 = 2^-5: половина младшего разряда округляется вверх
+        product = FixedPoint.from_float(0.5, 3, 4) * FixedPoint.from_float(0.0625, 3, 4)
+        self.assertEqual(product.raw, 1)
+
+    def test_saturate_and_wrap(self):
+        big = FixedPoint.from_float(7.5, 3, 4)
+        self.assertEqual((big + big).to_float(), 7.9375)
+        self.assertEqual((-big - big).to_float(), -8.0)
+        wrapped = FixedPoint.from_float(7.5, 3, 4, overflow="wrap")
+        self.assertEqual((wrapped + wrapped).to_float(), -1.0)
+        unsigned = FixedPoint.from_float(1, 4, 0, signed=False, overflow="wrap")
+        self.assertEqual((unsigned - unsigned - unsigned).raw, 15)
+        self.assertEqual(FixedPoint.from_float(-3, 4, 0, signed=False).raw, 0)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            FixedPoint.from_float(1, 3, 4) + FixedPoint.from_float(1, 3, 5)
+        with self.assertRaises(ZeroDivisionError):
+            FixedPoint.from_float(1, 3, 4) / FixedPoint(0, 3, 4)
+        with self.assertRaises(ValueError):
+            FixedPoint(0, 3, 4, overflow="clip")
+
+
+class TestFixedPointArray(unittest.TestCase):
+
+    def test_matches_scalar(self):
+        rng = np.random.default_rng(13)
+        for signed, overflow in ((True, "saturate"), (True, "wrap"), (False, "saturate"), (False, "wrap")):
+            a = FixedPointArray.from_float(rng.uniform(-20, 20, 300), 4, 10, signed, overflow)
+            b = FixedPointArray.from_float(rng.uniform(-20, 20, 300), 4, 10, signed, overflow)
+            b.raw[b.raw == 0] = 1
+            for name in ("add", "sub", "mul", "div"):
+                result = getattr(a, name)(b)
+                expected = [getattr(a[i], name)(b[i]).raw for i in range(len(a))]
+                self.assertEqual(result.raw.tolist(), expected, (signed, overflow, name))
+
+    def test_close_to_float(self):
+        x = np.linspace(-3, 3, 101)
+        y = np.linspace(1, 2, 101)
+        a = FixedPointArray.from_float(x, 3, 20)
+        b = FixedPointArray.from_float(y, 3, 20)
+        np.testing.assert_allclose((a * b).to_float(), x * y, atol=2 ** -19)
+        np.testing.assert_allclose((a / b).to_float(), x / y, atol=2 ** -19)
+
+    def test_limits(self):
+        with self.assertRaises(ValueError):
+            FixedPointArray([0], 16, 16)
+        with self.assertRaises(ZeroDivisionError):
+            FixedPointArray([1, 2]) / FixedPointArray([1, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
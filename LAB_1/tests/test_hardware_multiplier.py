@@ -0,0 +1,63 @@
+import random
+import unittest
+
+import numpy as np
+
+from binary_calculator.hardware_multiplier import HardwareMultiplier
+
+
+class TestHardwareMultiplier(unittest.TestCase):
+
+    def test_products_match(self):
+        rng = random.Random(0)
+        for bits in (1, 2, 5, 8, 13, 32, 64):
+            limit = 1 << (bits - 1)
+            for encoding in HardwareMultiplier.ENCODINGS:
+                for tree in HardwareMultiplier.TREES:
+                    for _ in range(30):
+                        a, b = rng.randrange(-limit, limit), rng.randrange(-limit, limit)
+                        product, _ = HardwareMultiplier.multiply(a, b, bits, encoding, tree)
+                        self.assertEqual(product, (a * b) & ((1 << (2 * bits)) - 1), (bits, encoding, tree, a, b))
+
+    def test_batch(self):
+        rng = np.random.default_rng(1)
+        a = rng.integers(-2 ** 31, 2 ** 31, size=300)
+        b = rng.integers(-2 ** 31, 2 ** 31, size=300)
+        for encoding in HardwareMultiplier.ENCODINGS:
+            product, stats = HardwareMultiplier.multiply(a, b, 32, encoding, "dadda")
+            self.assertTrue(np.array_equal(product.view(np.int64), a * b))
+        with self.assertRaises(ValueError):
+            HardwareMultiplier.multiply(a, b, 33)
+
+    def test_partial_products(self):
+        products, zero_products = HardwareMultiplier.partial_products(3, 0b0110, 4, "booth2")
+        self.assertEqual(len(products), 4)
+        self.assertEqual(zero_products, 2)
+        self.assertEqual(sum(products) & 0xFF, 18)
+
+        products, zero_products = HardwareMultiplier.partial_products(3, 0b0110, 4, "booth4")
+        self.assertEqual(len(products), 2)
+        self.assertEqual(zero_products, 0)
+
+    def test_stage_statistics(self):
+        _, wallace = HardwareMultiplier.multiply(1, 1, 32, "booth2", "wallace")
+        _, dadda = HardwareMultiplier.multiply(1, 1, 32, "booth2", "dadda")
+        self.assertEqual(wallace["partial_products"], 32)
+        self.assertEqual(wallace["stages"][0], {"rows": 32, "compressors": 10, "rows_after": 22})
+        self.assertEqual([stage["rows"] for stage in dadda["stages"]], [32, 28, 19, 13, 9, 6, 4, 3])
+        self.assertEqual(len(dadda["stages"]), len(wallace["stages"]))
+        self.assertEqual(wallace["stages"][-1]["rows_after"], 2)
+
+        _, booth4 = HardwareMultiplier.multiply(1, 1, 32, "booth4", "wallace")
+        self.assertEqual(booth4["partial_products"], 16)
+        self.assertLess(booth4["gate_delay"], wallace["gate_delay"])
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            HardwareMultiplier.multiply(1, 2, 8, encoding="booth8")
+        with self.assertRaises(ValueError):
+            HardwareMultiplier.multiply(1, 2, 8, tree="array")
+
+
+if __name__ == '__main__':
+    unittest.main()
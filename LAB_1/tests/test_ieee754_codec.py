@@ -0,0 +1,64 @@
+import math
+import unittest
+
+import numpy as np
+
+from binary_calculator.ieee754_codec import IEEE754Codec
+
+
+class TestIEEE754Codec(unittest.TestCase):
+
+    def test_encode_decode_formats(self):
+        self.assertEqual(IEEE754Codec(16).encode(1.0), "0011110000000000")
+        self.assertEqual(IEEE754Codec(32).encode(-2.5), "11000000001000000000000000000000")
+        self.assertEqual(IEEE754Codec(64).encode_word(1.0), 0x3FF0000000000000)
+        self.assertEqual(IEEE754Codec(16).decode("0111101111111111"), 65504.0)
+
+    def test_overflow_to_infinity(self):
+        codec = IEEE754Codec(16)
+        self.assertEqual(codec.encode_word(1e6), 0x7C00)
+        self.assertEqual(codec.encode_word(-1e6), 0xFC00)
+
+    def test_round_trip_all_float16(self):
+        codec = IEEE754Codec(16)
+        words = np.arange(1 << 16, dtype=np.uint16)
+        values = codec.decode_many(words)
+        finite = ~np.isnan(values)
+        self.assertTrue(np.array_equal(codec.encode_many(values.astype(np.float64))[finite], words[finite]))
+
+    def test_scalar_matches_batch(self):
+        codec = IEEE754Codec(32)
+        values = np.random.default_rng(0).standard_normal(1000) * 1e30
+        words = codec.encode_many(values)
+        self.assertEqual(words.tolist(), [codec.encode_word(float(value)) for value in values])
+
+    def test_classify(self):
+        codec = IEEE754Codec(32)
+        words = codec.encode_many([0.0, 1e-40, 1.0, math.inf, math.nan])
+        self.assertEqual(codec.classify_many(words).tolist(), [IEEE754Codec.ZERO, IEEE754Codec.SUBNORMAL,
+                                                              IEEE754Codec.NORMAL, IEEE754Codec.INFINITY,
+                                                              IEEE754Codec.NAN])
+        self.assertEqual(codec.classify(0x00000001), IEEE754Codec.SUBNORMAL)
+
+    def test_mixed_sign_word_list(self):
+        codec = IEEE754Codec(64)
+        words = [codec.encode_word(-0.1), codec.encode_word(0.1), codec.encode_word(-math.inf)]
+        self.assertEqual(codec.decode_many(words).tolist(), [-0.1, 0.1, -math.inf])
+        self.assertEqual(codec.classify_many(words).tolist(), [IEEE754Codec.NORMAL, IEEE754Codec.NORMAL,
+                                                              IEEE754Codec.INFINITY])
+        self.assertEqual(codec.to_bit_strings(words)[0], format(words[0], "064b"))
+
+    def test_fields(self):
+        self.assertEqual(IEEE754Codec(32).fields(0xC0200000), (1, 128, 0x200000))
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            IEEE754Codec(128)
+        with self.assertRaises(TypeError):
+            IEEE754Codec(32).encode("1.0")
+        with self.assertRaises(ValueError):
+            IEEE754Codec(32).decode("0101")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,7 @@
+import io
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 from main import Main
@@ -27,6 +31,19 @@ class TestMain(unittest.TestCase):
         program = Main()
         program.run()
         mock_print.assert_any_call("Сложение чисел с плавающей точкой StandartIEEE754:")
+        mock_print.assert_any_call("Сумма в десятичном формате: 6.0")
+
+    @patch('builtins.input', side_effect=['9', '0.1', '0.2', '10'])
+    @patch('builtins.print')
+    def test_ieee754_addition_shortest_decimal(self, mock_print, mock_input):
+        Main().run()
+        mock_print.assert_any_call("Сумма в десятичном формате: 0.3")
+
+    @patch('builtins.input', side_effect=['9', 'abc', '0.2'])
+    @patch('builtins.print')
+    def test_ieee754_addition_invalid_number(self, mock_print, mock_input):
+        Main().run()
+        mock_print.assert_any_call("Ошибка: некорректный ввод числа.")
 
     @patch('builtins.input', side_effect=['5', '3', '5', '8', '10'])
     @patch('binary_calculator.add_sub.AddSub.display_add_additional')
@@ -67,6 +84,38 @@ class TestMain(unittest.TestCase):
         program = Main()
         program.run()
 
+    def test_parse_arguments(self):
+        self.assertIsNone(Main.parse_arguments([]).batch)
+        self.assertEqual(Main.parse_arguments(['--batch']).batch, '-')
+        arguments = Main.parse_arguments(['--batch', 'ops.csv', '--workers', '4'])
+        self.assertEqual((arguments.batch, arguments.workers), ('ops.csv', 4))
+
+    def test_run_batch_stdin(self):
+        arguments = Main.parse_arguments(['--batch'])
+        with patch('sys.stdin', io.StringIO('{"op": "add", "a": 1, "b": 2}\n')), \
+                patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.assertEqual(Main().run_batch(arguments), 1)
+        self.assertEqual(json.loads(stdout.getvalue())["result"], 3)
+
+    def test_run_batch_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'ops.csv')
+            target = os.path.join(directory, 'results.csv')
+            with open(source, 'w', encoding='utf-8') as file:
+                file.write('op,a,b\nmul,3,-2\n')
+            Main().run_batch(Main.parse_arguments(['--batch', source, '--output', target]))
+            with open(target, encoding='utf-8') as file:
+                self.assertEqual(file.read().splitlines()[1], 'mul,3,-2,-6,10000110,')
+
+    def test_run_batch_profile(self):
+        with tempfile.TemporaryDirectory() as directory:
+            profile = os.path.join(directory, 'profile.json')
+            arguments = Main.parse_arguments(['--batch', '--profile', profile])
+            with patch('sys.stdin', io.StringIO('{"op": "div", "a": 7, "b": 2}\n')), \
+                    patch('sys.stdout', new_callable=io.StringIO):
+                Main().run_batch(arguments)
+            with open(profile, encoding='utf-8') as file:
+                self.assertEqual(json.load(file)["Operations.binary_divide"]["calls"], 1)
 
 
 if __name__ == '__main__':
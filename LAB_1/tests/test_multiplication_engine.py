@@ -0,0 +1,58 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from binary_calculator.multiplication_engine import MultiplicationEngine
+
+
+class TestMultiplicationEngine(unittest.TestCase):
+
+    def test_limbs_round_trip(self):
+        number = (1 << 200) + 12345
+        limbs = MultiplicationEngine.to_limbs(number)
+        self.assertEqual(limbs.typecode, "Q")
+        self.assertEqual(len(limbs), 7)
+        self.assertEqual(MultiplicationEngine.from_limbs(limbs), number)
+        self.assertEqual(len(MultiplicationEngine.to_limbs(0)), 0)
+
+        with self.assertRaises(ValueError):
+            MultiplicationEngine.to_limbs(-1)
+
+    def test_algorithms_match_native_product(self):
+        rng = random.Random(0)
+        for algorithm in MultiplicationEngine.ALGORITHMS:
+            for bits_a, bits_b in [(1, 1), (33, 64), (1000, 1000), (3000, 200), (12000, 9000)]:
+                a = rng.getrandbits(bits_a)
+                b = rng.getrandbits(bits_b)
+                self.assertEqual(MultiplicationEngine.multiply(a, b, algorithm), a * b)
+
+    def test_all_ones_operands(self):
+        a = (1 << 4096) - 1
+        for algorithm in ("karatsuba", "toom3"):
+            self.assertEqual(MultiplicationEngine.multiply(a, a, algorithm), a * a)
+
+    def test_select_algorithm(self):
+        self.assertEqual(MultiplicationEngine.select_algorithm(1), "schoolbook")
+        self.assertEqual(MultiplicationEngine.select_algorithm(MultiplicationEngine.TOOM3_THRESHOLD - 1), "schoolbook")
+        self.assertEqual(MultiplicationEngine.select_algorithm(MultiplicationEngine.TOOM3_THRESHOLD), "toom3")
+
+    def test_auto_uses_native_product(self):
+        a = (1 << 4096) - 3
+        with patch.object(MultiplicationEngine, "multiply_limbs") as multiply_limbs:
+            self.assertEqual(MultiplicationEngine.multiply(a, a), a * a)
+        multiply_limbs.assert_not_called()
+
+    def test_limbs_auto_matches_native_product(self):
+        rng = random.Random(1)
+        a = rng.getrandbits(3000)
+        b = rng.getrandbits(2000)
+        limbs = MultiplicationEngine.multiply_limbs(MultiplicationEngine.to_limbs(a), MultiplicationEngine.to_limbs(b))
+        self.assertEqual(MultiplicationEngine.from_limbs(limbs), a * b)
+
+    def test_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            MultiplicationEngine.multiply(1 << 40, 1 << 40, "fft")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,7 @@
+import itertools
 import unittest
+
+from binary_calculator.division_engine import DivisionEngine
 from binary_calculator.operations import Operations
 
 
@@ -18,6 +21,37 @@ class TestOperations(unittest.TestCase):
             ops = Operations(3, 50, bits=8)
             ops.multiply_direct()
 
+    def test_multiply_direct_full_width(self):
+        result_decimal, result_direct = Operations(3, 50, bits=8).multiply_direct(full_width=True)
+        self.assertEqual(result_decimal, 150)
+        self.assertEqual(result_direct, "0000000010010110")
+
+        result_decimal, result_direct = Operations(-127, 127, bits=8).multiply_direct(full_width=True)
+        self.assertEqual(result_decimal, -16129)
+        self.assertEqual(result_direct, "1011111100000001")
+
+    def test_multiply_direct_algorithms(self):
+        number_1 = 3 ** 2000
+        number_2 = -(7 ** 1500)
+        for algorithm in ("schoolbook", "karatsuba", "toom3"):
+            result_decimal, result_direct = Operations(number_1, number_2, bits=4096).multiply_direct(
+                full_width=True, algorithm=algorithm)
+            self.assertEqual(result_decimal, number_1 * number_2)
+            self.assertEqual(len(result_direct), 8192)
+            self.assertEqual(result_direct[0], "1")
+
+    def test_multiply_wide(self):
+        result_decimal, result_direct = Operations(3, -2, bits=8).multiply_wide()
+        self.assertEqual(result_decimal, -6)
+        self.assertEqual(str(result_direct), "10000110")
+
+        result_decimal, result_direct = Operations(-(2 ** 2000), 2 ** 2000, bits=4096).multiply_wide()
+        self.assertEqual(result_decimal, -(2 ** 4000))
+        self.assertEqual(str(result_direct), "1" + "0" * 94 + "1" + "0" * 4000)
+
+        with self.assertRaises(OverflowError):
+            Operations(2 ** 2048, 2 ** 2048, bits=4096).multiply_wide()
+
     def test_binary_divide(self):
         ops = Operations(6, 3, bits=8)
         decimal_value, res_binary = ops.binary_divide(precision=5)
@@ -33,6 +67,25 @@ class TestOperations(unittest.TestCase):
             ops = Operations(5, 0, bits=8)
             ops.binary_divide()
 
+    def test_binary_divide_methods(self):
+        for method in DivisionEngine.METHODS:
+            decimal_value, res_binary = Operations(-7, 3, bits=8).binary_divide(precision=6, method=method)
+            self.assertEqual(res_binary, "1010.010101")
+            self.assertEqual(decimal_value, -(2 + 21 / 64))
+
+    def test_binary_divide_high_precision(self):
+        decimal_value, res_binary = Operations(1, 3, bits=8).binary_divide(precision=1000)
+        self.assertEqual(res_binary, "00." + "01" * 500)
+        self.assertEqual(decimal_value, 1 / 3)
+
+    def test_iter_binary_divide(self):
+        _, res_binary = Operations(-8, 3, bits=8).binary_divide(precision=10)
+        stream = Operations(-8, 3, bits=8).iter_binary_divide()
+        self.assertEqual("".join(itertools.islice(stream, len(res_binary))), res_binary)
+
+        with self.assertRaises(ZeroDivisionError):
+            next(Operations(1, 0, bits=8).iter_binary_divide())
+
     def test_edge_cases(self):
         ops = Operations(0, 3, bits=8)
         decimal_value, res_binary = ops.binary_divide(precision=5)
@@ -49,6 +102,23 @@ class TestOperations(unittest.TestCase):
         self.assertEqual(ops.direct_code(5), "00000101")
         self.assertEqual(ops.direct_code(-5), "10000101")
 
+    def test_multiply_hardware(self):
+        for encoding in ("booth2", "booth4"):
+            for tree in ("wallace", "dadda"):
+                result_decimal, result_additional, stats = Operations(-7, 5, bits=8).multiply_hardware(encoding, tree)
+                self.assertEqual(result_decimal, -35)
+                self.assertEqual(result_additional, "1111111111011101")
+                self.assertEqual(stats["tree"], tree)
+        self.assertEqual(Operations(-128, -128, bits=8).multiply_hardware()[0], 16384)
+        with self.assertRaises(OverflowError):
+            Operations(200, 1, bits=8).multiply_hardware()
+
+    def test_multiply_many_hardware(self):
+        results, words, stats = Operations.multiply_many_hardware([3, -4, 127, -128], [5, 6, -1, -128], bits=8)
+        self.assertEqual(results.tolist(), [15, -24, -127, 16384])
+        self.assertEqual(int(words[1]), (-24) & 0xFFFF)
+        self.assertEqual(stats["partial_products"], 4)
+
 
 
 if __name__ == "__main__":
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+from binary_calculator.add_sub import AddSub
+from binary_calculator.parallel import ParallelExecutor
+from binary_calculator.soft_float import SoftFloat
+
+
+class TestParallelExecutor(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ParallelExecutor(workers=2, chunk_size=1000)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.close()
+
+    def test_add_matches_batch(self):
+        rng = np.random.default_rng(0)
+        a = rng.integers(-128, 128, size=5500)
+        b = rng.integers(-128, 128, size=5500)
+        results = self.executor.run("add", a, b, 8)
+        for result, expected in zip(results, AddSub.add_many(a, b, 8)):
+            self.assertTrue(np.array_equal(result, expected))
+
+    def test_soft_float_in_order(self):
+        a = np.arange(3001, dtype=np.float32).view(np.uint32)
+        b = np.full(3001, 0.5, dtype=np.float32).view(np.uint32)
+        words, flags = self.executor.run("ieee-mul", a, b, 32)
+        expected_words, expected_flags = SoftFloat(32).mul(a, b)
+        self.assertEqual(words.tolist(), expected_words.tolist())
+        self.assertEqual(flags.tolist(), expected_flags.tolist())
+        self.assertEqual(words.astype(np.uint32).view(np.float32)[-1], 1500.0)
+
+    def test_mul_and_small_input(self):
+        products, _ = self.executor.run("mul", [3, -4, 127], [5, 6, -1], 8)
+        self.assertEqual(products.tolist(), [15, -24, -127])
+        self.assertEqual(ParallelExecutor(workers=1).run("sub", [7], [4], 8)[0].tolist(), [3])
+
+    def test_mixed_sign_word_list(self):
+        words = np.float64([-0.1, 0.1]).view(np.uint64).tolist()
+        result, _ = ParallelExecutor(workers=1).run("ieee-add", words, [0, 0], 64)
+        self.assertEqual(result.tolist(), words)
+
+    def test_failed_chunk_keeps_executor_usable(self):
+        words = np.zeros(3000, dtype=np.uint64)
+        with self.assertRaises(ValueError):
+            self.executor.run("ieee-add", words, words, 12)
+        products, _ = self.executor.run("mul", [3], [5], 8)
+        self.assertEqual(products.tolist(), [15])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            self.executor.run("pow", [1], [2], 8)
+        with self.assertRaises(ValueError):
+            self.executor.run("add", [1, 2], [3], 8)
+        with self.assertRaises(ValueError):
+            ParallelExecutor(workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+import unittest
+
+from binary_calculator.add_sub import AddSub
+from binary_calculator.multiplication_engine import MultiplicationEngine
+from binary_calculator.operations import Operations
+from binary_calculator.profiling import Profiler
+from binary_calculator.standart_ieee754 import StandartIEEE754
+
+
+class TestProfiler(unittest.TestCase):
+
+    def tearDown(self):
+        Profiler.disable()
+        Profiler.reset()
+
+    def test_disabled_records_nothing(self):
+        Profiler.reset()
+        self.assertEqual(AddSub(3, 4, 8).add_additional(), (7, "00000111"))
+        Profiler.count("bit_iterations")
+        self.assertEqual(Profiler.records, {})
+
+    def test_calls_and_time(self):
+        with Profiler.session():
+            AddSub(3, 4, 8).add_additional()
+            AddSub(3, 4, 8).subtract_additional()
+        report = Profiler.report()
+        self.assertEqual(report["AddSub.add_additional"]["calls"], 2)
+        self.assertEqual(report["AddSub.add_additional"]["bit_iterations"], 0)
+        self.assertEqual(report["AddSub.subtract_additional"]["calls"], 1)
+        self.assertGreater(report["AddSub.add_additional"]["time"], 0)
+        self.assertFalse(Profiler.enabled)
+
+    def test_wrappers_installed_only_when_enabled(self):
+        self.assertFalse(hasattr(AddSub.add_additional, "__wrapped__"))
+        self.assertFalse(hasattr(MultiplicationEngine.multiply, "__wrapped__"))
+        with Profiler.session():
+            self.assertTrue(hasattr(AddSub.add_additional, "__wrapped__"))
+            self.assertEqual(MultiplicationEngine.multiply(6, 7), 42)
+        self.assertFalse(hasattr(AddSub.add_additional, "__wrapped__"))
+        self.assertEqual(Profiler.records["MultiplicationEngine.multiply"]["calls"], 1)
+
+    def test_division_iterations(self):
+        with Profiler.session():
+            Operations(7, 2).binary_divide(5, "restoring")
+        report = Profiler.report()
+        self.assertEqual(report["Operations.binary_divide"]["calls"], 1)
+        # 224 // 2: сдвиг делителя от 6 разрядов до 0
+        self.assertEqual(report["DivisionEngine.divide"]["bit_iterations"], 7)
+
+    def test_soft_float_counters(self):
+        with Profiler.session():
+            StandartIEEE754(0.1, 0.2).ieee754_addition()
+            StandartIEEE754(1.5, 2.0).ieee754_addition()
+        report = Profiler.report()
+        self.assertEqual(report["StandartIEEE754.ieee754_addition"]["calls"], 2)
+        self.assertEqual(report["SoftFloat.add"]["rounding_events"], 1)
+        self.assertGreater(report["SoftFloat.add"]["normalization_shifts"], 0)
+
+    def test_exception_keeps_stack(self):
+        with Profiler.session():
+            with self.assertRaises(ZeroDivisionError):
+                Operations(1, 0).binary_divide()
+            Profiler.count("rounding_events")
+        self.assertEqual(Profiler.records["Operations.binary_divide"]["calls"], 1)
+        self.assertEqual(Profiler.records[Profiler.OUTSIDE]["rounding_events"], 1)
+
+    def test_json_export(self):
+        with Profiler.session():
+            Operations(3, -5).multiply_direct()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            Profiler.to_json(path)
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+        self.assertEqual(data["Operations.multiply_direct"]["calls"], 1)
+        self.assertEqual(set(Profiler.COUNTERS) | {"time_per_call"}, set(data["Operations.multiply_direct"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+import unittest
+from fractions import Fraction
+
+import numpy as np
+
+from binary_calculator.soft_float import SoftFloat
+
+
+def random_pairs(rng, uint_type, bits, count):
+    a = rng.integers(0, np.iinfo(uint_type).max, count, dtype=uint_type, endpoint=True)
+    b = rng.integers(0, np.iinfo(uint_type).max, count, dtype=uint_type, endpoint=True)
+    # Половина пар с близкими порядками, чтобы чаще встречалось сокращение
+    near = rng.integers(0, 1 << (bits - 6), count // 2, dtype=np.uint64)
+    b[:count // 2] = (a[:count // 2].astype(np.uint64) ^ near).astype(uint_type)
+    return a, b
+
+
+# Эталон для направленных округлений: результат numpy к ближайшему и его
+# соседи, выбранные по знаку точной ошибки
+def directed_result(nearest, exact, float_type, rounding):
+    if not np.isinf(nearest) and Fraction(float(nearest)) == exact:
+        return nearest
+    below = nearest if float(nearest) < exact else np.nextafter(nearest, float_type(-np.inf))
+    above = nearest if float(nearest) > exact else np.nextafter(nearest, float_type(np.inf))
+    if rounding == SoftFloat.ROUND_UP:
+        return above
+    if rounding == SoftFloat.ROUND_DOWN:
+        return below
+    return below if exact > 0 else above
+
+
+def directed_sum(a, b, float_type, rounding):
+    exact = Fraction(float(a)) + Fraction(float(b))
+    if exact == 0:
+        if float(a) == 0 and np.signbit(a) and np.signbit(b):
+            return float_type(-0.0)
+        return float_type(-0.0 if rounding == SoftFloat.ROUND_DOWN else 0.0)
+    with np.errstate(all="ignore"):
+        return directed_result(float_type(a + b), exact, float_type, rounding)
+
+
+def directed_product(a, b, float_type, rounding):
+    with np.errstate(all="ignore"):
+        return directed_result(float_type(a * b), Fraction(float(a)) * Fraction(float(b)), float_type, rounding)
+
+
+class TestSoftFloat(unittest.TestCase):
+    FORMATS = ((32, np.float32, np.uint32), (64, np.float64, np.uint64))
+
+    def assertSameWords(self, result, expected, float_type):
+        nan = np.isnan(expected.view(float_type))
+        np.testing.assert_array_equal(np.isnan(result.view(float_type)), nan)
+        np.testing.assert_array_equal(result[~nan], expected[~nan])
+
+    def test_nearest_even_matches_numpy(self):
+        rng = np.random.default_rng(8)
+        for bits, float_type, uint_type in self.FORMATS:
+            a, b = random_pairs(rng, uint_type, bits, 100_000)
+            soft_float = SoftFloat(bits)
+            with np.errstate(all="ignore"):
+                expected_sum = (a.view(float_type) + b.view(float_type)).view(uint_type)
+                expected_difference = (a.view(float_type) - b.view(float_type)).view(uint_type)
+            result, _ = soft_float.add(a, b)
+            self.assertEqual(result.dtype, uint_type)
+            self.assertSameWords(result, expected_sum, float_type)
+            result, _ = soft_float.sub(a, b)
+            self.assertSameWords(result, expected_difference, float_type)
+
+    def test_add_word_matches_vector_path(self):
+        rng = np.random.default_rng(10)
+        for bits, _, uint_type in self.FORMATS:
+            a, b = random_pairs(rng, uint_type, bits, 2000)
+            for rounding in SoftFloat.ROUNDING_MODES:
+                soft_float = SoftFloat(bits, rounding)
+                words, flags = soft_float.add(a, b)
+                scalar = [soft_float.add_word(x, y) for x, y in zip(a.tolist(), b.tolist())]
+                self.assertEqual(scalar, list(zip(words.tolist(), flags.tolist())), f"{bits} {rounding}")
+
+    def test_directed_rounding_matches_reference(self):
+        rng = np.random.default_rng(9)
+        for bits, float_type, uint_type in self.FORMATS:
+            a, b = random_pairs(rng, uint_type, bits, 4000)
+            finite = np.isfinite(a.view(float_type)) & np.isfinite(b.view(float_type))
+            a, b = a[finite], b[finite]
+            for rounding in SoftFloat.ROUNDING_MODES[1:]:
+                result, _ = SoftFloat(bits, rounding).add(a, b)
+                expected = np.array([directed_sum(x, y, float_type, rounding)
+                                     for x, y in zip(a.view(float_type), b.view(float_type))],
+                                    dtype=float_type).view(uint_type)
+                np.testing.assert_array_equal(result, expected, err_msg=f"{bits} {rounding}")
+
+    def test_mul_div_sqrt_match_numpy(self):
+        rng = np.random.default_rng(10)
+        for bits, float_type, uint_type in self.FORMATS:
+            a, b = random_pairs(rng, uint_type, bits, 5000)
+            soft_float = SoftFloat(bits)
+            x, y = a.view(float_type), b.view(float_type)
+            with np.errstate(all="ignore"):
+                expected = {"mul": x * y, "div": x / y, "sqrt": np.sqrt(x)}
+            self.assertSameWords(soft_float.mul(a, b)[0], expected["mul"].view(uint_type), float_type)
+            self.assertSameWords(soft_float.div(a, b)[0], expected["div"].view(uint_type), float_type)
+            self.assertSameWords(soft_float.sqrt(a)[0], expected["sqrt"].view(uint_type), float_type)
+
+    def test_directed_mul_matches_reference(self):
+        rng = np.random.default_rng(11)
+        values = rng.standard_normal((2, 2000)) * np.exp2(rng.integers(-90, 90, (2, 2000)))
+        values = np.float32(values)
+        a, b = values.view(np.uint32)
+        for rounding in SoftFloat.ROUNDING_MODES[1:]:
+            result, _ = SoftFloat(32, rounding).mul(a, b)
+            expected = np.array([directed_product(x, y, np.float32, rounding) for x, y in zip(*values)],
+                                dtype=np.float32).view(np.uint32)
+            np.testing.assert_array_equal(result, expected, err_msg=rounding)
+
+    def test_fma_single_rounding(self):
+        rng = np.random.default_rng(12)
+        values = rng.standard_normal((3, 3000)) * np.exp2(rng.integers(-40, 40, (3, 3000)))
+        values[2, :1500] = -values[0, :1500] * values[1, :1500]
+        values[:, :300] *= 2.0 ** -520
+        result, _ = SoftFloat(64).fma(*values.view(np.uint64))
+        expected = [float(Fraction(x) * Fraction(y) + Fraction(z)) for x, y, z in zip(*values.tolist())]
+        np.testing.assert_array_equal(result, np.float64(expected).view(np.uint64))
+        # (1 + 2^-12)^2 - 1 без промежуточного округления квадрата
+        word = np.float32(1 + 2.0 ** -12).view(np.uint32)
+        result, flags = SoftFloat(32).fma(word, word, np.float32(-1.0).view(np.uint32))
+        self.assertEqual(result.view(np.float32)[()], np.float32(2.0 ** -11 + 2.0 ** -24))
+        self.assertEqual(flags[()], 0)
+
+    def test_special_cases(self):
+        soft_float = SoftFloat(32)
+        one, zero, infinity = 0x3F800000, 0x00000000, 0x7F800000
+        result, flags = soft_float.div([one, zero, infinity], [zero, zero, infinity])
+        self.assertEqual(result.tolist(), [infinity, soft_float.default_nan, soft_float.default_nan])
+        self.assertEqual(flags.tolist(), [SoftFloat.FLAG_DIVIDE_BY_ZERO, SoftFloat.FLAG_INVALID,
+                                          SoftFloat.FLAG_INVALID])
+        result, flags = soft_float.sqrt([0xBF800000, 0x80000000, infinity])
+        self.assertEqual(result.tolist(), [soft_float.default_nan, 0x80000000, infinity])
+        self.assertEqual(flags.tolist(), [SoftFloat.FLAG_INVALID, 0, 0])
+        result, flags = soft_float.mul([infinity, 0x00800000], [zero, 0x3E800000])
+        self.assertEqual(result.tolist(), [soft_float.default_nan, 0x00200000])
+        self.assertEqual(flags.tolist(), [SoftFloat.FLAG_INVALID, 0])
+        result, flags = soft_float.mul(0x00000003, 0x3F000000)
+        self.assertEqual(result[()], 0x00000002)
+        self.assertEqual(flags[()], SoftFloat.FLAG_UNDERFLOW | SoftFloat.FLAG_INEXACT)
+        result, flags = soft_float.fma(infinity, one, 0xFF800000)
+        self.assertEqual((result[()], flags[()]), (soft_float.default_nan, SoftFloat.FLAG_INVALID))
+
+    def test_counters(self):
+        soft_float = SoftFloat(32)
+        soft_float.add([0x3F800000, 0x3F800000], [0x3F800000, 0x33800001])
+        soft_float.mul([0x3FC00000], [0x3FC00000])
+        self.assertEqual(soft_float.counters, {"operations": 3, "normalization_shifts": 2, "rounding_events": 1})
+        soft_float.reset_counters()
+        self.assertEqual(soft_float.counters["operations"], 0)
+
+    def test_flags(self):
+        soft_float = SoftFloat(32)
+        words = [0x3F800000, 0x7F7FFFFF, 0x00000001, 0x7F800000, 0x7F800001]
+        others = [0x33800001, 0x7F7FFFFF, 0x00000001, 0xFF800000, 0x3F800000]
+        result, flags = soft_float.add(words, others)
+        self.assertEqual(result[:3].tolist(), [0x3F800001, 0x7F800000, 0x00000002])
+        self.assertEqual(flags[0], SoftFloat.FLAG_INEXACT)
+        self.assertEqual(flags[1], SoftFloat.FLAG_OVERFLOW | SoftFloat.FLAG_INEXACT)
+        self.assertEqual(flags[2], 0)
+        self.assertEqual(result[3], soft_float.default_nan)
+        self.assertEqual(flags[3], SoftFloat.FLAG_INVALID)
+        self.assertEqual(result[4], 0x7FC00001)
+        self.assertEqual(flags[4], SoftFloat.FLAG_INVALID)
+
+    def test_overflow_by_rounding_mode(self):
+        largest = 0x7F7FFFFF
+        expected = {
+            SoftFloat.ROUND_NEAREST_EVEN: [0x7F800000, 0xFF800000],
+            SoftFloat.ROUND_TOWARD_ZERO: [0x7F7FFFFF, 0xFF7FFFFF],
+            SoftFloat.ROUND_UP: [0x7F800000, 0xFF7FFFFF],
+            SoftFloat.ROUND_DOWN: [0x7F7FFFFF, 0xFF800000],
+        }
+        for rounding, words in expected.items():
+            result, _ = SoftFloat(32, rounding).add([largest, largest | 0x80000000],
+                                                    [largest, largest | 0x80000000])
+            self.assertEqual(result.tolist(), words, rounding)
+
+    def test_signed_zero(self):
+        result, flags = SoftFloat(32).add([0x3F800000, 0x80000000], [0xBF800000, 0x80000000])
+        self.assertEqual(result.tolist(), [0x00000000, 0x80000000])
+        self.assertEqual(flags.tolist(), [0, 0])
+        result, _ = SoftFloat(32, SoftFloat.ROUND_DOWN).sub([0x3F800000], [0x3F800000])
+        self.assertEqual(result.tolist(), [0x80000000])
+
+    def test_scalar_broadcast(self):
+        result, _ = SoftFloat(64).add(np.float64([1.0, 2.0]).view(np.uint64), 0x3FF0000000000000)
+        self.assertEqual(result.view(np.float64).tolist(), [2.0, 3.0])
+
+    def test_mixed_sign_word_list(self):
+        # Слова отрицательных binary64 больше 2^63: список не должен стать float64
+        words = np.float64([-0.1, 0.1, -3.0]).view(np.uint64).tolist()
+        soft_float = SoftFloat(64)
+        result, _ = soft_float.add(words, [0, 0, 0])
+        self.assertEqual(result.tolist(), words)
+        result, _ = soft_float.mul(words, [0x3FF0000000000000] * 3)
+        self.assertEqual(result.tolist(), words)
+        result, _ = soft_float.sub(words, [0, 0, 0])
+        self.assertEqual(result.tolist(), words)
+
+    def test_unknown_rounding(self):
+        with self.assertRaises(ValueError):
+            SoftFloat(32, "nearest_away")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
+import math
 import unittest
 
+import numpy as np
+
 from standart_ieee754 import StandartIEEE754
 
 
@@ -29,13 +32,45 @@ class TestStandartIEEE754(unittest.TestCase):
         result_float = self.calc3.ieee754_to_float(result_ieee)
         self.assertAlmostEqual(result_float, 10.25 + 20.5)
 
+    def test_ieee754_addition_rounding(self):
+        # 1 + 2^-24 лежит ровно посередине: к чётному остаётся 1.0
+        calc = StandartIEEE754(1.0, 2.0 ** -24)
+        self.assertEqual(calc.ieee754_addition(), '00111111100000000000000000000000')
+        self.assertEqual(calc.ieee754_addition('up'), '00111111100000000000000000000001')
+        self.assertEqual(StandartIEEE754(0.1, 0.2).ieee754_addition(),
+                         self.calc1.float_to_ieee754(float(np.float32(0.1) + np.float32(0.2))))
+
+    def test_ieee754_addition_special(self):
+        self.assertEqual(StandartIEEE754(2.5, -2.5).ieee754_addition(), '0' * 32)
+        self.assertEqual(StandartIEEE754(3e38, 3e38).ieee754_addition(), '01111111100000000000000000000000')
+        self.assertEqual(StandartIEEE754(1e-45, 1e-45).ieee754_addition(), '0' * 30 + '10')
+        self.assertTrue(math.isnan(self.calc1.ieee754_to_float(
+            StandartIEEE754(float('inf'), float('-inf')).ieee754_addition())))
+
+    def test_ieee754_other_operations(self):
+        calc = StandartIEEE754(1.5, -0.1)
+        self.assertEqual(calc.ieee754_multiplication(), calc.float_to_ieee754(float(np.float32(1.5) * np.float32(-0.1))))
+        self.assertEqual(calc.ieee754_division(), calc.float_to_ieee754(float(np.float32(1.5) / np.float32(-0.1))))
+        self.assertEqual(calc.ieee754_sqrt(), calc.float_to_ieee754(float(np.sqrt(np.float32(1.5)))))
+        self.assertEqual(StandartIEEE754(3.0, 4.0).ieee754_fma(5.0), calc.float_to_ieee754(17.0))
+        self.assertEqual(StandartIEEE754(1.0, 3.0).ieee754_division('toward_zero'), '00111110101010101010101010101010')
+        self.assertEqual(StandartIEEE754(1.0, 3.0).ieee754_division('up'), '00111110101010101010101010101011')
+
+    def test_ieee754_addition_many(self):
+        a = StandartIEEE754.float_to_ieee754_many([1.5, -4.0, 1e-40])
+        b = StandartIEEE754.float_to_ieee754_many([2.25, 1.0, 1e-40])
+        words, flags = StandartIEEE754.ieee754_addition_many(a, b)
+        self.assertEqual(StandartIEEE754.ieee754_to_float_many(words).tolist(),
+                         (np.float32([1.5, -4.0, 1e-40]) + np.float32([2.25, 1.0, 1e-40])).tolist())
+        self.assertEqual(flags.tolist(), [0, 0, 0])
+
     def test_sum_of_binary_ieee754(self):
         result_ieee = self.calc1.sum_of_binary_ieee754()
         result_float = self.calc1.ieee754_to_float(result_ieee)
         self.assertAlmostEqual(result_float, 5.5 + (-2.75))
 
     def test_invalid_input_float_to_ieee754(self):
-        with self.assertRaises(TypeError):
+        with self.assertRaises(ValueError):
             self.calc1.float_to_ieee754("string")
 
     def test_invalid_input_ieee754_to_float(self):
@@ -43,17 +78,47 @@ class TestStandartIEEE754(unittest.TestCase):
             self.calc1.ieee754_to_float("invalid_binary_string")
 
     def test_invalid_input_ieee754_addition(self):
-        with self.assertRaises(TypeError):
+        with self.assertRaises(ValueError):
             StandartIEEE754("invalid", 2.5).ieee754_addition()
 
     def test_subnormal_case(self):
-        self.assertEqual(self.calc1.float_to_ieee754(1e-40), '00000000000000000000000000000000')
+        self.assertEqual(self.calc1.float_to_ieee754(1e-40), '00000000000000010001011011000010')
         self.assertAlmostEqual(self.calc1.ieee754_to_float('00000000000000000000000000000001'), 1.4e-45)
+        self.assertEqual(self.calc1.ieee754_to_float('00000000000000000000000000000001'), 2.0 ** -149)
+
+    def test_special_values(self):
+        self.assertEqual(self.calc1.float_to_ieee754(float('inf')), '01111111100000000000000000000000')
+        self.assertEqual(self.calc1.float_to_ieee754(-1e39), '11111111100000000000000000000000')
+        self.assertEqual(self.calc1.float_to_ieee754(-0.0), '1' + '0' * 31)
+        self.assertTrue(math.isnan(self.calc1.ieee754_to_float('01111111110000000000000000000000')))
+
+    def test_rounding_to_nearest(self):
+        self.assertEqual(self.calc1.float_to_ieee754(0.1), '00111101110011001100110011001101')
+
+    def test_many(self):
+        values = np.array([1.0, -2.5, 1e-40, np.inf])
+        words = StandartIEEE754.float_to_ieee754_many(values)
+        self.assertEqual(words.dtype, np.uint32)
+        self.assertEqual(words.tolist(), [0x3F800000, 0xC0200000, 0x000116C2, 0x7F800000])
+        self.assertEqual(StandartIEEE754.ieee754_to_float_many(words).tolist(),
+                         np.float32(values).tolist())
 
     def test_zero_case(self):
         self.assertEqual(self.calc1.float_to_ieee754(0.0), '0' * 32)
         self.assertAlmostEqual(self.calc1.ieee754_to_float('00000000000000000000000000000000'), 0.0)
 
+    def test_decimal_strings(self):
+        calc = StandartIEEE754("16777217", "1")
+        self.assertEqual(calc.float_to_ieee754("16777217"), "01001011100000000000000000000000")
+        self.assertEqual(calc.ieee754_to_decimal(calc.ieee754_addition()), "16777216.0")
+        self.assertEqual(StandartIEEE754("0.1", "0.2").ieee754_to_decimal(
+            StandartIEEE754("0.1", "0.2").ieee754_addition()), "0.3")
+        self.assertEqual(calc.ieee754_to_decimal(calc.float_to_vector("0.1")), "0.1")
+        words = StandartIEEE754.decimal_to_ieee754_many(["1", "-2.5", "1e39"])
+        self.assertEqual(words.tolist(), [0x3F800000, 0xC0200000, 0x7F800000])
+        self.assertEqual(StandartIEEE754.ieee754_to_decimal_many(words), ["1.0", "-2.5", "inf"])
+
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
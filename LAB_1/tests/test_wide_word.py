@@ -0,0 +1,38 @@
+import unittest
+
+from binary_calculator.wide_word import WideWord
+
+
+class TestWideWord(unittest.TestCase):
+
+    def test_views(self):
+        word = WideWord(-5, 8)
+        self.assertEqual(word.direct, "10000101")
+        self.assertEqual(word.reverse, "11111010")
+        self.assertEqual(word.additional, "11111011")
+        self.assertEqual(str(word), "11111011")
+
+    def test_selected_code(self):
+        word = WideWord(-6, 8, code="direct")
+        self.assertEqual(str(word), "10000110")
+        self.assertEqual(word[0], "1")
+        self.assertEqual(len(word), 8)
+
+    def test_negative_zero(self):
+        word = WideWord(0, 8, code="direct", negative=True)
+        self.assertEqual(str(word), "10000000")
+        self.assertEqual(word.additional, "00000000")
+
+    def test_views_are_lazy(self):
+        word = WideWord(1, 4096)
+        self.assertEqual(word._views, {})
+        self.assertEqual(word.additional, "0" * 4095 + "1")
+        self.assertEqual(list(word._views), ["additional"])
+
+    def test_invalid_code(self):
+        with self.assertRaises(ValueError):
+            WideWord(1, 8, code="unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
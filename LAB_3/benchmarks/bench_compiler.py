@@ -0,0 +1,65 @@
+# Построчное вычисление таблицы истинности: интерпретатор ОПЗ
+# (LogicEvaluator на каждое подвыражение) против функции ExpressionCompiler,
+# плюс стоимость первой компиляции и повторного обращения к кэшу.
+# Запуск из каталога LAB_3: python -m benchmarks.bench_compiler
+import itertools
+import time
+
+from logical_processing.expression_compiler import ExpressionCompiler
+from logical_processing.logic_evaluator import LogicEvaluator
+from logical_processing.table import TruthTableWithSubexpressions
+
+EXPRESSIONS = [
+    "a & b | c",
+    "(a -> b) & (c ~ !d) | e",
+    "!(a & b) -> (c | (d ~ e)) & !(a | !c) ~ (b -> !e)",
+]
+REPEAT = 200
+
+
+def rows(variables):
+    return [dict(zip(variables, values)) for values in itertools.product([False, True], repeat=len(variables))]
+
+
+def interpret(table, values):
+    results = [LogicEvaluator(rpn).evaluate(values) for rpn in table.subexpression_rpns]
+    return results, LogicEvaluator(table.tree.rpn()).evaluate(values)
+
+
+def per_row(function, table, values_list):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for values in values_list:
+            function(table, values)
+    return (time.perf_counter() - start) / (REPEAT * len(values_list))
+
+
+def main():
+    header = (f"{'выражение':>52} | {'интерпретатор, мкс':>18} | {'компилятор, мкс':>15} | "
+              f"{'ускорение':>9} | {'компиляция, мкс':>15} | {'кэш, мкс':>8}")
+    print(header)
+    print("-" * len(header))
+    for expression in EXPRESSIONS:
+        table = TruthTableWithSubexpressions(expression)
+        table.extract_subexpressions()
+        table.subexpression_rpns = [node.rpn() for node in table.subexpressions]
+        values_list = rows(table.variables)
+
+        start = time.perf_counter()
+        ExpressionCompiler.compile_rpn(table.tree.rpn())
+        compile_time = time.perf_counter() - start
+        ExpressionCompiler.compile(expression)
+        start = time.perf_counter()
+        ExpressionCompiler.compile(expression)
+        cached_time = time.perf_counter() - start
+
+        for values in values_list:
+            assert interpret(table, values) == table.evaluate_subexpressions(values)
+        interpreted = per_row(interpret, table, values_list)
+        compiled = per_row(TruthTableWithSubexpressions.evaluate_subexpressions, table, values_list)
+        print(f"{expression:>52} | {interpreted * 1e6:>18.2f} | {compiled * 1e6:>15.2f} | "
+              f"{interpreted / compiled:>9.1f} | {compile_time * 1e6:>15.1f} | {cached_time * 1e6:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# Граф подвыражений с общими узлами против копий списков ОПЗ (прежний
+# extract_subexpressions: подвыражение = operand1 + operand2 + [token]).
+# repeated - выражение повторяет себя дважды на каждом уровне,
+# chain - глубокая вложенность без повторов. Для каждого - число
+# подвыражений в дереве и в графе, лексем в копиях, время разбора со
+# сбором подвыражений и его пик памяти, время построения таблицы.
+# Запуск из каталога LAB_3: python -m benchmarks.bench_dag
+import time
+import tracemalloc
+
+from logical_processing.expression_parser import ExpressionParser
+from logical_processing.table import TruthTableWithSubexpressions
+
+VARIABLES = ["a", "b", "c", "d", "e"]
+REPEATED_LEVELS = [4, 8, 12]
+CHAIN_DEPTHS = [50, 100, 200]
+
+
+def repeated(levels):
+    expression = "a"
+    for level in range(levels):
+        variable = VARIABLES[level % len(VARIABLES)]
+        expression = f"({expression} & {variable}) | (!{expression} ~ {variable})"
+    return expression
+
+
+def chain(depth):
+    operators = ["&", "|", "->", "~"]
+    expression = VARIABLES[depth % len(VARIABLES)]
+    for level in range(depth):
+        expression = f"({VARIABLES[level % len(VARIABLES)]} {operators[level % 4]} {expression})"
+    return expression
+
+
+def copied_lists(expression):
+    stack, subexpressions = [], []
+    for token in ExpressionParser(expression).parse().rpn():
+        if token == '!':
+            subexpression = stack.pop() + [token]
+        elif token in ('&', '|', '->', '~'):
+            operand2, operand1 = stack.pop(), stack.pop()
+            subexpression = operand1 + operand2 + [token]
+        else:
+            stack.append([token])
+            continue
+        stack.append(subexpression)
+        subexpressions.append(subexpression)
+    return subexpressions
+
+
+def dag_nodes(expression):
+    return [node for node in ExpressionParser(expression).parse().postorder() if not node.is_variable()]
+
+
+# Время - без трассировки памяти, пик памяти - отдельным запуском
+def measured(function, expression):
+    start = time.perf_counter()
+    result = function(expression)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function(expression)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    header = (f"{'выражение':>12} | {'символов':>8} | {'дерево':>7} | {'граф':>5} | {'лексем в копиях':>15} | "
+              f"{'копии, мс / КБ':>15} | {'граф, мс / КБ':>14} | {'таблица, мс':>11}")
+    print(header)
+    print("-" * len(header))
+    workloads = ([(f"repeated {levels}", repeated(levels)) for levels in REPEATED_LEVELS]
+                 + [(f"chain {depth}", chain(depth)) for depth in CHAIN_DEPTHS])
+    for name, expression in workloads:
+        lists, lists_time, lists_peak = measured(copied_lists, expression)
+        nodes, dag_time, dag_peak = measured(dag_nodes, expression)
+        start = time.perf_counter()
+        TruthTableWithSubexpressions(expression).generate_table()
+        table_time = time.perf_counter() - start
+        print(f"{name:>12} | {len(expression):>8} | {len(lists):>7} | {len(nodes):>5} | "
+              f"{sum(map(len, lists)):>15} | {lists_time * 1e3:>6.1f} / {lists_peak / 1024:>6.0f} | "
+              f"{dag_time * 1e3:>5.1f} / {dag_peak / 1024:>6.0f} | {table_time * 1e3:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+# Построение таблицы истинности: построчный способ (rows) против столбцов-
+# целых (bits, BitSlicedTable), затем рост стоимости таблицы до 24 переменных.
+# Запуск из каталога LAB_3: python -m benchmarks.bench_truth_table
+import time
+
+from logical_processing.table import TruthTableWithSubexpressions
+
+EXPRESSIONS = [
+    "a & b | c",
+    "(a -> b) & (c ~ !d) | e",
+    "!(a & b) -> (c | (d ~ e)) & !(a | !c) ~ (b -> !e)",
+]
+REPEAT = 200
+SCALING = [8, 12, 16, 20, 24]
+
+
+# (x1 & x2 | !x3) -> (x4 ~ x5 & x6) ... - операторы по кругу
+def scaling_expression(count):
+    operators = ["&", "|", "->", "~"]
+    expression = "x1"
+    for index in range(2, count + 1):
+        negation = "!" if index % 3 == 0 else ""
+        expression = f"({expression} {operators[index % 4]} {negation}x{index})"
+    return expression
+
+
+def timed(function, repeat=REPEAT):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    header = (f"{'выражение':>52} | {'rows, мкс':>9} | {'bits, мкс':>9} | "
+              f"{'bits + обход, мкс':>17} | {'индексная форма':>15}")
+    print(header)
+    print("-" * len(header))
+    for expression in EXPRESSIONS:
+        rows = timed(lambda: TruthTableWithSubexpressions(expression, "rows").generate_table())
+        bits = timed(lambda: TruthTableWithSubexpressions(expression).generate_table())
+        walked = timed(lambda: list(TruthTableWithSubexpressions(expression).generate_table()))
+        index_form = (timed(lambda: TruthTableWithSubexpressions(expression, "rows").to_index_form())
+                      / timed(lambda: TruthTableWithSubexpressions(expression).to_index_form()))
+        print(f"{expression:>52} | {rows * 1e6:>9.1f} | {bits * 1e6:>9.1f} | "
+              f"{walked * 1e6:>17.1f} | {index_form:>14.1f}x")
+
+    # Полная таблица для выражений над x1..xn: столбцы переменных,
+    # столбцы всех подвыражений и индексная форма
+    print()
+    header = f"{'переменных':>10} | {'строк':>10} | {'таблица, мс':>11} | {'индексная форма, мс':>19}"
+    print(header)
+    print("-" * len(header))
+    for count in SCALING:
+        expression = scaling_expression(count)
+        table = timed(lambda: TruthTableWithSubexpressions(expression).generate_table(), 1)
+        index_form = timed(lambda: TruthTableWithSubexpressions(expression).to_index_form(), 1)
+        print(f"{count:>10} | {1 << count:>10} | {table * 1e3:>11.1f} | {index_form * 1e3:>19.1f}")
+
+if __name__ == '__main__':
+    main()
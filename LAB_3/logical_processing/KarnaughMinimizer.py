@@ -5,7 +5,7 @@ from logical_processing.table import TruthTableWithSubexpressions
 class KarnaughMinimizer:
     def __init__(self, expression):
         self.expression = expression
-        self.variables = sorted(ExpressionValidator.VARIABLES & set(expression))
+        self.variables = ExpressionValidator.variables(expression)
         self.truth_table_generator = TruthTableWithSubexpressions(expression)
         self.truth_table = []
 
@@ -0,0 +1,61 @@
+from logical_processing.expression_compiler import ExpressionCompiler
+
+
+class BitSlicedTable:
+    # Таблица истинности в виде столбцов: каждый столбец - одно целое
+    # Python, бит i которого - значение в строке i. Строки идут в порядке
+    # itertools.product([False, True], ...): первая переменная - старший
+    # разряд номера строки. Все 2^n строк считаются одним проходом
+    # побитовых операций, а строки-кортежи собираются только при чтении.
+    # tree - граф выражения из ExpressionParser.
+    def __init__(self, tree, variables):
+        self.variables = list(variables)
+        self.rows = 1 << len(self.variables)
+        self.mask = (1 << self.rows) - 1
+        self.columns = {variable: self.variable_column(index, len(self.variables))
+                        for index, variable in enumerate(self.variables)}
+        evaluate = ExpressionCompiler.compile_tree(tree, "bits")
+        self.subexpression_columns, self.result = evaluate(self.columns, self.mask)
+
+    # Столбец переменной с номером index из count: блоки по 2^(count-1-index)
+    # нулей и единиц. Период из 2 * block разрядов удваивается сдвигом,
+    # пока не займёт все 2^count строк.
+    @staticmethod
+    def variable_column(index, count):
+        block = 1 << (count - 1 - index)
+        column = ((1 << block) - 1) << block
+        width = 2 * block
+        while width < 1 << count:
+            column |= column << width
+            width *= 2
+        return column
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.rows))]
+        if index < 0:
+            index += self.rows
+        if not 0 <= index < self.rows:
+            raise IndexError("Номер строки вне таблицы")
+        variable_values = {variable: bool((column >> index) & 1) for variable, column in self.columns.items()}
+        subformula_results = [bool((column >> index) & 1) for column in self.subexpression_columns]
+        return variable_values, subformula_results, bool((self.result >> index) & 1)
+
+    def __iter__(self):
+        for index in range(self.rows):
+            yield self[index]
+
+    def __eq__(self, other):
+        if isinstance(other, BitSlicedTable):
+            return (self.variables, self.subexpression_columns, self.result) == \
+                   (other.variables, other.subexpression_columns, other.result)
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    # Столбец результата строкой из 0 и 1 в порядке строк таблицы
+    def binary(self):
+        return format(self.result, f"0{self.rows}b")[::-1]
@@ -0,0 +1,117 @@
+import functools
+
+from logical_processing.expression_parser import ExpressionParser
+from logical_processing.expression_validator import ExpressionValidator
+
+
+class ExpressionCompiler:
+    MODES = ("rows", "bits")
+    CACHE_SIZE = 256
+
+    # Шаблоны операций над значениями строки таблицы (bool)
+    TEMPLATES = {
+        '!': "not {0}",
+        '&': "{0} and {1}",
+        '|': "{0} or {1}",
+        '->': "not {0} or {1}",
+        '~': "{0} == {1}",
+    }
+
+    # Шаблоны над столбцами: бит i целого - значение в строке i таблицы,
+    # mask - единицы во всех строках (нужна для отрицаний)
+    BIT_TEMPLATES = {
+        '!': "{0} ^ mask",
+        '&': "{0} & {1}",
+        '|': "{0} | {1}",
+        '->': "({0} ^ mask) | {1}",
+        '~': "{0} ^ {1} ^ mask",
+    }
+
+    # Выражение разбирается в граф (ExpressionParser) и компилируется в
+    # функцию evaluate(values) -> (значения подвыражений, итог).
+    # Подвыражения - различные узлы графа в порядке Node.postorder, как в
+    # TruthTableWithSubexpressions. В режиме bits функция
+    # evaluate(values, mask) получает и возвращает столбцы целиком.
+    # Результат кэшируется по строке выражения и режиму; уже разобранный
+    # граф компилирует compile_tree.
+    @staticmethod
+    def compile(expression, mode="rows"):
+        return ExpressionCompiler._compile_text(expression, mode)
+
+    # Кэш по исходной строке, за ним - по строке из лексем, чтобы записи
+    # с разными пробелами делили одну функцию
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
+    def _compile_text(expression, mode):
+        return ExpressionCompiler._compile(" ".join(ExpressionValidator.tokenize(expression)), mode)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
+    def _compile(expression, mode):
+        return ExpressionCompiler.compile_tree(ExpressionParser(expression).parse(), mode)
+
+    # Каждый различный узел графа - одно присваивание: переменная читается
+    # из словаря один раз, общее подвыражение считается один раз
+    @staticmethod
+    def compile_tree(tree, mode="rows"):
+        templates, lines = ExpressionCompiler._header(mode)
+        names = {}
+        results = []
+        variables = 0
+        for node in tree.postorder():
+            if node.is_variable():
+                names[node] = f"v{variables}"
+                variables += 1
+                lines.append(f"    {names[node]} = values[{node.name!r}]")
+            else:
+                names[node] = f"s{len(results)}"
+                operands = (names[operand] for operand in node.operands)
+                lines.append(f"    {names[node]} = {templates[node.operator].format(*operands)}")
+                results.append(names[node])
+        lines.append(f"    return [{', '.join(results)}], {names[tree]}")
+        return ExpressionCompiler._function(lines)
+
+    # ОПЗ без разбора: каждый оператор становится присваиванием s<i> = ...,
+    # стек интерпретатора заменяется именами локальных переменных
+    @staticmethod
+    def compile_rpn(rpn, mode="rows"):
+        templates, lines = ExpressionCompiler._header(mode)
+        loaded = {}
+        stack = []
+        results = []
+        for token in rpn:
+            if token in templates:
+                arity = 1 if token == '!' else 2
+                operands = stack[-arity:]
+                del stack[-arity:]
+                name = f"s{len(results)}"
+                lines.append(f"    {name} = {templates[token].format(*operands)}")
+                stack.append(name)
+                results.append(name)
+            elif ExpressionValidator.is_variable(token):
+                if token not in loaded:
+                    loaded[token] = f"v{len(loaded)}"
+                    lines.append(f"    {loaded[token]} = values[{token!r}]")
+                stack.append(loaded[token])
+            else:
+                raise ValueError(f"Неизвестная лексема: {token}")
+        if len(stack) != 1:
+            raise ValueError("Некорректное выражение")
+        lines.append(f"    return [{', '.join(results)}], {stack[0]}")
+        return ExpressionCompiler._function(lines)
+
+    @staticmethod
+    def _header(mode):
+        if mode not in ExpressionCompiler.MODES:
+            raise ValueError(f"Неизвестный режим компиляции: {mode}")
+        if mode == "bits":
+            return ExpressionCompiler.BIT_TEMPLATES, ["def evaluate(values, mask):"]
+        return ExpressionCompiler.TEMPLATES, ["def evaluate(values):"]
+
+    @staticmethod
+    def _function(lines):
+        namespace = {}
+        exec("\n".join(lines), namespace)
+        evaluate = namespace["evaluate"]
+        evaluate.source = "\n".join(lines)
+        return evaluate
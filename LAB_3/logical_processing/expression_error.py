@@ -0,0 +1,5 @@
+# Ошибка разбора выражения: position - номер символа в исходной строке
+class ExpressionError(ValueError):
+    def __init__(self, message, position):
+        super().__init__(message)
+        self.position = position
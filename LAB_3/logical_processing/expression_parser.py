@@ -0,0 +1,174 @@
+import re
+
+from logical_processing.expression_error import ExpressionError
+
+
+class Node:
+    __slots__ = ("operator", "operands", "name")
+
+    # Узел графа выражения: переменная (name) или оператор над operands.
+    # Узлы создаёт ExpressionParser, одинаковые подвыражения - один узел,
+    # поэтому сравнение узлов - сравнение по идентичности.
+    def __init__(self, operator=None, operands=(), name=None):
+        self.operator = operator
+        self.operands = operands
+        self.name = name
+
+    def is_variable(self):
+        return self.name is not None
+
+    # Различные узлы графа, каждый после своих операндов (корень последний);
+    # обход без рекурсии, чтобы глубина вложенности не упиралась в предел
+    # стека Python
+    def postorder(self):
+        result = []
+        seen = set()
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                result.append(node)
+                continue
+            if node in seen:
+                continue
+            seen.add(node)
+            if node.is_variable():
+                result.append(node)
+                continue
+            stack.append((node, True))
+            for operand in reversed(node.operands):
+                stack.append((operand, False))
+        return result
+
+    # ОПЗ раскрывает граф обратно в дерево: общие подвыражения повторяются
+    def rpn(self):
+        output = []
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node.is_variable():
+                output.append(node.name)
+            elif expanded:
+                output.append(node.operator)
+            else:
+                stack.append((node, True))
+                for operand in reversed(node.operands):
+                    stack.append((operand, False))
+        return output
+
+    # Строки всех узлов графа в форме TruthTableWithSubexpressions: !x и
+    # (x op y). Строка каждого узла собирается один раз из строк операндов.
+    def to_strings(self):
+        strings = {}
+        for node in self.postorder():
+            if node.is_variable():
+                strings[node] = node.name
+            elif node.operator == '!':
+                strings[node] = f"!{strings[node.operands[0]]}"
+            else:
+                operand1, operand2 = (strings[operand] for operand in node.operands)
+                strings[node] = f"({operand1} {node.operator} {operand2})"
+        return strings
+
+    def to_string(self):
+        return self.to_strings()[self]
+
+
+class ExpressionParser:
+    OPERATORS = {'!': 3, '&': 2, '|': 2, '->': 1, '~': 1}
+    BINARY = ('&', '|', '->', '~')
+    # Имя переменной: буква или _, затем буквы, цифры и _ (a, x17, clk_en)
+    TOKEN = re.compile(r"\s*(?:([A-Za-z_][A-Za-z0-9_]*)|(->|[!&|~()]))")
+
+    # Разбор методом Пратта за один проход по лексемам: приоритеты из
+    # OPERATORS, бинарные операторы левоассоциативны, как в RPNConverter.
+    # Результат - граф: узлы хранятся в таблице nodes по (оператор,
+    # операнды, имя), повторное подвыражение берёт готовый узел.
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = ExpressionParser.tokenize(expression)
+        self.index = 0
+        self.nodes = {}
+
+    # Разбиение выражения на имена переменных, операторы и скобки вместе
+    # с позициями лексем в строке
+    @staticmethod
+    def tokenize(expression):
+        tokens = []
+        position = 0
+        end = len(expression.rstrip())
+        while position < end:
+            match = ExpressionParser.TOKEN.match(expression, position)
+            if match is None:
+                position += len(expression[position:]) - len(expression[position:].lstrip())
+                if expression[position] == '-':
+                    raise ExpressionError("Некорректный оператор: -", position)
+                raise ExpressionError(f"Недопустимый символ: {expression[position]}", position)
+            group = 1 if match.group(1) else 2
+            tokens.append((match.group(group), match.start(group)))
+            position = match.end()
+        return tokens
+
+    @staticmethod
+    def is_variable(token):
+        return token not in ExpressionParser.OPERATORS and token not in ('(', ')')
+
+    def parse(self):
+        if not self.tokens:
+            raise ExpressionError("Выражение не может быть пустым", 0)
+        try:
+            tree = self._expression(0)
+        except RecursionError:
+            raise ExpressionError("Слишком глубокая вложенность выражения", 0) from None
+        if self.index < len(self.tokens):
+            self._unexpected()
+        return tree
+
+    def _expression(self, power):
+        left = self._operand()
+        while self.index < len(self.tokens):
+            token = self.tokens[self.index][0]
+            if token not in ExpressionParser.BINARY or ExpressionParser.OPERATORS[token] <= power:
+                break
+            self.index += 1
+            left = self._node(token, (left, self._expression(ExpressionParser.OPERATORS[token])))
+        return left
+
+    def _operand(self):
+        if self.index == len(self.tokens):
+            raise ExpressionError("Ожидался операнд", len(self.expression.rstrip()))
+        token, position = self.tokens[self.index]
+        self.index += 1
+        if token == '!':
+            return self._node('!', (self._expression(ExpressionParser.OPERATORS['!']),))
+        if token == '(':
+            inner = self._expression(0)
+            if self.index == len(self.tokens):
+                raise ExpressionError("Несбалансированные скобки", position)
+            if self.tokens[self.index][0] != ')':
+                self._unexpected()
+            self.index += 1
+            return inner
+        if ExpressionParser.is_variable(token):
+            return self._node(name=token)
+        previous = self.tokens[self.index - 2][0] if self.index > 1 else None
+        if token in ExpressionParser.BINARY and previous in ExpressionParser.OPERATORS:
+            raise ExpressionError("Два оператора подряд недопустимы", position)
+        raise ExpressionError("Ожидался операнд", position)
+
+    def _node(self, operator=None, operands=(), name=None):
+        key = (operator, operands, name)
+        node = self.nodes.get(key)
+        if node is None:
+            node = Node(operator, operands, name)
+            self.nodes[key] = node
+        return node
+
+    # Лексема после законченного операнда, которая не является оператором
+    def _unexpected(self):
+        token, position = self.tokens[self.index]
+        if token == ')':
+            raise ExpressionError("Несбалансированные скобки", position)
+        if ExpressionParser.is_variable(token):
+            raise ExpressionError("Между переменными должен быть оператор", position)
+        raise ExpressionError(f"Ожидался оператор перед {token}", position)
@@ -1,39 +1,33 @@
+import re
+
+from logical_processing.expression_parser import ExpressionParser
+
+
 class ExpressionValidator:
-    OPERATORS = {'!': 3, '&': 2, '|': 2, '->': 1, '~': 1}
-    VARIABLES = {'a', 'b', 'c', 'd', 'e'}
+    OPERATORS = ExpressionParser.OPERATORS
+
+    # Разбор на лексемы выполняет ExpressionParser; здесь - только имена
+    # переменных, операторы и скобки без позиций
+    @staticmethod
+    def tokenize(expression):
+        return [token for token, _ in ExpressionParser.tokenize(expression)]
+
+    @staticmethod
+    def is_variable(token):
+        return ExpressionParser.is_variable(token)
+
+    # Порядок переменных с учётом чисел в именах: x2 раньше x10
+    @staticmethod
+    def natural_key(name):
+        return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
+    @staticmethod
+    def variables(expression):
+        names = {token for token in ExpressionValidator.tokenize(expression) if ExpressionValidator.is_variable(token)}
+        return sorted(names, key=ExpressionValidator.natural_key)
 
+    # Проверка - полный разбор выражения (см. ExpressionParser); ошибки
+    # (ExpressionError) несут позицию в строке
     @staticmethod
     def validate(expression):
-        expression = expression.replace(" ", "")
-        if not expression:
-            raise ValueError("Выражение не может быть пустым")
-        stack = []
-        last = ''
-        valid_chars = ExpressionValidator.VARIABLES | {'(', ')', '!'}
-        i = 0
-        while i < len(expression):
-            char = expression[i]
-            if char in valid_chars:
-                if char in ExpressionValidator.VARIABLES and last in ExpressionValidator.VARIABLES:
-                    raise ValueError("Между переменными должен быть оператор")
-            elif char in {'&', '|', '~'}:
-                if last in ExpressionValidator.OPERATORS:
-                    raise ValueError("Два оператора подряд недопустимы")
-            elif char == '-':
-                if i + 1 < len(expression) and expression[i + 1] == '>':
-                    char = '->'
-                    i += 1
-                else:
-                    raise ValueError("Некорректный оператор: -")
-            elif char not in ExpressionValidator.OPERATORS:
-                raise ValueError(f"Недопустимый символ: {char}")
-            if char == '(':
-                stack.append(char)
-            elif char == ')':
-                if not stack:
-                    raise ValueError("Несбалансированные скобки")
-                stack.pop()
-            last = char
-            i += 1
-        if stack:
-            raise ValueError("Несбалансированные скобки")
\ No newline at end of file
+        ExpressionParser(expression).parse()
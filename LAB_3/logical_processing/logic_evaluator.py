@@ -7,9 +7,7 @@ class LogicEvaluator:
     def evaluate(self, values):
         stack = []
         for token in self.rpn:
-            if token in ExpressionValidator.VARIABLES:
-                stack.append(values[token])
-            elif token == '!':
+            if token == '!':
                 stack.append(not stack.pop())
             elif token == '&':
                 b, a = stack.pop(), stack.pop()
@@ -24,4 +22,6 @@ class LogicEvaluator:
             elif token == '~':
                 b, a = stack.pop(), stack.pop()
                 stack.append(True if a == b else False)
+            elif ExpressionValidator.is_variable(token):
+                stack.append(values[token])
         return stack[0]
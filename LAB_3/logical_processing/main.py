@@ -49,11 +49,11 @@ def main():
         print("\n============================================ МЕТОД 2 ============================================")
         min_d2 = Minimizing.minimize_sdnf_second(result_d, variables)
         print("\n====================== ТАБЛИЦА ======================")
-        Minimizing.build_sdnf_table(result_d, min_d2)
+        Minimizing.build_sdnf_table(result_d, min_d2, variables)
 
         min_k2 = Minimizing.minimize_sknf_second(result_k, variables)
         print("\n====================== ТАБЛИЦА ======================")
-        Minimizing.build_sknf_table(result_k, min_k2)
+        Minimizing.build_sknf_table(result_k, min_k2, variables)
 
 
 
@@ -2,10 +2,20 @@ import itertools
 import re
 
 class Minimizing:
+    LITERAL = re.compile(r"(!?)([A-Za-z_][A-Za-z0-9_]*)")
+
+    # Имена переменных по номеру разряда терма; без списка - a, b, c, ...
+    @staticmethod
+    def _variable_names(variables, count):
+        if variables is None:
+            return [chr(97 + idx) for idx in range(count)]
+        return variables
+
+    def build_sdnf_table(expression_d, min_d, variables=None):
+        names = Minimizing._variable_names(variables, len(expression_d[0]) if expression_d else 0)
 
-    def build_sdnf_table(expression_d, min_d):
         def term_to_str(term):
-            return [f"!{chr(97 + idx)}" if var == 0 else f"{chr(97 + idx)}" for idx, var in enumerate(term) if
+            return [f"!{names[idx]}" if var == 0 else f"{names[idx]}" for idx, var in enumerate(term) if
                     var != "X"]
         header_terms = [" & ".join(term_to_str(term)) for term in expression_d]
 
@@ -81,11 +91,14 @@ class Minimizing:
 
     @staticmethod
     def _evaluate_expression_d(expression, values):
-        for var, val in values.items():
-            expression = expression.replace(var, str(val))
-            expression = expression.replace(f"!{var}", str(int(not val)))
+        return eval(Minimizing._substitute(expression, values))
 
-        return eval(expression)
+    # Литералы заменяются значениями целиком, поэтому x1 не задевает x10
+    @staticmethod
+    def _substitute(expression, values):
+        return Minimizing.LITERAL.sub(
+            lambda match: str(int(not values[match.group(2)]) if match.group(1) else values[match.group(2)]),
+            expression)
 
     #---------------------------------
 
@@ -219,7 +232,7 @@ class Minimizing:
                     unique_terms.append(term)
 
             print("\nТаблица соответствий после склейки:")
-            Minimizing.build_sdnf_table(terms, unique_terms)
+            Minimizing.build_sdnf_table(terms, unique_terms, variables)
 
             print("\n")
             term_expressions = [f"({Minimizing.term_to_expression_sdnf(term, variables)})" for term in
@@ -245,9 +258,11 @@ class Minimizing:
 
 #--------------------------------------------------------------------------------------------------------------------------------------------------
 
-    def build_sknf_table(expression_k, min_k):
+    def build_sknf_table(expression_k, min_k, variables=None):
+        names = Minimizing._variable_names(variables, len(expression_k[0]) if expression_k else 0)
+
         def term_to_str(term):
-            return [f"!{chr(97 + idx)}" if var == 0 else f"{chr(97 + idx)}" for idx, var in enumerate(term) if
+            return [f"!{names[idx]}" if var == 0 else f"{names[idx]}" for idx, var in enumerate(term) if
                     var != "X"]
 
         header_terms = [" | ".join(term_to_str(term)) for term in expression_k]
@@ -324,11 +339,7 @@ class Minimizing:
 
     @staticmethod
     def _evaluate_expression_k(expression, values):
-        for var, val in values.items():
-            expression = expression.replace(var, str(val))
-            expression = expression.replace(f"!{var}", str(int(not val)))
-
-        return eval(expression)
+        return eval(Minimizing._substitute(expression, values))
 
     @staticmethod
     def terms_sknf (expression):
@@ -462,7 +473,7 @@ class Minimizing:
                     unique_terms.append(term)
 
             print("\nТаблица соответствий после склейки:")
-            Minimizing.build_sknf_table(terms, unique_terms)
+            Minimizing.build_sknf_table(terms, unique_terms, variables)
 
             print("\n")
             term_expressions = [f"({Minimizing.term_to_expression_sknf(term, variables)})" for term in
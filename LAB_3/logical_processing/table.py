@@ -1,74 +1,50 @@
 import itertools
 
+from logical_processing.bit_table import BitSlicedTable
+from logical_processing.expression_compiler import ExpressionCompiler
+from logical_processing.expression_parser import ExpressionParser
 from logical_processing.expression_validator import ExpressionValidator
-from logical_processing.logic_evaluator import LogicEvaluator
-from logical_processing.rpn_converter import RPNConverter
 
 class TruthTableWithSubexpressions:
-    def __init__(self, expression):
+    BACKENDS = ("bits", "rows")
+
+    # bits - все строки сразу побитовыми операциями над столбцами
+    # (BitSlicedTable), rows - построчное вычисление. Выражение разбирается
+    # один раз в граф; подвыражения - его различные узлы-операторы, общие
+    # подвыражения хранятся и вычисляются один раз.
+    def __init__(self, expression, backend="bits"):
+        if backend not in TruthTableWithSubexpressions.BACKENDS:
+            raise ValueError(f"Неизвестный способ построения таблицы: {backend}")
         self.expression = expression
-        self.variables = sorted(ExpressionValidator.VARIABLES & set(expression))
-        self.converter = RPNConverter(expression)
+        self.backend = backend
+        self.tree = ExpressionParser(expression).parse()
+        self.variables = sorted((node.name for node in self.tree.postorder() if node.is_variable()),
+                                key=ExpressionValidator.natural_key)
         self.subexpressions = []
         self.subexpression_strs = []
+        self.evaluator = None
 
     def extract_subexpressions(self):
-        stack = []
-        rpn_expression = self.converter.to_rpn()
-
-        for token in rpn_expression:
-            if token in self.converter.variables:
-                stack.append([token])
-            elif token in self.converter.operators:
-                if token == '!':
-                    operand = stack.pop()
-                    subexpression = operand + [token]
-                else:
-                    operand2 = stack.pop()
-                    operand1 = stack.pop()
-                    subexpression = operand1 + operand2 + [token]
-
-                stack.append(subexpression)
-                self.subexpressions.append(subexpression)
-
-        for subexpr in self.subexpressions:
-            self.subexpression_strs.append(self.convert_to_string(subexpr))
-
-    def convert_to_string(self, rpn_expression):
-        stack = []
-        for token in rpn_expression:
-            if token in self.converter.variables:
-                stack.append(token)
-            elif token == '!':
-                operand = stack.pop()
-                stack.append(f"!{operand}")
-            elif token in {'&', '|', '->', '~'}:
-                operand2 = stack.pop()
-                operand1 = stack.pop()
-                if token == '&':
-                    stack.append(f"({operand1} & {operand2})")
-                elif token == '|':
-                    stack.append(f"({operand1} | {operand2})")
-                elif token == '->':
-                    stack.append(f"({operand1} -> {operand2})")
-                elif token == '~':
-                    stack.append(f"({operand1} ~ {operand2})")
-        return stack[0]
-
+        if self.subexpressions or self.tree.is_variable():
+            return
+        strings = self.tree.to_strings()
+        for node in self.tree.postorder():
+            if not node.is_variable():
+                self.subexpressions.append(node)
+                self.subexpression_strs.append(strings[node])
+
+    # Все подвыражения строки считает одна функция, скомпилированная из
+    # self.tree (см. ExpressionCompiler), вместо интерпретатора на каждое
+    # подвыражение
     def evaluate_subexpressions(self, variable_values):
-        evaluator = LogicEvaluator(self.converter.to_rpn())
-        results = []
-
-        for subexpression in self.subexpressions:
-            evaluator = LogicEvaluator(subexpression)
-            result = evaluator.evaluate(variable_values)
-            results.append(result)
-
-        final_result = evaluator.evaluate(variable_values)  # Финальное выражение
-        return results, final_result
+        if self.evaluator is None:
+            self.evaluator = ExpressionCompiler.compile_tree(self.tree)
+        return self.evaluator(variable_values)
 
     def generate_table(self):
         self.extract_subexpressions()
+        if self.backend == "bits":
+            return BitSlicedTable(self.tree, self.variables)
         table = []
 
         for values in itertools.product([False, True], repeat=len(self.variables)):
@@ -106,7 +82,10 @@ class TruthTableWithSubexpressions:
     def to_index_form(self):
         truth_table = self.generate_table()
 
-        binary_representation = "".join(str(int(final_result)) for _, _, final_result in truth_table)
+        if self.backend == "bits":
+            binary_representation = truth_table.binary()
+        else:
+            binary_representation = "".join(str(int(final_result)) for _, _, final_result in truth_table)
 
         decimal_value = int(binary_representation, 2)
 
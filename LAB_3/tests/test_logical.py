@@ -1,7 +1,13 @@
+import itertools
 import unittest
+from unittest.mock import patch
 
+from logical_processing.bit_table import BitSlicedTable
+from logical_processing.expression_compiler import ExpressionCompiler
+from logical_processing.expression_parser import ExpressionParser
 from logical_processing.logic_evaluator import LogicEvaluator
 from logical_processing.normal_forms import NormalForms
+from logical_processing.expression_error import ExpressionError
 from logical_processing.expression_validator import ExpressionValidator
 from logical_processing.table import TruthTableWithSubexpressions
 
@@ -19,8 +25,18 @@ class TestExpressionValidator(unittest.TestCase):
         self.assertEqual(str(context.exception), "Недопустимый символ: ?")
 
         with self.assertRaises(ValueError) as context:
-            ExpressionValidator.validate("x & y")
-        self.assertEqual(str(context.exception), "Недопустимый символ: x")
+            ExpressionValidator.validate("x & 1y")
+        self.assertEqual(str(context.exception), "Недопустимый символ: 1")
+
+    def test_identifiers(self):
+        self.assertIsNone(ExpressionValidator.validate("x & y"))
+        self.assertIsNone(ExpressionValidator.validate("(x17 -> clk_en) | !x2"))
+        self.assertEqual(ExpressionValidator.tokenize("!(x17->y)~ab"),
+                         ["!", "(", "x17", "->", "y", ")", "~", "ab"])
+        self.assertEqual(ExpressionValidator.variables("x10 & x2 | x1 & b | x2"), ["b", "x1", "x2", "x10"])
+        with self.assertRaises(ValueError) as context:
+            ExpressionValidator.validate("x1 x2")
+        self.assertEqual(str(context.exception), "Между переменными должен быть оператор")
 
     def test_consecutive_operators(self):
         with self.assertRaises(ValueError) as context:
@@ -67,6 +83,64 @@ class TestExpressionValidator(unittest.TestCase):
             ExpressionValidator.validate("a b")
         self.assertEqual(str(context.exception), "Между переменными должен быть оператор")
 
+class TestExpressionParser(unittest.TestCase):
+    def test_tree(self):
+        tree = ExpressionParser("!a & b | c -> d ~ !(e)").parse()
+        self.assertEqual(tree.rpn(), ["a", "!", "b", "&", "c", "|", "d", "->", "e", "!", "~"])
+        self.assertEqual(tree.to_string(), "((((!a & b) | c) -> d) ~ !e)")
+        self.assertEqual(tree.operator, "~")
+
+    def test_shared_subexpressions(self):
+        parser = ExpressionParser("(a & b) | !(a & b) -> (a&b)")
+        tree = parser.parse()
+        left, right = tree.operands
+        self.assertIs(left.operands[1].operands[0], left.operands[0])
+        self.assertIs(right, left.operands[0])
+        self.assertEqual(len(tree.postorder()), 6)
+        self.assertEqual(len(parser.nodes), 6)
+        self.assertEqual(tree.rpn(), ["a", "b", "&", "a", "b", "&", "!", "|", "a", "b", "&", "->"])
+        self.assertEqual(tree.to_string(), "(((a & b) | !(a & b)) -> (a & b))")
+
+        table = TruthTableWithSubexpressions("(a & b) | !(a & b) -> (a&b)")
+        table.extract_subexpressions()
+        self.assertEqual(table.subexpression_strs,
+                         ["(a & b)", "!(a & b)", "((a & b) | !(a & b))", "(((a & b) | !(a & b)) -> (a & b))"])
+        self.assertEqual(table.to_index_form()["binary"], "0001")
+        self.assertEqual(ExpressionCompiler.compile("(a & b) | !(a & b)").source.count("and"), 1)
+
+    def test_error_positions(self):
+        cases = [
+            ("a & | b", "Два оператора подряд недопустимы", 4),
+            ("(a & b", "Несбалансированные скобки", 0),
+            ("a & b)", "Несбалансированные скобки", 5),
+            ("a  x2", "Между переменными должен быть оператор", 3),
+            ("a & ", "Ожидался операнд", 3),
+            ("a (b)", "Ожидался оператор перед (", 2),
+            ("a ? b", "Недопустимый символ: ?", 2),
+        ]
+        for expression, message, position in cases:
+            with self.assertRaises(ExpressionError) as context:
+                ExpressionParser(expression).parse()
+            self.assertEqual((str(context.exception), context.exception.position), (message, position))
+            self.assertIsInstance(context.exception, ValueError)
+
+    def test_table_parses_once(self):
+        for backend in TruthTableWithSubexpressions.BACKENDS:
+            with patch.object(ExpressionParser, "parse", autospec=True, side_effect=ExpressionParser.parse) as parse:
+                table = TruthTableWithSubexpressions("a & (b | c) | x1", backend)
+                table.extract_subexpressions()
+                table.generate_table()
+                table.to_index_form()
+            self.assertEqual(parse.call_count, 1, backend)
+
+        table = TruthTableWithSubexpressions("a & (b | c)")
+        table.extract_subexpressions()
+        table.extract_subexpressions()
+        self.assertEqual(table.tree.rpn(), ["a", "b", "c", "|", "&"])
+        self.assertEqual([node.rpn() for node in table.subexpressions], [["b", "c", "|"], ["a", "b", "c", "|", "&"]])
+        self.assertEqual(table.subexpression_strs, ["(b | c)", "(a & (b | c))"])
+
+
 class TestLogicEvaluator(unittest.TestCase):
     def test_single_variable(self):
         evaluator = LogicEvaluator(["a"])
@@ -131,6 +205,68 @@ class TestLogicEvaluator(unittest.TestCase):
             evaluator.evaluate({"a": True})
 
 
+class TestExpressionCompiler(unittest.TestCase):
+    def test_matches_interpreter(self):
+        for expression in ["a", "!a", "a & b | c", "(a -> b) ~ !(c | d)", "!(a ~ b) -> (e & !c)"]:
+            table = TruthTableWithSubexpressions(expression)
+            table.extract_subexpressions()
+            evaluate = ExpressionCompiler.compile(expression)
+            for values in itertools.product([False, True], repeat=len(table.variables)):
+                values = dict(zip(table.variables, values))
+                expected = [LogicEvaluator(node.rpn()).evaluate(values) for node in table.subexpressions]
+                self.assertEqual(evaluate(values), (expected, LogicEvaluator(table.tree.rpn()).evaluate(values)))
+
+    def test_cache(self):
+        self.assertIs(ExpressionCompiler.compile("a & b"), ExpressionCompiler.compile(" a&b "))
+        self.assertIn("s0 = v0 and v1", ExpressionCompiler.compile("a & b").source)
+
+    def test_unknown_variable(self):
+        with self.assertRaises(KeyError):
+            ExpressionCompiler.compile("a & b")({"a": True})
+
+    def test_bits_mode(self):
+        evaluate = ExpressionCompiler.compile("!a | b", "bits")
+        self.assertEqual(evaluate({"a": 0b1100, "b": 0b1010}, 0b1111), ([0b0011, 0b1011], 0b1011))
+        with self.assertRaises(ValueError):
+            ExpressionCompiler.compile("a", "bytecode")
+
+
+class TestBitSlicedTable(unittest.TestCase):
+    def test_variable_columns(self):
+        self.assertEqual(BitSlicedTable.variable_column(0, 3), 0b11110000)
+        self.assertEqual(BitSlicedTable.variable_column(1, 3), 0b11001100)
+        self.assertEqual(BitSlicedTable.variable_column(2, 3), 0b10101010)
+
+    def test_matches_row_backend(self):
+        for expression in ["a", "!a & b", "(a -> b) ~ !(c | d)", "!(a ~ b) -> (e & !c)"]:
+            bits = TruthTableWithSubexpressions(expression).generate_table()
+            rows = TruthTableWithSubexpressions(expression, "rows").generate_table()
+            self.assertEqual(bits, rows)
+            self.assertEqual(len(bits), len(rows))
+            self.assertEqual(bits[-1], rows[-1])
+            self.assertEqual(bits[1:3], rows[1:3])
+
+    def test_binary(self):
+        table = BitSlicedTable(ExpressionParser("a->b").parse(), ["a", "b"])
+        self.assertEqual(table.binary(), "1101")
+        self.assertEqual(table.result, 0b1011)
+        with self.assertRaises(IndexError):
+            table[4]
+
+    def test_many_variables(self):
+        expression = " & ".join(f"x{index}" for index in range(1, 21))
+        table = TruthTableWithSubexpressions(expression)
+        self.assertEqual(table.variables[:3], ["x1", "x2", "x3"])
+        truth_table = table.generate_table()
+        self.assertEqual(len(truth_table), 1 << 20)
+        self.assertEqual(truth_table.result, 1 << ((1 << 20) - 1))
+        self.assertEqual(truth_table[-1][0]["x20"], True)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            TruthTableWithSubexpressions("a", "columns")
+
+
 class TestNormalForms(unittest.TestCase):
     def test_single_variable(self):
         variables = ["a"]
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from logical_processing.expression_validator import ExpressionValidator
 from logical_processing.min import Minimizing
 from logical_processing.KarnaughMinimizer import KarnaughMinimizer
@@ -151,6 +151,15 @@ class TestMinimizing(unittest.TestCase):
         expected = [[1, 1, 0], [0, 1, 1], [1, 0, 1]]
         self.assertEqual(result, expected)
 
+    def test_multi_character_variables(self):
+        variables = ["x1", "x2", "x10"]
+        self.assertEqual(Minimizing.terms_sdnf("(x1 & !x2 & x10) | (!x1 & x2 & x10)"), [[1, 0, 1], [0, 1, 1]])
+        self.assertEqual(Minimizing._evaluate_expression_d("(x1 & !x10) | (x2)", {"x1": 1, "x2": 0, "x10": 0}), 1)
+        self.assertEqual(Minimizing._evaluate_expression_k("(x1 | x10) & (!x2)", {"x1": 0, "x2": 0, "x10": 1}), 1)
+        with patch("sys.stdout"):
+            result = Minimizing.minimize_sdnf_second("(x1 & x2 & x10) | (x1 & !x2 & x10)", variables)
+        self.assertEqual(result, [[1, 'X', 1]])
+
 
 
     def test_minimize_sknf(self):